@@ -1,24 +1,25 @@
 """__init__.py: The Elite Cloud integration."""
 from __future__ import annotations
 
-from dataclasses import dataclass
+import time
+_IMPORT_START = time.perf_counter()
+
+import asyncio
 import logging
-import json
-from typing import Any
+
 import voluptuous as vol
 
 from homeassistant.config_entries import ConfigEntry, ConfigType
-from homeassistant.const import Platform
 from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE
-from homeassistant.core import HomeAssistant
-from homeassistant.core import callback
-from homeassistant.helpers import entity_registry as er
-from homeassistant.helpers import device_registry as dr
+from homeassistant.core import HomeAssistant, ServiceCall
 from homeassistant.helpers import config_validation as cv
-from homeassistant.helpers.translation import async_get_translations
+from homeassistant.helpers.service import async_register_admin_service
+from homeassistant.helpers.start import async_at_started
 
 from homeassistant.const import (
     CONF_USERNAME,
+    CONF_PASSWORD,
+    CONF_DEVICES,
 )
 from .coordinator import (
     EliteCloudCoordinatorFactory,
@@ -28,13 +29,44 @@ from .coordinator import (
 from .const import (
     DOMAIN,
     PLATFORMS,
+    CONF_METRICS_VIEW,
+    DEFAULT_METRICS_VIEW,
+    METRICS_VIEW,
+    SERVICE_PROFILE,
+    ATTR_SECONDS,
+    ATTR_TOP,
+    PROFILE_SECONDS_DEFAULT,
+    PROFILE_SECONDS_MAX,
+    PROFILE_TOP_DEFAULT,
+    PROFILE_TOP_MAX,
+)
+from .data import (
+    EliteCloudDeviceConfig,
+)
+from .metrics import (
+    EliteCloudMetricsView,
+)
+from .profiler import (
+    PROFILER,
 )
+from .store import (
+    EliteCloudDeviceStore,
+    EliteCloudTokenStore,
+)
+
+# Time spent importing this integration, reported in diagnostics
+_IMPORT_DURATION = time.perf_counter() - _IMPORT_START
 
 
 _LOGGER = logging.getLogger(__name__)
 
 CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
 
+PROFILE_SCHEMA = vol.Schema({
+    vol.Optional(ATTR_SECONDS, default=PROFILE_SECONDS_DEFAULT): vol.All(vol.Coerce(float), vol.Range(min=1, max=PROFILE_SECONDS_MAX)),
+    vol.Optional(ATTR_TOP, default=PROFILE_TOP_DEFAULT): vol.All(vol.Coerce(int), vol.Range(min=1, max=PROFILE_TOP_MAX)),
+})
+
 
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Set up the component."""
@@ -44,6 +76,12 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
             hass.config_entries.async_update_entry(
                 entry, unique_id=str(entry.unique_id)
             )
+
+    # Admin service to capture a profile of the push and setup paths without restarting HA
+    async def _async_profile(call: ServiceCall):
+        await PROFILER.async_profile(hass, call.data[ATTR_SECONDS], call.data[ATTR_TOP])
+
+    async_register_admin_service(hass, DOMAIN, SERVICE_PROFILE, _async_profile, schema=PROFILE_SCHEMA)
     return True
 
 
@@ -64,35 +102,107 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> b
     
     # Get an instance of the EliteCloudCoordinator for this profile
     # We force to create a fresh instance, otherwise data updates don't happen if this setup_entry was triggered by a reload
+    setup_start = time.perf_counter()
     coordinator: EliteCloudCoordinator = EliteCloudCoordinatorFactory.create(hass, config_entry, force_create=True)
-    
+
     # No need to fetch initial data; 
-    # we already have what we need from config_entry plus 
+    # we already have what we need from config_entry and the device store plus 
     # the stored data for each entity from the last HA run
+    await coordinator.async_load_devices()
+
+    coordinator.startup_begin(setup_start)
+    coordinator.record_startup("import", _IMPORT_DURATION)
+    coordinator.record_startup("coordinator", time.perf_counter() - setup_start)
     
     # Create devices
     await coordinator.async_create_devices(config_entry)
     
     # Create entities for all platforms (sensor, switch, ...)
-    await hass.config_entries.async_forward_entry_setups(config_entry, PLATFORMS)
+    # and subscribe to push data at the same time, so entities go live as soon as possible
+    async def _async_setup_platforms():
+        platforms_start = time.perf_counter()
+        await hass.config_entries.async_forward_entry_setups(config_entry, PLATFORMS)
+        coordinator.record_startup("platforms", time.perf_counter() - platforms_start)
+
+    await asyncio.gather(
+        _async_setup_platforms(),
+        coordinator.async_subscribe_to_push_data(),
+    )
 
-    # Cleanup entities and devices
-    await coordinator.async_cleanup_entities(config_entry)
-    await coordinator.async_cleanup_devices(config_entry)
+    # Periodic polls to detect added or removed sites, spread over all accounts
+    coordinator.start_polling()
 
-    await coordinator.async_subscribe_to_push_data()
+    # Optional metrics endpoint for external monitoring. Views cannot be removed, so it is registered once
+    # and only exports the accounts that have it enabled.
+    if config_entry.options.get(CONF_METRICS_VIEW, DEFAULT_METRICS_VIEW) and not hass.data[DOMAIN].get(METRICS_VIEW):
+        hass.http.register_view(EliteCloudMetricsView(hass))
+        hass.data[DOMAIN][METRICS_VIEW] = True
+
+    # Cleanup entities and devices is not needed for a working setup;
+    # defer it until Home Assistant has started and run it in the background
+    async def _async_cleanup(hass: HomeAssistant):
+        await coordinator.async_cleanup_entities(config_entry)
+        await coordinator.async_cleanup_devices(config_entry)
+
+    async def _async_started(hass: HomeAssistant):
+        config_entry.async_create_background_task(hass, _async_cleanup(hass), f"{DOMAIN} cleanup for account '{username}'")
+
+    config_entry.async_on_unload(async_at_started(hass, _async_started))
 
     # Reload entry when it is updated via config flow
     config_entry.async_on_unload(config_entry.add_update_listener(_async_update_listener))
 
+    # Teardown the coordinator and api when Home Assistant closes
+    async def _async_close(event):
+        await EliteCloudCoordinatorFactory.async_close(hass, config_entry)
+
+    config_entry.async_on_unload(hass.bus.async_listen_once(EVENT_HOMEASSISTANT_CLOSE, _async_close))
+
     return True
 
 
 async def async_unload_entry(hass: HomeAssistant, config_entry: ConfigEntry):
     success = await hass.config_entries.async_unload_platforms(config_entry, PLATFORMS)
+    
+    if success:
+        # Unsubscribe from push data, stop token renew and release the http client
+        await EliteCloudCoordinatorFactory.async_close(hass, config_entry)
+
     return success
 
 
+async def async_remove_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> None:
+    """Cleanup stored data when the config entry is removed."""
+    
+    username: str = config_entry.data[CONF_USERNAME]
+    password: str = config_entry.data[CONF_PASSWORD]
+
+    _LOGGER.info(f"Remove stored tokens and devices for account '{username}'")
+    await EliteCloudTokenStore(hass, username, password).async_remove()
+    await EliteCloudDeviceStore(hass, username).async_remove()
+
+
+async def async_migrate_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> bool:
+    """Migrate an older config entry."""
+
+    username: str = config_entry.data[CONF_USERNAME]
+
+    if config_entry.version == 1:
+        # Move the devices and their resources out of the options into the device store; 
+        # the options only keep references to the sites
+        _LOGGER.info(f"Migrate config entry for account '{username}' to version 2")
+
+        devices = [ EliteCloudDeviceConfig.from_dict(d) for d in config_entry.options.get(CONF_DEVICES, []) ]
+        await EliteCloudDeviceStore(hass, username).async_save({ d.uuid: d.to_dict() for d in devices }, delay=False)
+
+        options = dict(config_entry.options)
+        options[CONF_DEVICES] = [ d.uuid for d in devices ]
+
+        hass.config_entries.async_update_entry(config_entry, options=options, version=2)
+
+    return True
+
+
 async def _async_update_listener(hass: HomeAssistant, config_entry: ConfigEntry) -> None:
     """Fired after update of Config Options."""
 
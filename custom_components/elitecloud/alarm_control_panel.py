@@ -1,42 +1,18 @@
-import asyncio
 import logging
-import math
 from typing import Any
-import voluptuous as vol
 
-from homeassistant import config_entries
-from homeassistant import exceptions
 from homeassistant.components.alarm_control_panel import AlarmControlPanelEntity
 from homeassistant.components.alarm_control_panel import AlarmControlPanelEntityFeature
 from homeassistant.components.alarm_control_panel import AlarmControlPanelState
 from homeassistant.components.alarm_control_panel import CodeFormat
 from homeassistant.components.alarm_control_panel import ENTITY_ID_FORMAT
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_NAME
-from homeassistant.const import CONF_UNIQUE_ID
-from homeassistant.const import EntityCategory
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.core import callback
-from homeassistant.exceptions import HomeAssistantError
-from homeassistant.exceptions import IntegrationError
-from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.entity_registry import async_get
-from homeassistant.helpers.event import async_track_time_interval
-from homeassistant.helpers.restore_state import RestoreEntity
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from datetime import datetime
-from datetime import timezone
-from datetime import timedelta
-
-from collections import defaultdict
-from collections import namedtuple
-
-from .const import (
-    utcnow,
-)
 from .coordinator import (
     EliteCloudCoordinator,
 )
@@ -44,7 +20,7 @@ from .data import (
     EliteCloudDatapoint,
     EliteCloudDeviceConfig,
     EliteCloudDeviceResource,
-    EliteCloudDeviceStatus,
+    EliteCloudValueMap,
 )
 from .entity import (
     EliteCloudEntity,
@@ -84,6 +60,9 @@ class EliteCloudAlarm(CoordinatorEntity, AlarmControlPanelEntity, EliteCloudEnti
         self._attr_code_format = CodeFormat.NUMBER
         self._attr_supported_features = AlarmControlPanelEntityFeature.ARM_HOME | AlarmControlPanelEntityFeature.ARM_AWAY
 
+        # Compiled lookup of data values to Home Assistant states
+        self._value_map = EliteCloudValueMap.for_datapoint(datapoint.pf, datapoint.sec, AlarmControlPanelState)
+
         # Create all value related attributes (but with unknown value).
         # After this constructor ends, base class EliteCloudEntity.async_added_to_hass() will 
         # set the value using the restored value from the last HA run. Or otherwise it will
@@ -98,30 +77,24 @@ class EliteCloudAlarm(CoordinatorEntity, AlarmControlPanelEntity, EliteCloudEnti
         """
 
         # find the correct device corresponding to this sensor
-        data:dict[str, EliteCloudDeviceStatus] = self._coordinator.data
-        status = data.get(self._device.uuid) if data is not None else None
-        value = status.get(self._datapoint.key) if status is not None else None
+        value, decoded = self._get_status_value()
 
         # Update value related attributes
-        if self._update_value(value):
+        if self._update_value(value, decoded=decoded):
             self.async_write_ha_state()
     
     
-    def _update_value(self, data_value: Any, force:bool=False) -> bool:
+    def _update_value(self, data_value: Any, force:bool=False, decoded: Any=None) -> bool:
         """
         Set entity value, unit and icon
         """
-        changed = super()._update_value(data_value, force)
+        changed = super()._update_value(data_value, force, decoded)
 
         # Convert from EliteCloud data value to Home Assistant attributes
-        match data_value:
-            case "" | "disarmed" | "stay disarmed": state = AlarmControlPanelState.DISARMED
-            case "arming":                          state = AlarmControlPanelState.ARMING
-            case "armed":                           state = AlarmControlPanelState.ARMED_AWAY
-            case "staying":                         state = AlarmControlPanelState.ARMING
-            case "stay armed":                      state = AlarmControlPanelState.ARMED_HOME
-            case "disarming":                       state = AlarmControlPanelState.DISARMING
-            case _:                                 state = None
+        state = self._value_map.get(self._data_decoded)
+
+        # Keep showing the expected state while a command awaits confirmation
+        state = self._optimistic_apply(state)
 
         # Update Home Assistant attributes
         if force or self._attr_alarm_state != state:
@@ -134,19 +107,39 @@ class EliteCloudAlarm(CoordinatorEntity, AlarmControlPanelEntity, EliteCloudEnti
     async def async_alarm_disarm(self, code: str | None = None) -> None:
         match self._data_value:
             case "arming" | "armed":
-                await self._coordinator.async_toggle_arm(self._device, self._datapoint, code)
+                await self._async_command_optimistic(
+                    command = "disarm",
+                    state = AlarmControlPanelState.DISARMING,
+                    confirm = {AlarmControlPanelState.DISARMING, AlarmControlPanelState.DISARMED},
+                    async_send = lambda: self._coordinator.async_toggle_arm(self._device, self._datapoint, code),
+                )
 
             case "staying" | "stay armed":
-                await self._coordinator.async_toggle_stay(self._device, self._datapoint, code)
+                await self._async_command_optimistic(
+                    command = "disarm",
+                    state = AlarmControlPanelState.DISARMING,
+                    confirm = {AlarmControlPanelState.DISARMING, AlarmControlPanelState.DISARMED},
+                    async_send = lambda: self._coordinator.async_toggle_stay(self._device, self._datapoint, code),
+                )
 
 
     async def async_alarm_arm_home(self, code: str | None = None) -> None:
         match self._data_value:
             case "" | "disarmed" | "stay disarmed":
-                await self._coordinator.async_toggle_stay(self._device, self._datapoint, code)
+                await self._async_command_optimistic(
+                    command = "arm_home",
+                    state = AlarmControlPanelState.ARMING,
+                    confirm = {AlarmControlPanelState.ARMING, AlarmControlPanelState.ARMED_HOME},
+                    async_send = lambda: self._coordinator.async_toggle_stay(self._device, self._datapoint, code),
+                )
 
 
     async def async_alarm_arm_away(self, code: str | None = None) -> None:
         match self._data_value:
             case "" | "disarmed" | "stay disarmed":
-                await self._coordinator.async_toggle_arm(self._device, self._datapoint, code)
+                await self._async_command_optimistic(
+                    command = "arm_away",
+                    state = AlarmControlPanelState.ARMING,
+                    confirm = {AlarmControlPanelState.ARMING, AlarmControlPanelState.ARMED_AWAY},
+                    async_send = lambda: self._coordinator.async_toggle_arm(self._device, self._datapoint, code),
+                )
@@ -1,49 +1,105 @@
 """api.py: API for Elite Cloud integration."""
 
 import asyncio
+import heapq
+import itertools
+import random
+import time
 from collections import defaultdict
 from dataclasses import asdict
 from datetime import datetime, timedelta
-from enum import Enum
-from typing import Any, Final
-from custom_components.elitecloud.data import EliteCloudDeviceConfig
+from contextvars import ContextVar
+from enum import Enum, IntEnum
+from importlib.util import find_spec
+from typing import Any
 import httpx
+import json
 import logging
 
 from homeassistant.core import callback
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.event import async_track_time_interval
 from homeassistant.helpers.httpx_client import create_async_httpx_client
+from homeassistant.util.ssl import get_default_context
 
+# EliteCloudApiWrap hooks into internals of the pyelitecloud api (login finalize, subscribe, http requests and websocket).
+# Keep the exact version pinned in manifest.json and re-check these hooks when upgrading it.
 from pyelitecloud import (
     AsyncEliteCloudApi,
     EliteCloudApiFlag,
+    LoginMethod,
     EliteCloudCmdSection,
     EliteCloudCmdAction,
     EliteCloudSite,
     EliteCloudStatusType,
     EliteCloudConnectError,
     EliteCloudAuthError,
+    EliteCloudDataError,
 ) 
+from pyelitecloud.const import ACCESS_TOKEN_EXPIRE_MARGIN
 
 from .const import (
     DOMAIN,
     API,
+    API_CLOSE_TIMEOUT,
+    API_CIRCUIT_FAILURE_THRESHOLD,
+    API_CIRCUIT_RESET_TIMEOUT,
     API_RETRY_ATTEMPTS,
     API_RETRY_DELAY,
-    STORE_KEY_CACHE,
-    STORE_WRITE_PERIOD_CACHE,
+    API_RETRY_JITTER,
+    API_RATE_LIMIT,
+    API_RATE_BURST,
+    COMMAND_PIPELINE_WINDOW,
+    COMMAND_PIPELINE_CONCURRENCY,
+    DECODE_EXECUTOR_MIN_SITES,
+    METRICS_ENDPOINTS,
+    HTTP_CLIENT,
+    HTTP_KEEPALIVE_EXPIRY,
+    HTTP_MAX_CONNECTIONS,
+    HTTP_MAX_KEEPALIVE_CONNECTIONS,
+    POLL_SITE_SPACING,
+    PUSH_LOW_BATCH,
+    PUSH_SECTIONS_HIGH,
+    PUSH_RESYNC_TIMEOUT,
+    PUSH_WATCHDOG_INTERVAL,
+    SECTIONS,
     utcnow,
     utcmin,
 )
 from .data import (
+    EliteCloudBatchDecoder,
     EliteCloudDatapoint,
     EliteCloudDeviceConfig,
     EliteCloudDeviceStatus,
 )
+from .metrics import (
+    EliteCloudPrometheusWriter,
+    EliteCloudRequestMetrics,
+)
+from .profiler import (
+    PROFILER,
+)
+from .store import (
+    EliteCloudTokenStore,
+)
 
 # Define logger
 _LOGGER = logging.getLogger(__name__)
 
+
+class EliteCloudRequestPriority(IntEnum):
+    """Priority classes for requests to the remote servers; lower value goes first"""
+    COMMAND = 0
+    STATUS = 1
+    DISCOVERY = 2
+
+
+# Priority and site of the cloud call that is currently being made; inherited by the http requests it does
+_REQUEST_CONTEXT: ContextVar[tuple[EliteCloudRequestPriority, str]] = ContextVar("elitecloud_request_context", default=(EliteCloudRequestPriority.STATUS, ""))
+
+# Bytes received for the http request that is currently being made; filled in by the http client pool
+_RESPONSE_BYTES: ContextVar[list[int] | None] = ContextVar("elitecloud_response_bytes", default=None)
+
 class EliteCloudApiFactory:
     
     @staticmethod
@@ -109,12 +165,594 @@ class EliteCloudApiFactory:
         try:
             if api.is_temp and not api.closed:
                 _LOGGER.debug("close temp Api")
-                await api.close()
+                await api.async_close()
 
         except Exception as ex:
             _LOGGER.debug("Exception while closing temp Api: {ex}")
 
 
+    @staticmethod
+    async def async_close(hass: HomeAssistant, api: 'EliteCloudApiWrap'):
+        """
+        Close a previously created EliteCloudApi and forget about it
+        """
+        # Drop it from the stored instances so a next create will not reuse it
+        apis = hass.data.get(DOMAIN, {}).get(API, {})
+        for key in [k for k,v in apis.items() if v is api]:
+            apis.pop(key, None)
+
+        try:
+            if not api.closed:
+                _LOGGER.debug(f"close Api for account '{api.username}'")
+                await api.async_close()
+
+        except Exception as ex:
+            _LOGGER.debug(f"Exception while closing Api: {ex}")
+
+
+class EliteCloudClientFactory:
+    """
+    Factory for the http client that is shared by all EliteCloudApiWrap instances.
+    Sharing one pooled client means warm (TLS) connections are reused across accounts, 
+    config flows and reloads.
+    """
+
+    @staticmethod
+    def acquire(hass: HomeAssistant) -> httpx.AsyncClient:
+        """
+        Get the shared http client, create it if it does not yet exist
+        """
+        # Sanity check
+        if not DOMAIN in hass.data:
+            hass.data[DOMAIN] = {}
+
+        pool: EliteCloudClientPool = hass.data[DOMAIN].get(HTTP_CLIENT, None)
+        if pool is None or pool.client.is_closed:
+            pool = EliteCloudClientPool(hass)
+            hass.data[DOMAIN][HTTP_CLIENT] = pool
+
+        pool.users += 1
+        return pool.client
+
+
+    @staticmethod
+    def release(hass: HomeAssistant, client: httpx.AsyncClient):
+        """
+        Stop using the shared http client. 
+        The client itself stays open so its connections can be reused; Home Assistant closes it on shutdown.
+        """
+        pool: EliteCloudClientPool = hass.data.get(DOMAIN, {}).get(HTTP_CLIENT, None)
+        if pool is not None and pool.client is client:
+            pool.users = max(pool.users-1, 0)
+
+
+    @staticmethod
+    def get_diagnostics(hass: HomeAssistant) -> dict[str, Any]:
+        pool: EliteCloudClientPool = hass.data.get(DOMAIN, {}).get(HTTP_CLIENT, None)
+        return pool.get_diagnostics() if pool is not None else {}
+
+
+class EliteCloudClientPool:
+    """Shared http client with a tuned connection pool and per-host statistics"""
+
+    def __init__(self, hass: HomeAssistant):
+
+        # HTTP/2 multiplexing is only possible when the optional h2 package is installed
+        self.http2: bool = find_spec("h2") is not None
+
+        # Explicit transport; httpx keeps a separate set of connections for each host
+        transport = httpx.AsyncHTTPTransport(
+            verify = get_default_context(),
+            http2 = self.http2,
+            limits = httpx.Limits(
+                max_connections = HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections = HTTP_MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry = HTTP_KEEPALIVE_EXPIRY,
+            ),
+        )
+        self.client: httpx.AsyncClient = create_async_httpx_client(
+            hass, 
+            transport = transport,
+            event_hooks = { "request": [self._async_on_request], "response": [self._async_on_response] },
+        )
+        self.users: int = 0
+        self._requests: dict[str,int] = defaultdict(int)
+        self._responses: dict[str, dict[str,int]] = defaultdict(lambda: defaultdict(int))
+
+
+    async def _async_on_request(self, request: httpx.Request):
+        self._requests[request.url.host] += 1
+
+
+    async def _async_on_response(self, response: httpx.Response):
+        # Protocol the response came in with, i.e. HTTP/1.1 or HTTP/2
+        self._responses[response.request.url.host][response.http_version] += 1
+
+        # Only when the account of the request wants to know the size of the response
+        counter = _RESPONSE_BYTES.get()
+        if counter is not None:
+            await response.aread()
+            counter[0] += len(response.content)
+
+
+    def get_diagnostics(self) -> dict[str, Any]:
+        """
+        Statistics of the connection pool per host, as seen by the request and response hooks
+        """
+        hosts: dict[str, dict[str,Any]] = defaultdict(dict)
+        for host,count in self._requests.items():
+            hosts[host]["requests"] = count
+        for host,versions in self._responses.items():
+            hosts[host].update(versions)
+
+        return {
+            "http2": self.http2,
+            "users": self.users,
+            "limits": {
+                "max_connections": HTTP_MAX_CONNECTIONS,
+                "max_keepalive_connections": HTTP_MAX_KEEPALIVE_CONNECTIONS,
+                "keepalive_expiry": HTTP_KEEPALIVE_EXPIRY,
+            },
+            "hosts": { host: dict(stats) for host,stats in hosts.items() },
+        }
+
+
+class EliteCloudCircuitOpenError(EliteCloudConnectError):
+    """Exception to indicate that calls fail fast because the remote servers are unavailable."""
+
+
+class EliteCloudCircuitState(Enum):
+    CLOSED = "closed"           # Normal operation
+    OPEN = "open"               # Fail fast
+    HALF_OPEN = "half_open"     # Let a single trial call through
+
+
+class EliteCloudCircuitBreaker:
+    """
+    Per account circuit breaker. After a number of consecutive connection failures all calls 
+    fail fast, until the reset timeout passes and a trial call succeeds.
+    """
+
+    def __init__(self, failure_threshold: int = API_CIRCUIT_FAILURE_THRESHOLD, reset_timeout: float = API_CIRCUIT_RESET_TIMEOUT):
+        self._failure_threshold = failure_threshold
+        self._reset_timeout = reset_timeout
+
+        self._state: EliteCloudCircuitState = EliteCloudCircuitState.CLOSED
+        self._failures: int = 0
+        self._opened_at: datetime = utcmin()
+        self._trial_active: bool = False
+        self._open_count: int = 0
+
+
+    @property
+    def state(self) -> EliteCloudCircuitState:
+        return self._state
+
+
+    def before_call(self):
+        """
+        Raises EliteCloudCircuitOpenError if the call is not allowed
+        """
+        if self._state == EliteCloudCircuitState.OPEN:
+            if utcnow() < self._opened_at + timedelta(seconds=self._reset_timeout):
+                raise EliteCloudCircuitOpenError(f"Elite Cloud servers unavailable; not trying again before {(self._opened_at + timedelta(seconds=self._reset_timeout)).astimezone()}")
+            
+            self._state = EliteCloudCircuitState.HALF_OPEN
+            self._trial_active = False
+
+        if self._state == EliteCloudCircuitState.HALF_OPEN:
+            if self._trial_active:
+                raise EliteCloudCircuitOpenError(f"Elite Cloud servers unavailable; waiting for result of trial call")
+            
+            self._trial_active = True
+
+
+    def on_success(self):
+        if self._state != EliteCloudCircuitState.CLOSED:
+            _LOGGER.info(f"Elite Cloud servers are reachable again")
+
+        self._state = EliteCloudCircuitState.CLOSED
+        self._failures = 0
+        self._trial_active = False
+
+
+    def on_ignored(self):
+        self._trial_active = False
+
+
+    def on_failure(self):
+        self._failures += 1
+        self._trial_active = False
+
+        if self._state == EliteCloudCircuitState.HALF_OPEN or self._failures >= self._failure_threshold:
+            if self._state != EliteCloudCircuitState.OPEN:
+                _LOGGER.warning(f"Elite Cloud servers unavailable; pausing requests for {self._reset_timeout} seconds")
+                self._open_count += 1
+
+            self._state = EliteCloudCircuitState.OPEN
+            self._opened_at = utcnow()
+
+
+    def get_diagnostics(self) -> dict[str, Any]:
+        return {
+            "state": self._state.value,
+            "failures": self._failures,
+            "opened_at": self._opened_at,
+            "open_count": self._open_count,
+        }
+
+
+class EliteCloudRequestScheduler:
+    """
+    Per account scheduler for requests to the remote servers.
+
+    A token bucket limits the request rate. When requests need to wait, they are released in
+    order of priority class and, within a class, round robin across sites so one site with 
+    many requests cannot starve the others.
+    """
+
+    def __init__(self, hass: HomeAssistant, rate: float = API_RATE_LIMIT, burst: int = API_RATE_BURST):
+        self._hass = hass
+        self._rate = rate
+        self._burst = burst
+
+        # Token bucket
+        self._tokens: float = burst
+        self._updated: float = time.monotonic()
+
+        # Waiting requests as heap of (priority, site turn, sequence, future)
+        self._waiters: list[tuple[int, int, int, asyncio.Future]] = []
+        self._sequence = itertools.count()
+        self._site_turns: dict[tuple[int,str], int] = {}
+        self._priority_turns: dict[int, int] = defaultdict(int)
+        self._dispatcher: asyncio.Task | None = None
+
+        # For diagnostics
+        self._granted: dict[str, int] = defaultdict(int)
+        self._waited: dict[str, int] = defaultdict(int)
+        self._wait_time: dict[str, float] = defaultdict(float)
+
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self._burst, self._tokens + (now - self._updated) * self._rate)
+        self._updated = now
+
+
+    async def async_acquire(self, priority: EliteCloudRequestPriority, site_uuid: str):
+        """
+        Wait until a request of the given priority for the given site may be sent
+        """
+        self._granted[priority.name] += 1
+
+        # Fast path; nobody waiting and a token available
+        self._refill()
+        if not self._waiters and self._tokens >= 1:
+            self._tokens -= 1
+            return
+        
+        # Sites take turns within a priority class; a site that has been quiet starts at the current turn
+        key = (priority, site_uuid)
+        turn = max(self._site_turns.get(key, 0), self._priority_turns[priority])
+        self._site_turns[key] = turn + 1
+
+        future = self._hass.loop.create_future()
+        heapq.heappush(self._waiters, (priority, turn, next(self._sequence), future))
+
+        if self._dispatcher is None:
+            self._dispatcher = self._hass.async_create_background_task(self._async_dispatch(), "elitecloud_request_scheduler")
+
+        start = time.monotonic()
+        await future
+
+        self._waited[priority.name] += 1
+        self._wait_time[priority.name] += time.monotonic() - start
+
+
+    async def _async_dispatch(self):
+        """
+        Release waiting requests as tokens become available
+        """
+        try:
+            while self._waiters:
+                self._refill()
+                if self._tokens < 1:
+                    await asyncio.sleep((1 - self._tokens) / self._rate)
+                    continue
+
+                priority, turn, _, future = heapq.heappop(self._waiters)
+                if future.done():
+                    continue    # cancelled by the caller
+
+                self._tokens -= 1
+                self._priority_turns[priority] = turn
+                future.set_result(None)
+        finally:
+            # Nobody waiting anymore; restart taking turns from scratch
+            self._site_turns.clear()
+            self._priority_turns.clear()
+            self._dispatcher = None
+
+
+    def close(self):
+        if self._dispatcher is not None:
+            self._dispatcher.cancel()
+
+        for _,_,_,future in self._waiters:
+            future.cancel()
+        self._waiters.clear()
+
+
+    def get_diagnostics(self) -> dict[str, Any]:
+        return {
+            "rate": self._rate,
+            "burst": self._burst,
+            "tokens": round(self._tokens, 2),
+            "waiting": { p.name: sum(1 for w in self._waiters if w[0]==p) for p in EliteCloudRequestPriority },
+            "granted": dict(self._granted),
+            "waited": dict(self._waited),
+            "wait_time_avg": { k: round(v / self._waited[k], 3) for k,v in self._wait_time.items() if self._waited[k] },
+        }
+
+
+class EliteCloudCommandPipeline:
+    """
+    Per site pipeline for toggle commands to inputs and outputs.
+
+    Commands are collected during a short window and then sent with bounded concurrency.
+    Two toggles for the same input or output within the window cancel each other out, so neither is sent.
+    Each caller waits for the outcome of its own command; the toggles that were cancelled out return False.
+    """
+
+    def __init__(self, hass: HomeAssistant, async_send, window: float = COMMAND_PIPELINE_WINDOW, concurrency: int = COMMAND_PIPELINE_CONCURRENCY):
+        self._hass = hass
+        self._async_send = async_send
+        self._window = window
+        self._semaphore = asyncio.Semaphore(concurrency)
+
+        # Commands waiting for the window to end; (section, id) -> futures of the callers
+        self._pending: dict[tuple[EliteCloudCmdSection, int], list[asyncio.Future]] = {}
+        self._flush_task: asyncio.Task | None = None
+
+        # For diagnostics
+        self.submitted: int = 0
+        self.sent: int = 0
+        self.cancelled: int = 0
+
+
+    async def async_submit(self, section: EliteCloudCmdSection, id: int) -> bool:
+        """
+        Queue a toggle command. 
+        Returns True when it was sent, or False when it was cancelled out by an opposing toggle.
+        Raises the exception of the send if that failed.
+        """
+        self.submitted += 1
+
+        future = self._hass.loop.create_future()
+        self._pending.setdefault((section, id), []).append(future)
+
+        if self._flush_task is None:
+            self._flush_task = self._hass.async_create_background_task(self._async_flush(), "elitecloud_command_pipeline")
+
+        return await future
+
+
+    async def _async_flush(self):
+        """
+        Wait for the window to end, then send the collected commands
+        """
+        await asyncio.sleep(self._window)
+
+        pending = self._pending
+        self._pending = {}
+        self._flush_task = None
+
+        tasks = []
+        for (section, id), futures in pending.items():
+            if len(futures) % 2 == 0:
+                # Toggles cancel each other out; nothing to send
+                self.cancelled += len(futures)
+                for future in futures:
+                    if not future.done():
+                        future.set_result(False)
+            else:
+                tasks.append( self._async_send_one(section, id, futures) )
+
+        await asyncio.gather(*tasks)
+
+
+    async def _async_send_one(self, section: EliteCloudCmdSection, id: int, futures: list[asyncio.Future]):
+        """
+        Send a single toggle and resolve the futures of all callers that asked for it.
+        The toggle goes out for the most recent caller; the earlier ones cancel each other out.
+        """
+        self.cancelled += len(futures) - 1
+
+        async with self._semaphore:
+            try:
+                await self._async_send(section, id)
+                self.sent += 1
+                result, error = True, None
+
+            except Exception as ex:
+                result, error = None, ex
+
+        for idx,future in enumerate(futures):
+            if future.done():
+                continue
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(result if idx == len(futures)-1 else False)
+
+
+    def close(self):
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            self._flush_task = None
+
+        for futures in self._pending.values():
+            for future in futures:
+                future.cancel()
+        self._pending.clear()
+
+
+    def get_diagnostics(self) -> dict[str, Any]:
+        return {
+            "submitted": self.submitted,
+            "sent": self.sent,
+            "cancelled": self.cancelled,
+        }
+
+
+class EliteCloudPushQueue:
+    """
+    Queue of sites with pushed status changes, in two priority lanes.
+
+    Alarm-critical sections (full status, area, tamper and system) go into the high lane, inputs and outputs into the low lane.
+    The status of a site is always decoded as a whole, so a lane holds at most one entry per site
+    and a push for a site that is already queued is merged into that entry. This keeps the queue bounded by the number of sites.
+    The high lane is emptied first. The low lane is processed in batches, yielding to the high lane between sites.
+    """
+
+    def __init__(self, hass: HomeAssistant, async_process, async_dispatch, batch: int = PUSH_LOW_BATCH):
+        self._hass = hass
+        self._async_process = async_process
+        self._async_dispatch = async_dispatch
+        self._batch = batch
+
+        # Queued sites per lane; site uuid -> pushed sections
+        self._high: dict[str, set[str]] = {}
+        self._low: dict[str, set[str]] = {}
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task | None = None
+
+        # For diagnostics
+        self.queued: int = 0
+        self.merged: int = 0
+        self.processed: int = 0
+        self.dispatched: int = 0
+        self.max_backlog: int = 0
+
+
+    def put(self, site_uuid: str, section: str):
+        """
+        Queue a pushed change of a section of a site
+        """
+        self.queued += 1
+
+        if section in PUSH_SECTIONS_HIGH or site_uuid in self._high:
+            # Any low priority changes for this site are handled together with this one
+            sections = self._low.pop(site_uuid, set())
+            lane = self._high
+        else:
+            sections = set()
+            lane = self._low
+
+        if site_uuid in lane or sections:
+            self.merged += 1
+
+        lane.setdefault(site_uuid, set()).update(sections | {section})
+        self.max_backlog = max(self.max_backlog, len(self._high) + len(self._low))
+
+        if self._task is None or self._task.done():
+            self._task = self._hass.async_create_background_task(self._async_run(), "elitecloud_push_queue")
+        self._wakeup.set()
+
+
+    async def _async_run(self):
+        """
+        Process queued sites, high lane first
+        """
+        while True:
+            await self._wakeup.wait()
+            self._wakeup.clear()
+
+            while self._high or self._low:
+                if self._high:
+                    batch = self._high
+                    self._high = {}
+                    for site_uuid,sections in batch.items():
+                        await self._async_process_one(site_uuid, sections)
+                else:
+                    count = 0
+                    while self._low and not self._high and count < self._batch:
+                        site_uuid = next(iter(self._low))
+                        sections = self._low.pop(site_uuid)
+                        await self._async_process_one(site_uuid, sections)
+                        count += 1
+
+                        # Let the response handler queue new pushes, so a high priority one can go first
+                        await asyncio.sleep(0)
+
+                await self._async_dispatch_one()
+
+
+    async def _async_process_one(self, site_uuid: str, sections: set[str]):
+        try:
+            await self._async_process(site_uuid, sections)
+            self.processed += 1
+
+        except Exception as ex:
+            _LOGGER.info(f"Failed to process status of site {site_uuid}: {ex}")
+
+
+    async def _async_dispatch_one(self):
+        try:
+            await self._async_dispatch()
+            self.dispatched += 1
+
+        except Exception as ex:
+            _LOGGER.warning(f"Failed to dispatch pushed status changes: {ex}")
+
+
+    def close(self):
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+        self._high.clear()
+        self._low.clear()
+
+
+    @property
+    def backlog(self) -> int:
+        return len(self._high) + len(self._low)
+
+
+    def get_diagnostics(self) -> dict[str, Any]:
+        return {
+            "queued": self.queued,
+            "merged": self.merged,
+            "processed": self.processed,
+            "dispatched": self.dispatched,
+            "max_backlog": self.max_backlog,
+            "backlog_high": len(self._high),
+            "backlog_low": len(self._low),
+        }
+
+
+class EliteCloudResponseQueue(asyncio.Queue):
+    """
+    Response queue for the websocket client. 
+    Lets us see each response at the moment the response handler of the super class takes it from the queue.
+    """
+
+    def __init__(self, on_response):
+        super().__init__()
+        self._on_response = on_response
+
+
+    def get_nowait(self):
+        response = super().get_nowait()
+        try:
+            self._on_response(response)
+        except Exception as ex:
+            _LOGGER.debug(f"Could not inspect websocket response: {ex}")
+
+        return response
+
+
 class EliteCloudApiWrap(AsyncEliteCloudApi):
     """Wrapper around AsyncEliteCloudApi class"""
 
@@ -126,8 +764,9 @@ class EliteCloudApiWrap(AsyncEliteCloudApi):
         self._password = password
         self.is_temp = is_temp
 
-        # Create a fresh http client
-        client: httpx.AsyncClient = create_async_httpx_client(hass) 
+        # Use the http client that is shared between all accounts
+        client: httpx.AsyncClient = EliteCloudClientFactory.acquire(hass)
+        self._closed: bool = False
         
         # Initialize the actual api
         flags = {
@@ -141,12 +780,80 @@ class EliteCloudApiWrap(AsyncEliteCloudApi):
         self.devices: dict[str,EliteCloudDeviceConfig] = {}
         self.status: dict[str, EliteCloudDeviceStatus] = {}
 
+        # Sections to decode and sections read by their datapoints; None for all sections
+        self._sections: frozenset[str] | None = None
+        self._sections_read: frozenset[str] | None = None
+
         # Coordinator listener to report back any changes in the data
         self._async_data_listener = None
 
+        # Fingerprint of the last processed payload per site and section, to drop duplicate pushes.
+        self._push_fingerprints: dict[str, dict[str, int]] = defaultdict(dict)
+        self._push_duplicates: int = 0
+
+        # Pushes received per section, moment of the last push and time spent decoding them
+        self._push_counts: dict[str, int] = defaultdict(int)
+        self._push_last: float | None = None
+        self._decode_time: float = 0.0
+        self._decode_count: int = 0
+
+        # Pushed changes are decoded and dispatched in priority order
+        self._push_queue = EliteCloudPushQueue(hass, self._async_process_site_status, self._async_dispatch_site_status)
+
+        # Resync of site statuses after the push channel was re-connected.
+        # A login or token renew re-subscribes all sites itself, so the connect that follows it needs no resync.
+        self._ws_client._response_queue = EliteCloudResponseQueue(self._on_push_response)
+        self._push_connects: int = 0
+        self._push_resubscribed: bool = False
+        self._push_received: dict[str, asyncio.Event] = {}
+        self._push_watchdog_unsub = None
+        self._resync_task: asyncio.Task | None = None
+        self._resync_count: int = 0
+        self._resync_last: dict[str, Any] = {}
+
+        # Login tokens that survive a restart of HA
+        self._token_store = EliteCloudTokenStore(hass, username, password)
+        self._token_restore_done: bool = False
+        self._token_resume_session: bool = False
+
+        # Fail fast while the remote servers are unavailable
+        self._circuit_breaker = EliteCloudCircuitBreaker()
+
+        # Stay within rate limits and let commands go before status refreshes and discovery
+        self._scheduler = EliteCloudRequestScheduler(hass)
+
+        # Per site pipeline for toggle commands
+        self._pipelines: dict[str, EliteCloudCommandPipeline] = {}
+
+        # Accounting of the calls to the remote servers
+        self._metrics = EliteCloudRequestMetrics()
+        self._subscribe_sent: dict[str, float] = {}
+
         # For diagnostics
         self._diag_values = defaultdict(set)
         self._warned_status_values = set()
+        self._token_reuse_count: int = 0
+
+
+    @property
+    def username(self) -> str:
+        return self._username
+
+    @property
+    def closed(self) -> bool:
+        return self._closed or super().closed
+
+    @property
+    def metrics(self) -> EliteCloudRequestMetrics:
+        return self._metrics
+
+
+    def set_sections(self, sections: frozenset[str] | None):
+        """
+        Only decode the given sections of the site statuses; None to decode all sections
+        """
+        self._sections = sections
+        self._sections_read = EliteCloudDatapoint.sections_read(sections) if sections is not None else None
 
 
     def set_initial_devices(self, device_configs: list[EliteCloudDeviceConfig]):
@@ -163,11 +870,23 @@ class EliteCloudApiWrap(AsyncEliteCloudApi):
             self._sites.append(site)    # in super class AsyncEliteCloudApi
             self.devices[device_config.uuid] = device_config
 
+        self._dedup_sites()
+
+
+    def _dedup_sites(self):
+        """
+        The super class appends to its sites list on each fetch; keep only the last entry for each site
+        """
+        sites = { site.uuid: site for site in self._sites }
+        if len(sites) != len(self._sites):
+            self._sites[:] = sites.values()
+
 
-    async def async_detect_data(self, force_relogin:bool = False, verbose:bool = False):
+    async def async_detect_data(self, force_relogin:bool = False, verbose:bool = False, spread:bool = False):
         """
         We mostly rely on the remote servers notifying us of changes of data (push).
         However, we do an infrequent periodical poll to detect added or removed devices.
+        For periodical polls, use spread to space out the requests for the individual sites.
         """
         # Logout so we really force a subsequent login and not use an old token
         if force_relogin:
@@ -177,13 +896,100 @@ class EliteCloudApiWrap(AsyncEliteCloudApi):
         await self._async_login()
 
         # Fetch the all sites (=devices)
-        await self._async_poll_sites(verbose=verbose)
+        await self._async_poll_sites(verbose=verbose, spread=spread)
         await self._async_poll_sites_statusses(verbose=verbose)
     
 
     async def _async_login(self):
         """Login"""
+        await self.login()
+
+
+    async def login(self):
+        """
+        Login, first restoring any tokens from a previous HA run so we can skip the actual login
+        """
+        if not self._token_restore_done:
+            async with self._login_lock:
+                if not self._token_restore_done:
+                    await self._async_restore_tokens()
+                    self._token_restore_done = True
+
         await super().login()
+
+
+    async def _async_restore_tokens(self):
+        """
+        Restore tokens from the store into the super class
+        """
+        tokens = await self._token_store.async_load()
+        if not tokens or self._access_token is not None:
+            return
+
+        _LOGGER.debug(f"Restored tokens for account '{self._username}'")
+        self._access_token  = tokens.get("access_token")
+        self._access_exp_ts = tokens.get("access_exp_ts")
+        self._device_token  = tokens.get("device_token")
+        self._device_exp_ts = tokens.get("device_exp_ts")
+        self._device_uuid   = tokens.get("device_uuid")
+        self._user_uuid     = tokens.get("user_uuid")
+
+        # The websocket and handlers are not started yet, which login normally does after getting new tokens
+        self._token_resume_session = True
+
+
+    async def _login_access_token(self) -> bool:
+        """
+        Inspect whether the access token is still valid. 
+        If it was restored from the store then also start the session that belongs to it.
+        """
+        if not await super()._login_access_token():
+            return False
+        
+        if self._token_resume_session:
+            self._token_resume_session = False
+            self._token_reuse_count += 1
+            await self._async_resume_session()
+
+        return True
+
+
+    async def _async_resume_session(self):
+        """
+        Start the session that belongs to the restored tokens via the login finalize of the super class, 
+        so renewal, push handling and subscriptions are set up the same way as after a login.
+        This costs a device token round trip instead of a full login.
+        """
+        _LOGGER.info(f"Reuse stored access-token for account '{self._username}'")
+
+        self._login_time = utcnow()
+        self._login_method = LoginMethod.ACCESS_TOKEN
+
+        await self._login_finalize()
+
+
+    async def _login_finalize(self) -> bool:
+        """
+        Called by the super class after a login or token renew. Remember the new tokens.
+        """
+        # The super class (re-)starts the websocket and re-subscribes all sites
+        self._push_resubscribed = True
+        try:
+            result = await super()._login_finalize()
+        except BaseException:
+            self._push_resubscribed = False
+            raise
+
+        self._token_resume_session = False
+        await self._token_store.async_save({
+            "access_token": self._access_token,
+            "access_exp_ts": self._access_exp_ts,
+            "device_token": self._device_token,
+            "device_exp_ts": self._device_exp_ts,
+            "device_uuid": self._device_uuid,
+            "user_uuid": self._user_uuid,
+        })
+        return result
         
 
     async def _async_logout(self):
@@ -191,27 +997,40 @@ class EliteCloudApiWrap(AsyncEliteCloudApi):
         await super().logout()
 
 
-    async def _async_poll_sites(self, verbose:bool = False):
+    async def _async_poll_sites(self, verbose:bool = False, spread:bool = False):
         """
         Attempt to refresh the list of sites
         """
         old_device_ids = set( self.devices.keys() )
         new_device_ids = set()
 
-        sites = await super().fetch_sites()
+        sites = await self.fetch_sites()
+        self._dedup_sites()
         if verbose:
             _LOGGER.debug(f"found sites data: {sites}")
 
-        for site in sites:
-            site_uuid = site.get('uuid')
-            site_resources = await super().fetch_site_resources(site_uuid)
+        # Fetch the resources of all sites; the request scheduler keeps these within the rate limits.
+        # When spread, each site waits for its own moment with some jitter.
+        async def _async_fetch_site_resources(idx: int, site_uuid: str):
+            if spread:
+                await asyncio.sleep( (idx + random.random()) * POLL_SITE_SPACING )
+            return await self.fetch_site_resources(site_uuid)
+
+        sites_resources = await asyncio.gather( *(_async_fetch_site_resources(idx, site.get('uuid')) for idx,site in enumerate(sites)) )
+
+        for site,site_resources in zip(sites, sites_resources):
             if verbose:
-                _LOGGER.debug(f"found resources for site {site_uuid}: {site_resources}")
+                _LOGGER.debug(f"found resources for site {site.get('uuid')}: {site_resources}")
 
-            # Parse the data
             site["resources"] = site_resources
-            device = EliteCloudDeviceConfig.from_data(site)
 
+        # Parse the data of all sites in one pass
+        if len(sites) >= DECODE_EXECUTOR_MIN_SITES:
+            devices = await self._hass.async_add_executor_job(EliteCloudBatchDecoder.decode_devices, sites)
+        else:
+            devices = EliteCloudBatchDecoder.decode_devices(sites)
+
+        for device in devices:
             # Check for changes. Note that we only trigger on new or changed device, not on removed device
             old_device = self.devices.get(device.uuid)
             if old_device is None:
@@ -239,13 +1058,18 @@ class EliteCloudApiWrap(AsyncEliteCloudApi):
         old_status_ids = set( self.status.keys() )
         new_status_ids = set()
 
+        payloads = []
         for site_uuid in self.devices.keys():
-            site_status = await super().fetch_site_status(site_uuid)
+            site_status = await self.fetch_site_status(site_uuid)
 
             if verbose:
                 _LOGGER.debug(f"found status for site {site_uuid}: {site_status}")
 
-            device_status = EliteCloudDeviceStatus.from_data(site_uuid, site_status)
+            payloads.append( (site_uuid, site_status, self.devices.get(site_uuid)) )
+
+        # Decode all statuses in one pass. 
+        # Not in an executor; the payloads are the live site statuses that pushed changes are applied to.
+        for device_status in EliteCloudBatchDecoder.decode_statuses(payloads, self._sections):
             self.status[device_status.uuid] = device_status
             new_status_ids.add(device_status.uuid)
 
@@ -258,16 +1082,24 @@ class EliteCloudApiWrap(AsyncEliteCloudApi):
                 self.status.pop(id,'')
 
 
-    async def async_toggle_datapoint(self, device: EliteCloudDeviceConfig, datapoint: EliteCloudDatapoint):
+    async def async_toggle_datapoint(self, device: EliteCloudDeviceConfig, datapoint: EliteCloudDatapoint) -> bool:
         """
-        Send a toggle command to an input or output
+        Send a toggle command to an input or output, via the command pipeline of the site.
+        Returns False if the toggle was cancelled out by an opposing toggle
         """
         site_uuid = device.uuid
         id = datapoint.id
         section = EliteCloudCmdSection(datapoint.sec)
-        action = EliteCloudCmdAction.TOGGLE
 
-        await super().send_site_command(site_uuid, section, id, action)
+        pipeline = self._pipelines.get(site_uuid)
+        if pipeline is None:
+            async def _async_send(section: EliteCloudCmdSection, id: int):
+                await self.send_site_command(site_uuid, section, id, EliteCloudCmdAction.TOGGLE)
+
+            pipeline = EliteCloudCommandPipeline(self._hass, _async_send)
+            self._pipelines[site_uuid] = pipeline
+
+        return await pipeline.async_submit(section, id)
 
 
     async def async_toggle_stay(self, device: EliteCloudDeviceConfig, datapoint: EliteCloudDatapoint, code:str):
@@ -279,7 +1111,7 @@ class EliteCloudApiWrap(AsyncEliteCloudApi):
         section = EliteCloudCmdSection.STAY
         action = EliteCloudCmdAction.TOGGLE
 
-        await super().send_site_command(site_uuid, section, id, action, passcode=code)
+        await self.send_site_command(site_uuid, section, id, action, passcode=code)
 
 
     async def async_toggle_arm(self, device: EliteCloudDeviceConfig, datapoint: EliteCloudDatapoint, code:str):
@@ -291,7 +1123,145 @@ class EliteCloudApiWrap(AsyncEliteCloudApi):
         section = EliteCloudCmdSection.ARM
         action = EliteCloudCmdAction.TOGGLE
 
-        await super().send_site_command(site_uuid, section, id, action, passcode=code)
+        await self.send_site_command(site_uuid, section, id, action, passcode=code)
+
+
+    async def fetch_sites(self) -> list[dict]:
+        """
+        Get all sites the user has access to. Retried on failure.
+        """
+        return await self._async_call_resilient(super().fetch_sites, idempotent=True, priority=EliteCloudRequestPriority.DISCOVERY)
+
+
+    async def fetch_site_resources(self, site: EliteCloudSite|str) -> dict[str, Any]:
+        """
+        Get resources of a site. Retried on failure.
+        """
+        return await self._async_call_resilient(super().fetch_site_resources, site, idempotent=True, priority=EliteCloudRequestPriority.DISCOVERY)
+
+
+    async def fetch_site_status(self, site: EliteCloudSite|str) -> dict[str, Any]:
+        """
+        Get status of a site. Retried on failure.
+        """
+        start = time.monotonic()
+        status = None
+        try:
+            status = await self._async_call_resilient(super().fetch_site_status, site, idempotent=True, priority=EliteCloudRequestPriority.STATUS)
+            return status
+        finally:
+            site_uuid = site.uuid if isinstance(site, EliteCloudSite) else str(site)
+            self._metrics.record("status", site_uuid, time.monotonic()-start, error=status is None)
+
+
+    async def send_site_command(self, site: EliteCloudSite|str, section: EliteCloudCmdSection, id: int, action: EliteCloudCmdAction, passcode: str = None):
+        """
+        Send a command to a site. 
+        A toggle is not idempotent, so it is only retried when we know the servers did not execute it.
+        """
+        return await self._async_call_resilient(super().send_site_command, site, section, id, action, passcode=passcode, idempotent=False, priority=EliteCloudRequestPriority.COMMAND)
+
+
+    async def _async_call_resilient(self, method, *args, idempotent: bool, priority: EliteCloudRequestPriority, **kwargs):
+        """
+        Call a method of the super class, with the given request priority
+        """
+        # Let the http requests made by this call know their priority and site
+        site = args[0] if args else ""
+        context_token = _REQUEST_CONTEXT.set( (priority, site.uuid if isinstance(site, EliteCloudSite) else str(site)) )
+        try:
+            return await self._async_call_with_retry(method, *args, idempotent=idempotent, **kwargs)
+        finally:
+            _REQUEST_CONTEXT.reset(context_token)
+
+
+    async def _async_call_with_retry(self, method, *args, idempotent: bool, **kwargs):
+        """
+        Call a method of the super class, guarded by the circuit breaker.
+        Retries with exponential backoff and jitter.
+        """
+        for attempt in range(1, API_RETRY_ATTEMPTS+1):
+            self._circuit_breaker.before_call()
+            try:
+                result = await method(*args, **kwargs)
+                self._circuit_breaker.on_success()
+                return result
+            
+            except EliteCloudAuthError as ex:
+                # Rejected by the servers, so the call was not executed; safe to retry after a new login.
+                # Not an availability problem, so the circuit breaker is not involved.
+                self._circuit_breaker.on_success()
+                error = ex
+
+            except EliteCloudDataError as ex:
+                # Rejected by the application on the servers; they are available, so not counted as a failure
+                self._circuit_breaker.on_success()
+                if not idempotent:
+                    raise
+                error = ex
+
+            except EliteCloudConnectError as ex:
+                self._circuit_breaker.on_failure()
+                if not idempotent:
+                    # We cannot tell whether the servers executed the call before failing
+                    raise
+                error = ex
+
+            except BaseException:
+                # Not related to availability of the servers (i.e. invalid parameters or cancelled)
+                self._circuit_breaker.on_ignored()
+                raise
+
+            if attempt >= API_RETRY_ATTEMPTS:
+                raise error
+            
+            delay = API_RETRY_DELAY * pow(2, attempt-1)
+            delay *= random.uniform(1-API_RETRY_JITTER, 1+API_RETRY_JITTER)
+
+            _LOGGER.debug(f"Retry {method.__name__} in {delay:.1f} seconds after: {error}")
+            await asyncio.sleep(delay)
+
+
+    async def _http_request(self, context, request):
+        """
+        Called by the super class for each http request; wait for our turn before sending it
+        """
+        priority, site_uuid = _REQUEST_CONTEXT.get()
+
+        # Everything else waits for a login to complete, so do not let it wait behind anything
+        if context.startswith("login"):
+            priority = EliteCloudRequestPriority.COMMAND
+
+        await self._scheduler.async_acquire(priority, site_uuid)
+
+        # Account for the request; the size of the response is counted by the http client pool
+        endpoint = EliteCloudRequestMetrics.endpoint_for(context)
+        received = [0]
+        received_token = _RESPONSE_BYTES.set(received)
+        start = time.monotonic()
+        error = True
+        try:
+            result = await super()._http_request(context, request)
+            error = False
+            return result
+        
+        finally:
+            _RESPONSE_BYTES.reset(received_token)
+            if endpoint is not None:
+                self._metrics.record(endpoint, site_uuid, time.monotonic()-start, error=error, nbytes=received[0])
+
+
+    async def _subscribe_site_status(self, site: EliteCloudSite|str, force: bool = False):
+        """
+        Called by the super class to subscribe to the status of a site; account for it when actually sent.
+        The latency is until the full status of the site is received.
+        """
+        site_uuid = site.uuid if isinstance(site, EliteCloudSite) else str(site)
+        if force or site_uuid not in self._sites_subscribed:
+            self._metrics.record("subscribe", site_uuid, None)
+            self._subscribe_sent[site_uuid] = time.monotonic()
+
+        await super()._subscribe_site_status(site, force)
 
 
     async def async_subscribe_to_push_data(self, callback):
@@ -306,37 +1276,263 @@ class EliteCloudApiWrap(AsyncEliteCloudApi):
             for site in self._sites:
                 await super().subscribe_site_status(site.uuid, self._on_site_status_change)
 
+            # Restart the push channel if it stopped after an error
+            if self._push_watchdog_unsub is None:
+                self._push_watchdog_unsub = async_track_time_interval(self._hass, self._async_push_watchdog, timedelta(seconds=PUSH_WATCHDOG_INTERVAL))
+
         except Exception as e:
             _LOGGER.info(f"{e}")
 
 
+    async def async_unsubscribe_from_push_data(self):
+        """
+        Stop reporting changes in site status.
+        """
+        self._async_data_listener = None
+
+        if self._push_watchdog_unsub is not None:
+            self._push_watchdog_unsub()
+            self._push_watchdog_unsub = None
+
+        if self._resync_task is not None:
+            self._resync_task.cancel()
+            self._resync_task = None
+
+        self._push_queue.close()
+
+        # Forget the callbacks and subscriptions in the super class, so they are not re-established on a next login
+        for site in self._sites:
+            self._sites_callbacks.pop(site.uuid, None)
+            self._sites_subscribed.discard(site.uuid)
+
+        # A next subscribe must process the first pushes again
+        self._push_fingerprints.clear()
+        self._subscribe_sent.clear()
+
+
+    async def async_close(self):
+        """
+        Unsubscribe, stop the token renew handler and release the http client.
+        Bounded in time so an unresponsive server cannot stall an unload or shutdown.
+        """
+        await self.async_unsubscribe_from_push_data()
+        self._scheduler.close()
+
+        for pipeline in self._pipelines.values():
+            pipeline.close()
+
+        try:
+            async with asyncio.timeout(API_CLOSE_TIMEOUT):
+                await super().close()
+
+        except TimeoutError:
+            _LOGGER.debug(f"Timeout while closing Api for account '{self._username}'")
+
+        # The http client is shared, so do not close it; just stop using it
+        if not self._closed:
+            self._closed = True
+            EliteCloudClientFactory.release(self._hass, self._http_client)
+
+
     async def _on_site_status_change(self, site: EliteCloudSite, section:str, idx:str, status: dict):
         """
         Handle updated site status or partial status received from the remote servers
         """
+        with PROFILER.section():
+            self._handle_site_status_change(site, section, idx, status)
+
+
+    def _handle_site_status_change(self, site: EliteCloudSite, section:str, idx:str, status: dict):
+        """
+        Filter a pushed change and queue the site for decoding and dispatch
+        """
         try:
-            # Actual changed data is already stored in super()._sites_status[site.uuid]
-            site_status = self._sites_status.get(site.uuid)
+            self._push_counts[str(section)] += 1
+            self._push_last = time.monotonic()
 
-            device_status = EliteCloudDeviceStatus.from_data(site.uuid, site_status)
-            self.status[device_status.uuid] = device_status
+            # Latency of a subscribe is until the full status of the site is received
+            if section == "status" and site.uuid in self._subscribe_sent:
+                self._metrics.record_latency("subscribe", time.monotonic() - self._subscribe_sent.pop(site.uuid))
+
+            # Let a waiting resync know the full status of this site was received
+            if section == "status" and site.uuid in self._push_received:
+                self._push_received[site.uuid].set()
+
+            # Changes in sections that no selected datapoint reads from do not affect any entity
+            if self._sections_read is not None and section in SECTIONS and section not in self._sections_read:
+                return
             
-            # Keep track of status values seen
-            await self._async_update_diagnostics(device_status=device_status)
+            # Actual changed data is already stored in super()._sites_status[site.uuid]
+            site_status = self._sites_status.get(site.uuid)
 
-            # Signal to the coordinator that there were changes in the api data
-            if self._async_data_listener is not None:
-                await self._async_data_listener()
+            # Drop pushes that do not change anything
+            if self._is_push_duplicate(site, section, site_status):
+                self._push_duplicates += 1
+                return
 
-            # Extra check for not yet known system and tamper values
-            if section in ['status', 'tamper', 'system']:
-                await self._async_check_status_values('tamper', site_status)
-                await self._async_check_status_values('system', site_status)
+            # Decode and dispatch via the priority queue
+            self._push_queue.put(site.uuid, section)
 
         except Exception as e:
             _LOGGER.info(f"{e}")
 
 
+    async def _async_process_site_status(self, site_uuid: str, sections: set[str]):
+        """
+        Decode the current status of a site after pushed changes in the given sections
+        """
+        site_status = self._sites_status.get(site_uuid)
+        if site_status is None:
+            return
+
+        start = time.perf_counter()
+        with PROFILER.section():
+            device_status = EliteCloudDeviceStatus.from_data(site_uuid, site_status, self.devices.get(site_uuid), self._sections)
+        self.status[device_status.uuid] = device_status
+
+        self._decode_time += time.perf_counter() - start
+        self._decode_count += 1
+        
+        # Keep track of status values seen
+        await self._async_update_diagnostics(device_status=device_status)
+
+        # Extra check for not yet known system and tamper values
+        if not sections.isdisjoint(['status', 'tamper', 'system']):
+            await self._async_check_status_values('tamper', site_status)
+            await self._async_check_status_values('system', site_status)
+
+
+    async def _async_dispatch_site_status(self):
+        """
+        Signal to the coordinator that there were changes in the api data
+        """
+        if self._async_data_listener is not None:
+            await self._async_data_listener()
+
+
+    def _on_push_response(self, response: dict[str, Any]):
+        """
+        Called when the response handler of the super class takes a websocket response.
+        Detects a (re-)connect of the websocket, announced by a 'ready' response.
+        """
+        rsp_data = response.get("json", {})
+
+        if rsp_data.get("type") == "ready" and rsp_data.get("payload", {}).get("is_ready", False):
+            self._on_push_connected()
+
+
+    def _on_push_connected(self):
+        """
+        The websocket was (re-)connected. 
+        After a re-connect the servers have forgotten our subscriptions and we may have missed status changes.
+        """
+        self._push_connects += 1
+        if self._push_resubscribed:
+            # Connect after our own login or token renew; the super class already re-subscribed all sites
+            self._push_resubscribed = False
+            return
+        
+        sites = [ site for site in self._sites if site.uuid in self._sites_subscribed ]
+        if not sites or (self._resync_task is not None and not self._resync_task.done()):
+            return
+        
+        self._resync_task = self._hass.async_create_background_task(
+            self._async_resync(sites), 
+            f"{DOMAIN} resync for account '{self._username}'"
+        )
+
+
+    async def _async_resync(self, sites: list[EliteCloudSite]):
+        """
+        Re-subscribe the interrupted sites concurrently and wait for their full status.
+        The status pushes go through the normal fingerprint check, so only real changes are dispatched.
+        """
+        _LOGGER.info(f"Resync {len(sites)} site(s) for account '{self._username}' after re-connect")
+        start = time.perf_counter()
+        dispatched = self._push_duplicates
+
+        results = await asyncio.gather( *(self._async_resync_site(site) for site in sites), return_exceptions=True )
+
+        self._resync_count += 1
+        self._resync_last = {
+            "time": utcnow(),
+            "duration": round(time.perf_counter() - start, 3),
+            "sites": len(sites),
+            "received": sum(1 for r in results if r is True),
+            "unchanged": self._push_duplicates - dispatched,
+        }
+        _LOGGER.debug(f"Resync for account '{self._username}' done: {self._resync_last}")
+
+
+    async def _async_resync_site(self, site: EliteCloudSite) -> bool:
+        """
+        Re-subscribe a single site. Returns True if its full status was received in time.
+        """
+        event = self._push_received[site.uuid] = asyncio.Event()
+        try:
+            await self._subscribe_site_status(site, force=True)
+
+            async with asyncio.timeout(PUSH_RESYNC_TIMEOUT):
+                await event.wait()
+            return True
+        
+        except TimeoutError:
+            _LOGGER.debug(f"No status received for site '{site.name}' within {PUSH_RESYNC_TIMEOUT}s after re-subscribe")
+            return False
+        
+        finally:
+            self._push_received.pop(site.uuid, None)
+
+
+    async def _async_push_watchdog(self, now=None):
+        """
+        The websocket client stops after an error until it gets a new access token, which can take up to an hour.
+        Restart it with the current access token instead. The re-connect then triggers a resync.
+        """
+        if self._closed or self._login_lock.locked():
+            return
+        
+        ws_client = self._ws_client
+        if ws_client._ws_task is None or ws_client._token is not None:
+            return
+        
+        if self._access_token is None or self._access_exp_ts is None or self._access_exp_ts - ACCESS_TOKEN_EXPIRE_MARGIN < time.time():
+            return  # The token renew handler will restart the websocket
+        
+        _LOGGER.info(f"Restart push channel for account '{self._username}'")
+        self._push_resubscribed = False
+        await ws_client.start(self._access_token)
+
+
+    def _is_push_duplicate(self, site: EliteCloudSite, section: str, site_status: dict[str,Any]) -> bool:
+        """
+        Compare a fingerprint of the section payload after the push was applied with the one from the last push.
+        Pushes that result in the same payload are duplicates and need no decoding.
+        """
+        if not isinstance(site_status, dict):
+            return False
+        
+        fingerprints = self._push_fingerprints[site.uuid]
+
+        if section == "status":
+            # Full status; remember the fingerprint of each section so later partial updates compare against it
+            new_fingerprints = { sec: self._fingerprint(site_status.get(sec)) for sec in SECTIONS }
+            new_fingerprints["status"] = self._fingerprint(site_status)
+        else:
+            # Partial update; the full status fingerprint no longer matches the stored status
+            new_fingerprints = { section: self._fingerprint(site_status.get(section)) }
+            fingerprints.pop("status", None)
+
+        duplicate = all( fingerprints.get(key) == fp for key,fp in new_fingerprints.items() )
+        fingerprints.update(new_fingerprints)
+        return duplicate
+    
+
+    @staticmethod
+    def _fingerprint(payload: Any) -> int:
+        return hash(json.dumps(payload, sort_keys=True, default=str))
+
+
     async def _async_check_status_values(self, section: str, site_status: dict[str,Any]):
         """
         Extra check for not yet known system and tamper values
@@ -361,6 +1557,36 @@ class EliteCloudApiWrap(AsyncEliteCloudApi):
                 self._diag_values[key].add(val)
 
 
+    def add_metrics(self, writer: EliteCloudPrometheusWriter, labels: dict[str, str]):
+        """
+        Add the counters of this account to the metrics export
+        """
+        for section,count in self._push_counts.items():
+            writer.add("elitecloud_push_received_total", "counter", "Pushes received from the cloud servers", count, labels | {"section": section})
+
+        writer.add("elitecloud_push_dropped_total", "counter", "Pushes dropped before decoding", self._push_duplicates, labels | {"reason": "duplicate"})
+        writer.add("elitecloud_push_decode_seconds", "summary", "Time spent decoding site statuses after pushes", self._decode_time, labels, suffix="_sum")
+        writer.add("elitecloud_push_decode_seconds", "summary", "Time spent decoding site statuses after pushes", self._decode_count, labels, suffix="_count")
+        writer.add("elitecloud_push_backlog", "gauge", "Sites waiting to be decoded after pushes", self._push_queue.backlog, labels)
+        writer.add("elitecloud_push_last_age_seconds", "gauge", "Seconds since the last push was received", time.monotonic() - self._push_last if self._push_last is not None else None, labels)
+
+        # Subscription health
+        ws_client = self._ws_client
+        writer.add("elitecloud_push_connected", "gauge", "Whether the push channel is running", ws_client._ws_task is not None and ws_client._token is not None, labels)
+        writer.add("elitecloud_push_connects_total", "counter", "Connects of the push channel", self._push_connects, labels)
+        writer.add("elitecloud_push_resyncs_total", "counter", "Resyncs of site statuses after the push channel re-connected", self._resync_count, labels)
+        writer.add("elitecloud_sites", "gauge", "Sites of the account", len(self.devices), labels)
+        writer.add("elitecloud_sites_subscribed", "gauge", "Sites subscribed to status pushes", len(self._sites_subscribed), labels)
+
+        # Calls to the cloud servers
+        for endpoint in METRICS_ENDPOINTS:
+            metrics = self._metrics.get(endpoint)
+            endpoint_labels = labels | {"endpoint": endpoint}
+            writer.add("elitecloud_cloud_calls_total", "counter", "Calls to the cloud servers", metrics.calls, endpoint_labels)
+            writer.add("elitecloud_cloud_errors_total", "counter", "Failed calls to the cloud servers", metrics.errors, endpoint_labels)
+            writer.add("elitecloud_cloud_received_bytes_total", "counter", "Bytes received from the cloud servers", metrics.bytes, endpoint_labels)
+
+
     async def async_get_diagnostics(self) -> dict[str, Any]:
 
         diag = super().diagnostics
@@ -369,6 +1595,17 @@ class EliteCloudApiWrap(AsyncEliteCloudApi):
             "devices": [ asdict(d) for d in self.devices.values() ],
             "status": [ asdict(s) for s in self.status.values() ],
             "values": self._diag_values,
+            "http_pool": EliteCloudClientFactory.get_diagnostics(self._hass),
+            "token_reuse_count": self._token_reuse_count,
+            "circuit_breaker": self._circuit_breaker.get_diagnostics(),
+            "scheduler": self._scheduler.get_diagnostics(),
+            "pipelines": { uuid: p.get_diagnostics() for uuid,p in self._pipelines.items() },
+            "push_queue": self._push_queue.get_diagnostics(),
+            "push_duplicates": self._push_duplicates,
+            "push_connects": self._push_connects,
+            "resync_count": self._resync_count,
+            "resync_last": self._resync_last,
+            "metrics": self._metrics.get_diagnostics(len(self.devices)),
         } )
         return diag
    
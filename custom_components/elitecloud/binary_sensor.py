@@ -1,45 +1,15 @@
-import asyncio
 import logging
-import math
 from typing import Any
-import voluptuous as vol
 
-from homeassistant import config_entries
-from homeassistant import exceptions
-from homeassistant.components.binary_sensor import PLATFORM_SCHEMA as PARENT_PLATFORM_SCHEMA
 from homeassistant.components.binary_sensor import BinarySensorEntity
-from homeassistant.components.binary_sensor import BinarySensorDeviceClass
 from homeassistant.components.binary_sensor import ENTITY_ID_FORMAT
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_NAME
-from homeassistant.const import CONF_UNIQUE_ID
-from homeassistant.const import EntityCategory
 from homeassistant.const import Platform
-from homeassistant.const import STATE_ON
-from homeassistant.const import STATE_OFF
 from homeassistant.core import HomeAssistant
 from homeassistant.core import callback
-from homeassistant.exceptions import HomeAssistantError
-from homeassistant.exceptions import IntegrationError
-from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.entity_registry import async_get
-from homeassistant.helpers.event import async_track_time_interval
-from homeassistant.helpers.restore_state import RestoreEntity
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from datetime import datetime
-from datetime import timezone
-from datetime import timedelta
-
-from collections import defaultdict
-from collections import namedtuple
-
-from .const import (
-    BINARY_SENSOR_VALUES_ON,
-    BINARY_SENSOR_VALUES_OFF,
-    utcnow,
-)
 from .coordinator import (
     EliteCloudCoordinator,
 )
@@ -47,7 +17,7 @@ from .data import (
     EliteCloudDatapoint,
     EliteCloudDeviceConfig,
     EliteCloudDeviceResource,
-    EliteCloudDeviceStatus,
+    EliteCloudValueMap,
 )
 from .entity import (
     EliteCloudEntity,
@@ -59,13 +29,6 @@ from .helper import (
 
 _LOGGER = logging.getLogger(__name__)
 
-PLATFORM_SCHEMA = PARENT_PLATFORM_SCHEMA.extend(
-    {
-        vol.Required(CONF_NAME): cv.string,
-        vol.Optional(CONF_UNIQUE_ID): cv.string,
-    }
-)
-
 
 async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry, async_add_entities: AddEntitiesCallback):
     """
@@ -92,6 +55,9 @@ class EliteCloudBinarySensor(CoordinatorEntity, BinarySensorEntity, EliteCloudEn
         # update creation-time only attributes
         self._attr_device_class = self.get_binary_sensor_device_class()
 
+        # Compiled lookup of data values to Home Assistant states
+        self._value_map = EliteCloudValueMap.for_datapoint(datapoint.pf, datapoint.sec)
+
         # Create all value related attributes (but with unknown value).
         # After this constructor ends, base class EliteCloudEntity.async_added_to_hass() will 
         # set the value using the restored value from the last HA run. Or otherwise it will
@@ -106,29 +72,21 @@ class EliteCloudBinarySensor(CoordinatorEntity, BinarySensorEntity, EliteCloudEn
         """
 
         # find the correct device corresponding to this sensor
-        data:dict[str, EliteCloudDeviceStatus] = self._coordinator.data
-
-        status = data.get(self._device.uuid) if data is not None else None
-        value = status.get(self._datapoint.key) if status is not None else None
+        value, decoded = self._get_status_value()
 
         # Update value related attributes
-        if self._update_value(value):
+        if self._update_value(value, decoded=decoded):
             self.async_write_ha_state()
     
     
-    def _update_value(self, data_value: Any, force:bool=False) -> bool:
+    def _update_value(self, data_value: Any, force:bool=False, decoded: Any=None) -> bool:
         """
         Set entity value, unit and icon
         """
-        changed = super()._update_value(data_value, force)
+        changed = super()._update_value(data_value, force, decoded)
 
         # Convert from EliteCloud data value to Home Assistant attributes
-        if data_value in BINARY_SENSOR_VALUES_ON:
-            is_on = True
-        elif data_value in BINARY_SENSOR_VALUES_OFF:
-            is_on = False
-        else:
-            is_on = None
+        is_on = self._value_map.get(self._data_decoded)
 
         # Update Home Assistant attributes
         if force or self._attr_is_on != is_on:
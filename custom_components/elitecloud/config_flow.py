@@ -1,21 +1,19 @@
 """config_flow.py: Config flow for Elite Cloud integration."""
 from __future__ import annotations
 
-from dataclasses import asdict
 import logging
-import re
-from typing import Any
 
 import voluptuous as vol
-import homeassistant.helpers.config_validation as cv
 
-from homeassistant import config_entries, exceptions
+from homeassistant import config_entries
+from homeassistant.core import callback
 
-from homeassistant.core import HomeAssistant, callback
 from homeassistant.data_entry_flow import FlowResult
-from homeassistant.exceptions import HomeAssistantError
-from homeassistant.exceptions import IntegrationError
-from homeassistant.helpers.selector import selector
+from homeassistant.helpers.selector import (
+    SelectSelector,
+    SelectSelectorConfig,
+    SelectSelectorMode,
+)
 
 from homeassistant.const import (
     CONF_USERNAME,
@@ -33,15 +31,24 @@ from .const import (
     DOMAIN,
     DEFAULT_USERNAME,
     DEFAULT_PASSWORD,
+    CONF_METRICS_VIEW,
+    CONF_RAW_VALUE,
+    CONF_SECTIONS,
+    DEFAULT_METRICS_VIEW,
+    DEFAULT_RAW_VALUE,
+    DEFAULT_SECTIONS,
+    SECTIONS,
 )
 
 from .coordinator import (
     EliteCloudCoordinatorFactory,
-    EliteCloudCoordinator,
 )
 from .data import (
     EliteCloudDeviceConfig,
 )
+from .store import (
+    EliteCloudDeviceStore,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -50,7 +57,13 @@ _LOGGER = logging.getLogger(__name__)
 class ConfigFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow."""
     
-    VERSION = 1
+    VERSION = 2
+
+    @staticmethod
+    @callback
+    def async_get_options_flow(config_entry: config_entries.ConfigEntry) -> config_entries.OptionsFlow:
+        """Create the options flow."""
+        return OptionsFlowHandler()
     
     def __init__(self):
         """Initialize config flow."""
@@ -142,6 +155,12 @@ class ConfigFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
         await self.async_set_unique_id(f"{DOMAIN}_{self._username}")
         self._abort_if_unique_id_configured()
     
+        # Store the devices and their resources; the config_entry only references the sites
+        _LOGGER.debug(f"Step finish - store devices")
+
+        device_store = EliteCloudDeviceStore(self.hass, self._username)
+        await device_store.async_save({ d.uuid: d.to_dict() for d in self._device_map.values() }, delay=False)
+
         # Create the integration entry
         _LOGGER.debug(f"Step finish - create config_entry")
 
@@ -152,7 +171,42 @@ class ConfigFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
                 CONF_PASSWORD: self._password,
             },
             options = {
-                CONF_DEVICES: [asdict(d) for d in self._device_map.values()],
+                CONF_DEVICES: list(self._device_map.keys()),
             }
         )
-    
+
+
+class OptionsFlowHandler(config_entries.OptionsFlow):
+    """Handle an options flow."""
+
+    async def async_step_init(self, user_input=None) -> FlowResult:
+        """Manage the options."""
+
+        if user_input is not None:
+            _LOGGER.debug(f"Step init - handle input {user_input}")
+
+            # The options also hold the detected devices; keep those as they are
+            options = dict(self.config_entry.options)
+            options.update(user_input)
+
+            return self.async_create_entry(title="", data=options)
+
+        # Show the form with the options
+        _LOGGER.debug(f"Step init - show form")
+
+        options = self.config_entry.options
+        return self.async_show_form(
+            step_id = "init",
+            data_schema = vol.Schema({
+                vol.Required(CONF_SECTIONS, default=options.get(CONF_SECTIONS, DEFAULT_SECTIONS)): SelectSelector(
+                    SelectSelectorConfig(
+                        options = SECTIONS,
+                        multiple = True,
+                        mode = SelectSelectorMode.LIST,
+                        translation_key = CONF_SECTIONS,
+                    )
+                ),
+                vol.Required(CONF_RAW_VALUE, default=options.get(CONF_RAW_VALUE, DEFAULT_RAW_VALUE)): bool,
+                vol.Required(CONF_METRICS_VIEW, default=options.get(CONF_METRICS_VIEW, DEFAULT_METRICS_VIEW)): bool,
+            }),
+        )
@@ -1,6 +1,7 @@
 """Constants for the Elite Cloud integration."""
 from datetime import datetime, timezone
 import logging
+from typing import Any
 
 from homeassistant.const import (
     CONF_USERNAME,
@@ -21,6 +22,7 @@ ISSUE_URL = "https://github.com/ankohanse/hass-elite-cloud/issues"
 PLATFORM_TO_PF: dict[Platform, str] = {
     Platform.ALARM_CONTROL_PANEL: "alm",
     Platform.BINARY_SENSOR: "bin",
+    Platform.SENSOR: "sen",
     Platform.SWITCH: "sw",
 }
 PLATFORMS = list(PLATFORM_TO_PF.keys())
@@ -28,15 +30,35 @@ PLATFORMS = list(PLATFORM_TO_PF.keys())
 HUB = "Hub"
 API = "Api"
 COORDINATOR = "Coordinator"
+COORDINATOR_RELOAD_COUNT = "CoordinatorReloadCount"
+POLL_SCHEDULER = "PollScheduler"
 
 DEFAULT_USERNAME = ""
 DEFAULT_PASSWORD = ""
 
 CONF_SITE_UUID = "site_uuid"
 CONF_SITE_NAME = "site_name"
+CONF_RAW_VALUE = "raw_value"
+CONF_SECTIONS = "sections"
+CONF_METRICS_VIEW = "metrics_view"
+
+DEFAULT_RAW_VALUE = True
+DEFAULT_METRICS_VIEW = False
+
+# Sections of a panel that can be selected per config entry. Not selected sections are not decoded and get no entities.
+SECTIONS = ["area", "input", "output", "tamper", "system", "keypad"]
+DEFAULT_SECTIONS = SECTIONS
+
+# Sections of the site status read by the datapoints of a section, where more than the section itself
+SECTIONS_READ = { "system": ["system", "tamper"] }
 
 DIAGNOSTICS_REDACT = { CONF_PASSWORD, 'client_secret' }
 
+# Panel size assumed when the number of areas, inputs and outputs is not known
+DEVICE_DEFAULT_AREAS = 16
+DEVICE_DEFAULT_INPUTS = 16
+DEVICE_DEFAULT_OUTPUTS = 16
+
 # To compose entity unique id and names
 MANUFACTURER = "Arrowhead Alarm Products"
 PREFIX_ID = "elitecloud"
@@ -48,6 +70,19 @@ ATTR_DATA_VALUE = "elitecontrol_value"
 # Extra attributes that are restored from the previous HA run
 ATTR_STORED_DATA_VALUE = "value"
 
+# Services
+SERVICE_BYPASS_INPUTS = "bypass_inputs"
+ATTR_BYPASS = "bypass"
+
+SERVICE_PROFILE = "profile"
+ATTR_SECONDS = "seconds"
+ATTR_TOP = "top"
+PROFILE_SECONDS_DEFAULT = 60
+PROFILE_SECONDS_MAX = 3600
+PROFILE_TOP_DEFAULT = 30
+PROFILE_TOP_MAX = 200
+PROFILE_SORT = "cumulative"   # order of the functions in the summary in the log
+
 BINARY_SENSOR_VALUES_ON = ['True', '1', 'on', 'open']
 BINARY_SENSOR_VALUES_OFF = ['', 'False', '0', 'off', 'sealed']
 BINARY_SENSOR_VALUES_ALL = BINARY_SENSOR_VALUES_ON + BINARY_SENSOR_VALUES_OFF
@@ -56,18 +91,93 @@ SWITCH_VALUES_ON = ['on', 'bypass']
 SWITCH_VALUES_OFF = ['', 'off', 'bypass cleared', 'open', 'sealed']
 SWITCH_VALUES_ALL = SWITCH_VALUES_ON + SWITCH_VALUES_OFF
 
+# Map Elite Cloud status values to Home Assistant states, per platform abbreviation and section.
+# A section of None applies to all sections of that platform that do not have their own entry.
+# Entries are in priority order; a comma-joined multi-status value (i.e. 'open,bypass')
+# gets the state of the first entry that holds one of its parts.
+VALUE_MAPS: dict[tuple[str, str|None], list[tuple[Any, list[Any]]]] = {
+    ("alm", None): [
+        ("disarming",  ["disarming"]),
+        ("arming",     ["arming", "staying"]),
+        ("armed_away", ["armed"]),
+        ("armed_home", ["stay armed"]),
+        ("disarmed",   ["", "disarmed", "stay disarmed"]),
+    ],
+    ("bin", None): [
+        (True,  BINARY_SENSOR_VALUES_ON + [True]),
+        (False, BINARY_SENSOR_VALUES_OFF + [False]),
+    ],
+    ("sw", None): [
+        (True,  SWITCH_VALUES_ON),
+        (False, SWITCH_VALUES_OFF),
+    ],
+}
+VALUE_MAPS_JOINED_MAX = 256  # max number of distinct multi-status values remembered per map
+
 API_RETRY_ATTEMPTS = 2
 API_RETRY_DELAY = 5    # seconds
+API_RETRY_JITTER = 0.5 # fraction of the delay
+API_CIRCUIT_FAILURE_THRESHOLD = 5   # consecutive failures
+API_CIRCUIT_RESET_TIMEOUT = 60      # seconds
+API_RATE_LIMIT = 5      # sustained requests per second, per account
+API_RATE_BURST = 10     # requests that may be sent at once
+
+PUSH_SECTIONS_HIGH = {"status", "area", "tamper", "system"}  # pushed sections that are processed before inputs and outputs
+PUSH_LOW_BATCH = 10            # sites with input or output changes to decode before dispatching to the entities
+PUSH_RESYNC_TIMEOUT = 10       # seconds to wait for the status of a site after re-subscribing
+PUSH_WATCHDOG_INTERVAL = 30    # seconds between checks that the push channel is still running
+
+DECODE_EXECUTOR_MIN_SITES = 20  # decode polled sites in an executor thread from this number of sites onwards
+
+COMMAND_PIPELINE_WINDOW = 0.25  # seconds to collect commands for a site before sending them
+COMMAND_PIPELINE_CONCURRENCY = 4    # commands sent in parallel per site
+API_CLOSE_TIMEOUT = 10  # seconds
+
+HTTP_CLIENT = "HttpClient"
+HTTP_MAX_CONNECTIONS = 20
+HTTP_MAX_KEEPALIVE_CONNECTIONS = 10
+HTTP_KEEPALIVE_EXPIRY = 120  # seconds
 
 COORDINATOR_POLLING_INTERVAL = 1*60*60   # 1 hour in seconds
 COORDINATOR_RELOAD_DELAY = 1*60*60 # 1 hour in seconds
 COORDINATOR_RELOAD_DELAY_MAX = 24*60*60 # 24 hours in seconds
 
+POLL_JITTER = 0.5   # fraction of the free gap, around its middle, used to randomize the poll moment of a new account
+POLL_SITE_SPACING = 1.0 # seconds between the resource requests of sites during a periodic poll
+
 STORE_KEY_CACHE = "cache"
 STORE_WRITE_PERIOD_CACHE = 30*60 # 30 minutes in seconds
 
+STORE_KEY_TOKENS = "tokens"
+STORE_VERSION_TOKENS = 1
+STORE_WRITE_PERIOD_TOKENS = 5 # seconds
+STORE_TOKENS_KDF_ITERATIONS = 100_000
+
+STORE_KEY_DEVICES = "devices"
+STORE_VERSION_DEVICES = 1
+STORE_WRITE_PERIOD_DEVICES = 5 # seconds
+
 STATUS_VALIDITY_PERIOD = 15*60 # 15 minutes in seconds
 
+# Startup time budget per stage, in seconds
+STARTUP_BUDGET = {
+    "import": 0.5,          # import of the integration modules
+    "coordinator": 0.1,     # construction of the coordinator and api
+    "platforms": 2.0,       # setup of all platforms and their entities
+    "first_push": 15.0,     # from start of setup until the first push data is received
+}
+
+# Accounting of the calls to the remote servers, per account
+METRICS_ENDPOINTS = ("login", "sites", "resources", "status", "command", "subscribe")
+METRICS_LATENCY_SAMPLES = 200   # most recent latencies per endpoint used for the percentiles
+METRICS_PERCENTILES = (50, 90, 99)
+METRICS_WINDOW = 60*60          # seconds over which the calls per hour are counted
+METRICS_SCAN_INTERVAL = 60      # seconds between updates of the accounting sensors
+METRICS_VIEW = "MetricsView"
+METRICS_VIEW_URL = "/api/elitecloud/metrics"
+
+COMMAND_CONFIRM_TIMEOUT = 15 # seconds to wait for a push that confirms an optimistic state
+
 # Global helper functions
 utcnow = lambda: datetime.now(timezone.utc)
 utcmin = lambda: datetime.min.replace(tzinfo=timezone.utc)
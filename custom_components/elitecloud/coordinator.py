@@ -1,9 +1,12 @@
-from dataclasses import asdict
+import asyncio
+from collections import defaultdict
 import logging
+import math
+import random
+import time
 
 from datetime import datetime, timedelta
-import re
-from typing import Any
+from typing import Any, Awaitable, Callable
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
@@ -12,8 +15,7 @@ from homeassistant.core import callback
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import device_registry
 from homeassistant.helpers import entity_registry
-from homeassistant.helpers.device_registry import DeviceRegistry
-from homeassistant.helpers.device_registry import CONNECTION_NETWORK_MAC
+from homeassistant.helpers.device_registry import DeviceEntryType, DeviceRegistry
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
 from homeassistant.const import (
@@ -26,11 +28,18 @@ from .const import (
     DOMAIN,
     NAME,
     COORDINATOR,
+    COORDINATOR_RELOAD_COUNT,
     MANUFACTURER,
     PREFIX_NAME,
     COORDINATOR_POLLING_INTERVAL,
     COORDINATOR_RELOAD_DELAY,
     COORDINATOR_RELOAD_DELAY_MAX,
+    POLL_JITTER,
+    POLL_SCHEDULER,
+    CONF_SECTIONS,
+    DEFAULT_SECTIONS,
+    SECTIONS,
+    STARTUP_BUDGET,
     utcnow,
     utcmax,
 )
@@ -43,6 +52,16 @@ from .data import (
     EliteCloudDeviceConfig,
     EliteCloudDeviceStatus,
 )
+from .metrics import (
+    EliteCloudPrometheusWriter,
+    EliteCloudRequestMetrics,
+)
+from .profiler import (
+    PROFILER,
+)
+from .store import (
+    EliteCloudDeviceStore,
+)
 
 
 # Define logger
@@ -64,13 +83,16 @@ class EliteCloudCoordinatorFactory:
         username = configs.get(CONF_USERNAME, None)
         password = configs.get(CONF_PASSWORD, None)
 
-        reload_count = 0
-        
         # Sanity check
         if not DOMAIN in hass.data:
             hass.data[DOMAIN] = {}
         if not COORDINATOR in hass.data[DOMAIN]:
             hass.data[DOMAIN][COORDINATOR] = {}
+        if not COORDINATOR_RELOAD_COUNT in hass.data[DOMAIN]:
+            hass.data[DOMAIN][COORDINATOR_RELOAD_COUNT] = {}
+
+        # Reload count survives closing of a previous coordinator for this account
+        reload_count = hass.data[DOMAIN][COORDINATOR_RELOAD_COUNT].get(username, 0)
             
         # already created?
         coordinator = hass.data[DOMAIN][COORDINATOR].get(username)
@@ -140,8 +162,171 @@ class EliteCloudCoordinatorFactory:
 
         _LOGGER.debug("close temp coordinator")
         await EliteCloudApiFactory.async_close_temp(coordinator._api)
+
+
+    @staticmethod
+    async def async_close(hass: HomeAssistant, config_entry: ConfigEntry):
+        """
+        Close the Coordinator for a config entry and the Api it uses, and forget about both
+        """
+        username = config_entry.data.get(CONF_USERNAME, None)
+
+        coordinators = hass.data.get(DOMAIN, {}).get(COORDINATOR, {})
+        coordinator: EliteCloudCoordinator = coordinators.pop(username, None)
+        if coordinator is None:
+            return
+
+        # Remember reload settings for when a new coordinator is created for this account
+        hass.data[DOMAIN][COORDINATOR_RELOAD_COUNT][username] = coordinator.reload_count
+
+        _LOGGER.debug(f"Close coordinator for account '{username}'")
+        coordinator.stop_polling()
+        await coordinator.async_shutdown()
+        await coordinator.async_unsubscribe_from_push_data()
+
+        # The Api may be shared with other coordinators that use the same credentials
+        if all(c._api is not coordinator._api for c in coordinators.values()):
+            await EliteCloudApiFactory.async_close(hass, coordinator._api)
     
 
+class EliteCloudPollScheduler:
+    """
+    Process wide schedule for the periodic polls of all accounts.
+
+    Each account polls at its own offset within the polling interval. A new account is placed at a
+    random moment around the middle of the largest free gap between the offsets of the other accounts.
+    After a restart the accounts then do not all detect data at the same moment.
+    Offsets are kept when other accounts come and go, and when an account is reloaded.
+    """
+
+    @staticmethod
+    def get(hass: HomeAssistant) -> 'EliteCloudPollScheduler':
+        """
+        Get the shared poll scheduler, create it if it does not yet exist
+        """
+        # Sanity check
+        if not DOMAIN in hass.data:
+            hass.data[DOMAIN] = {}
+
+        scheduler: EliteCloudPollScheduler = hass.data[DOMAIN].get(POLL_SCHEDULER, None)
+        if scheduler is None:
+            scheduler = EliteCloudPollScheduler(hass)
+            hass.data[DOMAIN][POLL_SCHEDULER] = scheduler
+
+        return scheduler
+
+
+    def __init__(self, hass: HomeAssistant, interval: float = COORDINATOR_POLLING_INTERVAL, jitter: float = POLL_JITTER):
+        self._hass = hass
+        self._interval = interval
+        self._jitter = jitter
+
+        # All offsets are relative to the moment the scheduler was created; i.e. the start of HA
+        self._epoch: float = hass.loop.time()
+
+        # Per account; username -> ... Offsets are kept after unregister, for when the account is reloaded.
+        self._polls: dict[str, Callable[[], Awaitable[None]]] = {}
+        self._offsets: dict[str, float] = {}
+        self._handles: dict[str, asyncio.TimerHandle] = {}
+        self._next: dict[str, float] = {}
+        self._last: dict[str, float] = {}
+        self._count: dict[str, int] = defaultdict(int)
+
+
+    def register(self, username: str, async_poll: Callable[[], Awaitable[None]]):
+        """
+        Periodically poll for an account. The other accounts keep their poll moments.
+        """
+        if username not in self._offsets:
+            self._offsets[username] = self._free_offset()
+
+        self._polls[username] = async_poll
+        self._schedule(username, self._hass.loop.time())
+
+
+    def unregister(self, username: str):
+        """
+        Stop polling for an account. The other accounts keep their poll moments.
+        """
+        if self._polls.pop(username, None) is None:
+            return
+        
+        handle = self._handles.pop(username, None)
+        if handle is not None:
+            handle.cancel()
+
+        self._next.pop(username, None)
+
+
+    def _free_offset(self) -> float:
+        """
+        Pick an offset around the middle of the largest gap between the offsets of the polling accounts
+        """
+        offsets = sorted( self._offsets[username] for username in self._polls.keys() )
+        if not offsets:
+            start, length = 0.0, self._interval
+        else:
+            gaps = [ (offset, (offsets[(idx+1) % len(offsets)] - offset) % self._interval or self._interval) for idx,offset in enumerate(offsets) ]
+            start, length = max(gaps, key=lambda gap: gap[1])
+
+        return (start + length * (0.5 + random.uniform(-self._jitter, self._jitter)/2)) % self._interval
+
+
+    def _schedule(self, username: str, now: float):
+        """
+        Schedule the next poll of an account at its moment in the cycle.
+        Never within half an interval after its previous poll or after the start.
+        """
+        base = self._epoch + self._offsets[username]
+        earliest = max(now, self._last.get(username, self._epoch) + self._interval/2)
+        cycles = max(0, math.ceil((earliest - base) / self._interval))
+
+        handle = self._handles.get(username)
+        if handle is not None:
+            handle.cancel()
+
+        self._next[username] = base + cycles*self._interval
+        self._handles[username] = self._hass.loop.call_at(self._next[username], self._start_poll, username)
+
+
+    @callback
+    def _start_poll(self, username: str):
+        self._handles.pop(username, None)
+        self._hass.async_create_background_task(self._async_poll(username), f"{DOMAIN} poll")
+
+
+    async def _async_poll(self, username: str):
+        async_poll = self._polls.get(username)
+        if async_poll is None:
+            return
+        
+        now = self._hass.loop.time()
+        self._last[username] = now
+        self._count[username] += 1
+        self._schedule(username, now)
+
+        await async_poll()
+
+
+    def get_diagnostics(self, username: str) -> dict[str, Any]:
+        """
+        Schedule of the polls. Other accounts are only shown by their offset in the cycle.
+        """
+        now = self._hass.loop.time()
+        to_datetime = lambda t: utcnow() + timedelta(seconds=t-now) if t is not None else None
+
+        return {
+            "interval": self._interval,
+            "jitter": self._jitter,
+            "accounts": len(self._polls),
+            "offsets": sorted( round(self._offsets[u]) for u in self._polls.keys() ),
+            "offset": round(self._offsets[username]) if username in self._offsets else None,
+            "next": to_datetime(self._next.get(username)),
+            "last": to_datetime(self._last.get(username)),
+            "polls": self._count.get(username, 0),
+        }
+
+
 class EliteCloudCoordinator(DataUpdateCoordinator[dict[str,EliteCloudDeviceStatus]]):
     """My custom coordinator."""
 
@@ -156,7 +341,8 @@ class EliteCloudCoordinator(DataUpdateCoordinator[dict[str,EliteCloudDeviceStatu
             name=NAME,
             # This coordinator primarily depends on data pushed from the remote servers.
             # However, we also do an infrequent periodical poll from Web to detect added or removed devices.
-            update_interval=timedelta(seconds=COORDINATOR_POLLING_INTERVAL),
+            # These polls are started by the EliteCloudPollScheduler, spread over all accounts.
+            update_interval=None,
             update_method=self._async_update_data,
         )
 
@@ -167,11 +353,12 @@ class EliteCloudCoordinator(DataUpdateCoordinator[dict[str,EliteCloudDeviceStatu
 
         self._username = configs.get(CONF_USERNAME, None)
 
-        # Initialize devices from config_entry so we can subscribe for updates before we've polled for devices
-        device_dicts = options.get(CONF_DEVICES, [])
-        device_configs = [ EliteCloudDeviceConfig.from_dict(d) for d in device_dicts ]
+        # Catalogue of devices and their resources; the config entry only references the sites
+        self._device_store = EliteCloudDeviceStore(hass, self._username)
 
-        self._api.set_initial_devices(device_configs)   
+        # Only decode and create entities for the selected sections
+        self._sections: frozenset[str] = frozenset(options.get(CONF_SECTIONS, DEFAULT_SECTIONS))
+        self._api.set_sections(self._sections if self._sections != frozenset(SECTIONS) else None)
 
         # Keep track of entity and device ids during init so we can cleanup unused ids later
         self._valid_unique_ids: dict[Platform, list[str]] = {} # platform -> entity unique_ids
@@ -186,6 +373,21 @@ class EliteCloudCoordinator(DataUpdateCoordinator[dict[str,EliteCloudDeviceStatu
         self._reload_scheduled: datetime = utcmax()
         self._reload_delay: int = COORDINATOR_RELOAD_DELAY
 
+        # Duration of startup stages
+        self._startup_start: float | None = None
+        self._startup: dict[str, float] = {}
+
+        # Round trip of commands until confirmed by a push
+        self._command_stats: dict[str, dict[str, float]] = defaultdict(lambda: defaultdict(float))
+
+        # Inputs and outputs that have toggles pending; (device uuid, datapoint key) -> (outstanding toggles, last actual state)
+        self._pending_toggles: dict[tuple[str,str], tuple[int, Any]] = {}
+        self._pending_collapsed: int = 0
+
+        # Dispatches of pushed data and the number of entities notified by them
+        self._dispatch_count: int = 0
+        self._dispatch_entities: int = 0
+
 
     @property
     def configs(self) -> dict[str,Any]:
@@ -199,6 +401,19 @@ class EliteCloudCoordinator(DataUpdateCoordinator[dict[str,EliteCloudDeviceStatu
     def username(self) -> str:
         return self._username
 
+    @property
+    def metrics(self) -> EliteCloudRequestMetrics:
+        return self._api.metrics
+
+    @property
+    def account_id(self) -> str:
+        """Identifier of the device that represents the account itself"""
+        return f"account_{self._username}"
+
+    @property
+    def sections(self) -> frozenset[str]:
+        return self._sections
+
     @property
     def devices(self) -> dict[str,EliteCloudDeviceConfig]:
         return self._api.devices
@@ -231,6 +446,22 @@ class EliteCloudCoordinator(DataUpdateCoordinator[dict[str,EliteCloudDeviceStatu
         self._valid_unique_ids[platform] = ids
 
 
+    async def async_load_devices(self):
+        """
+        Initialize the devices referenced by the config_entry from the device store,
+        so we can subscribe for updates before we've polled for devices
+        """
+        stored = await self._device_store.async_load()
+
+        site_uuids = self._options.get(CONF_DEVICES, [])
+        device_configs = [ EliteCloudDeviceConfig.from_dict(stored[uuid]) for uuid in site_uuids if uuid in stored ]
+
+        if len(device_configs) < len(site_uuids):
+            _LOGGER.info(f"Missing stored devices for account '{self.username}'; these are detected again at the next poll")
+
+        self._api.set_initial_devices(device_configs)   
+
+
     async def async_create_devices(self, config_entry: ConfigEntry):
         """
         Add all detected devices to the hass device_registry
@@ -255,6 +486,17 @@ class EliteCloudCoordinator(DataUpdateCoordinator[dict[str,EliteCloudDeviceStatu
             )
             valid_ids.append( (DOMAIN, device.uuid) )
 
+        # The account itself, holding the accounting of the calls to the remote servers
+        dr.async_get_or_create(
+            config_entry_id = config_entry.entry_id,
+            identifiers = {(DOMAIN, self.account_id)},
+            name = f"{PREFIX_NAME} {self.username}",
+            manufacturer =  MANUFACTURER,
+            model = "Account",
+            entry_type = DeviceEntryType.SERVICE,
+        )
+        valid_ids.append( (DOMAIN, self.account_id) )
+
         # Remember valid device ids so we can do a cleanup of invalid ones later
         self._valid_device_ids = valid_ids
 
@@ -300,11 +542,26 @@ class EliteCloudCoordinator(DataUpdateCoordinator[dict[str,EliteCloudDeviceStatu
         The caller will handle exceptions.
         """
         _LOGGER.debug(f"Config flow data")
-        await self._api.async_detect_data(force_relogin=True, verbose=True)  
+        # No forced relogin; stored tokens are only reused when they were obtained with the same credentials
+        await self._api.async_detect_data(verbose=True)  
         
         return self._api.devices
 
 
+    def start_polling(self):
+        """
+        Start the periodic polls to detect added or removed sites
+        """
+        EliteCloudPollScheduler.get(self.hass).register(self._username, self.async_refresh)
+
+
+    def stop_polling(self):
+        """
+        Stop the periodic polls
+        """
+        EliteCloudPollScheduler.get(self.hass).unregister(self._username)
+
+
     async def _async_update_data(self):
         """
         Poll for sensor data from API.
@@ -315,7 +572,7 @@ class EliteCloudCoordinator(DataUpdateCoordinator[dict[str,EliteCloudDeviceStatu
         """
         _LOGGER.info(f"Start detect of new sites for account '{self.username}'")
         try:
-            await self._api.async_detect_data()
+            await self._api.async_detect_data(spread=True)
             await self._async_detect_changes()
 
         except Exception as ex:
@@ -326,34 +583,142 @@ class EliteCloudCoordinator(DataUpdateCoordinator[dict[str,EliteCloudDeviceStatu
         return self._get_data()
 
 
-    async def async_toggle_datapoint(self, device: EliteCloudDeviceConfig, datapoint: EliteCloudDatapoint):
+    async def async_toggle_datapoint(self, device: EliteCloudDeviceConfig, datapoint: EliteCloudDatapoint) -> bool | None:
+        """
+        Returns True if the toggle was sent, None if it was cancelled out by an opposing toggle, False on failure
+        """
         try:
-            await self._api.async_toggle_datapoint(device, datapoint)
+            sent = await self._api.async_toggle_datapoint(device, datapoint)
+            return True if sent else None
 
         except Exception as ex:
             # Log issue. We expect it to be resolved on a next poll.
             _LOGGER.debug(ex)
             _LOGGER.info(f"Failed to toggle value for device '{device.name}', key {datapoint.key}")
+            return False
     
 
-    async def async_toggle_stay(self, device: EliteCloudDeviceConfig, datapoint: EliteCloudDatapoint, code:str):
+    async def async_toggle_stay(self, device: EliteCloudDeviceConfig, datapoint: EliteCloudDatapoint, code:str) -> bool:
         try:
             await self._api.async_toggle_stay(device, datapoint, code)
+            return True
 
         except Exception as ex:
             # Log issue. We expect it to be resolved on a next poll.
             _LOGGER.debug(ex)
             _LOGGER.info(f"Failed to toggle stay for device '{device.name}', key {datapoint.key}")
+            return False
 
 
-    async def async_toggle_arm(self, device: EliteCloudDeviceConfig, datapoint: EliteCloudDatapoint, code:str):
+    async def async_toggle_arm(self, device: EliteCloudDeviceConfig, datapoint: EliteCloudDatapoint, code:str) -> bool:
         try:
             await self._api.async_toggle_arm(device, datapoint, code)
+            return True
 
         except Exception as ex:
             # Log issue. We expect it to be resolved on a next poll.
             _LOGGER.debug(ex)
             _LOGGER.info(f"Failed to toggle arm for device '{device.name}', key {datapoint.key}")
+            return False
+
+
+    def startup_begin(self, start: float):
+        """
+        Remember when setup of the config entry started, as perf_counter value
+        """
+        self._startup_start = start
+        self._startup = {}
+
+
+    def record_startup(self, stage: str, duration: float):
+        """
+        Remember the duration of a startup stage and report it when over budget
+        """
+        self._startup[stage] = duration
+
+        budget = STARTUP_BUDGET.get(stage)
+        if budget is not None and duration > budget:
+            _LOGGER.info(f"Startup stage '{stage}' for account '{self.username}' took {duration:.3f}s; over budget of {budget}s")
+
+
+    def get_target(self, device: EliteCloudDeviceConfig, datapoint: EliteCloudDatapoint, actual: Any) -> Any:
+        """
+        The state an input or output will have once its pending toggles have been processed;
+        the actual state when an even number of toggles is outstanding, the opposite state when odd.
+        """
+        count,_ = self._pending_toggles.get( (device.uuid, datapoint.key), (0, actual) )
+        if count % 2 == 0 or actual is None:
+            return actual
+        
+        return not actual
+
+
+    async def async_toggle_to_target(self, device: EliteCloudDeviceConfig, datapoint: EliteCloudDatapoint, target: Any, actual: Any) -> bool | None:
+        """
+        Send a toggle to get an input or output to the target state, unless it is already on its way there.
+        Returns True if the toggle was sent, None if nothing needed to be sent, False on failure
+        """
+        key = (device.uuid, datapoint.key)
+
+        if self.get_target(device, datapoint, actual) == target:
+            self._pending_collapsed += 1
+            return None
+
+        count,last = self._pending_toggles.get(key, (0, actual))
+        self._pending_toggles[key] = (count+1, last)
+
+        result = await self.async_toggle_datapoint(device, datapoint)
+        if result is None:
+            # Cancelled out by an opposing toggle before it was sent
+            self._confirm_toggle(key)
+
+        elif result is False:
+            # Not known which toggles made it; start again from the actual state
+            self._pending_toggles.pop(key, None)
+
+        return result
+
+
+    def confirm_target(self, device: EliteCloudDeviceConfig, datapoint: EliteCloudDatapoint, actual: Any):
+        """
+        Called when a new actual state is known. A change of the actual state confirms one pending toggle.
+        """
+        key = (device.uuid, datapoint.key)
+        pending = self._pending_toggles.get(key)
+        if pending is None or actual is None or actual == pending[1]:
+            return
+        
+        # Each change of the actual state is the result of one outstanding toggle
+        self._confirm_toggle(key, actual)
+
+
+    def _confirm_toggle(self, key: tuple[str,str], actual: Any = None):
+        """
+        One less outstanding toggle. Optionally with the new actual state.
+        """
+        count,last = self._pending_toggles.get(key, (0, None))
+        if count <= 1:
+            self._pending_toggles.pop(key, None)
+        else:
+            self._pending_toggles[key] = (count-1, actual if actual is not None else last)
+
+
+    def clear_target(self, device: EliteCloudDeviceConfig, datapoint: EliteCloudDatapoint):
+        self._pending_toggles.pop( (device.uuid, datapoint.key), None )
+
+
+    def record_command_roundtrip(self, command: str, latency: float, confirmed: bool):
+        """
+        Keep track of the time between sending a command and the push that confirms it
+        """
+        stats = self._command_stats[command]
+        if confirmed:
+            stats["confirmed"] += 1
+            stats["latency_last"] = round(latency, 3)
+            stats["latency_max"] = max(stats["latency_max"], stats["latency_last"])
+            stats["latency_total"] += latency
+        else:
+            stats["unconfirmed"] += 1
 
 
     async def async_subscribe_to_push_data(self):
@@ -364,32 +729,50 @@ class EliteCloudCoordinator(DataUpdateCoordinator[dict[str,EliteCloudDeviceStatu
         await self._api.async_subscribe_to_push_data(self._async_push_data)
 
 
+    async def async_unsubscribe_from_push_data(self):
+        """
+        Unsubscribe from push data
+        """
+        _LOGGER.info(f"Unsubscribe from push data")
+        await self._api.async_unsubscribe_from_push_data()
+
+
     @callback
     async def _async_push_data(self):
         """
         Push new sensor data from API to all our listening entities.
         """
-        self.async_update_listeners()
+        if self._startup_start is not None and "first_push" not in self._startup:
+            self.record_startup("first_push", time.perf_counter() - self._startup_start)
+
+        self._dispatch_count += 1
+        self._dispatch_entities += len(self._listeners)
+
+        # Includes the updates of all entities
+        with PROFILER.section():
+            self.async_update_listeners()
 
 
     async def _async_detect_changes(self):
         """Detect changes in the profile and trigger a integration reload if needed"""
 
         if self._api.devices_changed:
-            # Update the existing entity_config with new devices
-            data = dict(self._config_entry.data)
+            # Update the changed sites in the device store. Written right away, as the reloaded integration reads it back from disk
+            await self._device_store.async_save({ d.uuid: d.to_dict() for d in self._api.devices.values() }, delay=False)
+
+            # The existing entity_config only needs updating when sites were added or removed
             options = dict(self._config_entry.options)
+            options[CONF_DEVICES] = list(self._api.devices.keys())
 
-            options[CONF_DEVICES] = [asdict(d) for d in self._api.devices.values()]
+            self.hass.config_entries.async_update_entry(self.config_entry, options = options)
 
-            if self.hass.config_entries.async_update_entry(self.config_entry, data = data, options = options):
-                self._api.devices_changed = False
-                self._reload_scheduled = self._reload_time + timedelta(seconds=self._reload_delay)
+            self._api.devices_changed = False
+            self._reload_scheduled = self._reload_time + timedelta(seconds=self._reload_delay)
 
-                if self._reload_scheduled > utcnow():
-                    _LOGGER.info(f"Schedule reload of integration at {self._reload_scheduled.astimezone()}")
-                else:
-                    self._reload_scheduled = utcnow()
+            if self._reload_scheduled > utcnow():
+                _LOGGER.info(f"Schedule reload of integration at {self._reload_scheduled.astimezone()}")
+            else:
+                self._reload_scheduled = utcnow()
 
         # Deliberately delay reload checks to prevent enless reloads if something is wrong
         if self._reload_scheduled <= utcnow():
@@ -398,6 +781,25 @@ class EliteCloudCoordinator(DataUpdateCoordinator[dict[str,EliteCloudDeviceStatu
             self.hass.config_entries.async_schedule_reload(self._config_entry.entry_id)
 
 
+    def add_metrics(self, writer: EliteCloudPrometheusWriter):
+        """
+        Add the counters of this account and its api to the metrics export
+        """
+        labels = {"account": self._username}
+
+        writer.add("elitecloud_dispatch_total", "counter", "Dispatches of pushed data to the entities", self._dispatch_count, labels)
+        writer.add("elitecloud_dispatch_entities_total", "counter", "Entities notified by the dispatches; divided by the dispatches this gives the fan-out", self._dispatch_entities, labels)
+        writer.add("elitecloud_entities", "gauge", "Entities listening to the data of the account", len(self._listeners), labels)
+
+        for command,stats in self._command_stats.items():
+            command_labels = labels | {"command": command}
+            writer.add("elitecloud_command_round_trip_seconds", "summary", "Time between sending a command and the push that confirms it", stats["latency_total"], command_labels, suffix="_sum")
+            writer.add("elitecloud_command_round_trip_seconds", "summary", "Time between sending a command and the push that confirms it", int(stats["confirmed"]), command_labels, suffix="_count")
+            writer.add("elitecloud_command_unconfirmed_total", "counter", "Commands that were not confirmed by a push in time", int(stats["unconfirmed"]), command_labels)
+
+        self._api.add_metrics(writer, labels)
+
+
     async def async_get_diagnostics(self) -> dict[str, Any]:
         """
         Get all diagnostics values
@@ -409,5 +811,24 @@ class EliteCloudCoordinator(DataUpdateCoordinator[dict[str,EliteCloudDeviceStatu
                 "reload_scheduled": self._reload_scheduled,
                 "reload_delay": self._reload_delay,
             },
+            "startup": {
+                stage: {
+                    "duration": round(duration, 3),
+                    "budget": STARTUP_BUDGET.get(stage),
+                    "within_budget": duration <= STARTUP_BUDGET.get(stage, duration),
+                } for stage,duration in self._startup.items()
+            },
+            "poll_schedule": EliteCloudPollScheduler.get(self.hass).get_diagnostics(self._username),
+            "pending_toggles": sum( count for count,_ in self._pending_toggles.values() ),
+            "pending_collapsed": self._pending_collapsed,
+            "commands": { 
+                command: {
+                    "confirmed": int(stats["confirmed"]),
+                    "unconfirmed": int(stats["unconfirmed"]),
+                    "latency_last": stats["latency_last"],
+                    "latency_max": stats["latency_max"],
+                    "latency_avg": round(stats["latency_total"] / stats["confirmed"], 3) if stats["confirmed"] else None,
+                } for command,stats in self._command_stats.items()
+            },
         }
     
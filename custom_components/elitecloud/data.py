@@ -1,14 +1,22 @@
 import logging
+import re
+import sys
+import threading
 
-from dataclasses import asdict, dataclass
-from enum import StrEnum
-from jsonata import Jsonata
-from typing import Any
-
-from homeassistant.const import Platform
+from dataclasses import asdict, dataclass, field, fields, replace
+from datetime import datetime, timezone
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Callable
 
 from .const import (
+    DEVICE_DEFAULT_AREAS,
+    DEVICE_DEFAULT_INPUTS,
+    DEVICE_DEFAULT_OUTPUTS,
     PLATFORM_TO_PF,
+    SECTIONS_READ,
+    VALUE_MAPS,
+    VALUE_MAPS_JOINED_MAX,
 )
 
 
@@ -16,6 +24,85 @@ from .const import (
 _LOGGER = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=None)
+def _jsonata(path: str):
+    """
+    Compiled expression for a datapoint path. 
+    The jsonata module is only imported when first needed, keeping it out of the integration import time.
+    """
+    from jsonata import Jsonata
+    return Jsonata(path)
+
+
+# A jsonata expression binds its input on the expression itself, so evaluations must not overlap
+_JSONATA_LOCK = threading.Lock()
+
+# Paths that are looked up directly in the site index instead of evaluated via jsonata; i.e. 'input[id=3].status'
+_INDEX_PATH = re.compile(r"^(area|input|output)\[(id|idx)=(\d+)\](?:\.(\w+))?$")
+_INDEX_SECTIONS = ("area", "input", "output")
+
+
+def _index(d: Any) -> dict[tuple[str,str], dict[int, dict]]:
+    """
+    Index the areas, inputs and outputs of a site payload by id and by idx.
+    Built once per payload and shared by all extractors that run on it.
+    """
+    index: dict[tuple[str,str], dict[int, dict]] = {}
+    if not isinstance(d, dict):
+        return index
+    
+    for sec in _INDEX_SECTIONS:
+        items = d.get(sec)
+        if isinstance(items, dict):
+            items = [items]
+        if not isinstance(items, list):
+            continue
+
+        by_id = index[(sec, "id")] = {}
+        by_idx = index[(sec, "idx")] = {}
+        for item in items:
+            if not isinstance(item, dict):
+                continue
+            for attr,lookup in (("id", by_id), ("idx", by_idx)):
+                num = item.get(attr)
+                if isinstance(num, (int, float)) and not isinstance(num, bool):
+                    lookup.setdefault(num, item)
+
+    return index
+
+
+@lru_cache(maxsize=None)
+def _extractor(path: str) -> Callable[[Any, dict], Any]:
+    """
+    Precompiled extractor for a datapoint path, shared by all sites.
+    Returns a function that takes the site payload and its index.
+    """
+    if path.startswith('='):
+        # Predefined constant result
+        const = DATAPATHS_CONST.get(path)
+        return lambda d, index: const
+    
+    match = _INDEX_PATH.match(path)
+    if match is None:
+        # Any other path is evaluated via jsonata
+        def evaluate(d: Any, index: dict) -> Any:
+            expr = _jsonata(path)
+            with _JSONATA_LOCK:
+                return expr.evaluate(d)
+        return evaluate
+    
+    key = (match.group(1), match.group(2))
+    num = int(match.group(3))
+    attr = match.group(4)
+
+    def lookup(d: Any, index: dict) -> Any:
+        item = index.get(key, {}).get(num)
+        if item is None or attr is None:
+            return item
+        return item.get(attr)
+    return lookup
+
+
 @dataclass
 class DP:
     key: str            # Unique key for this datapoint
@@ -30,81 +117,29 @@ class DP:
     unit: str           # Data unit of measurement
     opt: dict[str,Any]  # Options for Enums
 
-DATAPOINTS = [
-    DP(key="area_a",     sec="area",   id=1,  name="area A",     pf="alm", flag="e,none",  rpath="area[idx=0]",    spath="area[id=1].status",   fmt="s",  unit="",  opt={}),
-    DP(key="area_b",     sec="area",   id=2,  name="area B",     pf="alm", flag="e,none",  rpath="area[idx=1]",    spath="area[id=2].status",   fmt="s",  unit="",  opt={}),
-    DP(key="area_c",     sec="area",   id=3,  name="area C",     pf="alm", flag="e,none",  rpath="area[idx=2]",    spath="area[id=3].status",   fmt="s",  unit="",  opt={}),
-    DP(key="area_d",     sec="area",   id=4,  name="area D",     pf="alm", flag="e,none",  rpath="area[idx=3]",    spath="area[id=4].status",   fmt="s",  unit="",  opt={}),
-    DP(key="area_e",     sec="area",   id=5,  name="area E",     pf="alm", flag="e,none",  rpath="area[idx=4]",    spath="area[id=5].status",   fmt="s",  unit="",  opt={}),
-    DP(key="area_f",     sec="area",   id=6,  name="area F",     pf="alm", flag="e,none",  rpath="area[idx=5]",    spath="area[id=6].status",   fmt="s",  unit="",  opt={}),
-    DP(key="area_g",     sec="area",   id=7,  name="area G",     pf="alm", flag="e,none",  rpath="area[idx=6]",    spath="area[id=7].status",   fmt="s",  unit="",  opt={}),
-    DP(key="area_h",     sec="area",   id=8,  name="area H",     pf="alm", flag="e,none",  rpath="area[idx=7]",    spath="area[id=8].status",   fmt="s",  unit="",  opt={}),
-    DP(key="area_i",     sec="area",   id=9,  name="area I",     pf="alm", flag="e,none",  rpath="area[idx=8]",    spath="area[id=9].status",   fmt="s",  unit="",  opt={}),
-    DP(key="area_j",     sec="area",   id=10, name="area J",     pf="alm", flag="e,none",  rpath="area[idx=9]",    spath="area[id=10].status",  fmt="s",  unit="",  opt={}),
-    DP(key="area_k",     sec="area",   id=11, name="area K",     pf="alm", flag="e,none",  rpath="area[idx=10]",   spath="area[id=11].status",  fmt="s",  unit="",  opt={}),
-    DP(key="area_l",     sec="area",   id=12, name="area L",     pf="alm", flag="e,none",  rpath="area[idx=11]",   spath="area[id=12].status",  fmt="s",  unit="",  opt={}),
-    DP(key="area_m",     sec="area",   id=13, name="area M",     pf="alm", flag="e,none",  rpath="area[idx=12]",   spath="area[id=13].status",  fmt="s",  unit="",  opt={}),
-    DP(key="area_n",     sec="area",   id=14, name="area N",     pf="alm", flag="e,none",  rpath="area[idx=13]",   spath="area[id=14].status",  fmt="s",  unit="",  opt={}),
-    DP(key="area_o",     sec="area",   id=15, name="area O",     pf="alm", flag="e,none",  rpath="area[idx=14]",   spath="area[id=15].status",  fmt="s",  unit="",  opt={}),
-    DP(key="area_p",     sec="area",   id=16, name="area P",     pf="alm", flag="e,none",  rpath="area[idx=15]",   spath="area[id=16].status",  fmt="s",  unit="",  opt={}),
-
-    DP(key="sensor_1",   sec="input",  id=1,  name="Sensor 1",   pf="bin", flag="e,none",  rpath="input[idx=0]",   spath="input[id=1].status",  fmt="s",  unit="",  opt={}),
-    DP(key="sensor_2",   sec="input",  id=2,  name="Sensor 2",   pf="bin", flag="e,none",  rpath="input[idx=1]",   spath="input[id=2].status",  fmt="s",  unit="",  opt={}),
-    DP(key="sensor_3",   sec="input",  id=3,  name="Sensor 3",   pf="bin", flag="e,none",  rpath="input[idx=2]",   spath="input[id=3].status",  fmt="s",  unit="",  opt={}),
-    DP(key="sensor_4",   sec="input",  id=4,  name="Sensor 4",   pf="bin", flag="e,none",  rpath="input[idx=3]",   spath="input[id=4].status",  fmt="s",  unit="",  opt={}),
-    DP(key="sensor_5",   sec="input",  id=5,  name="Sensor 5",   pf="bin", flag="e,none",  rpath="input[idx=4]",   spath="input[id=5].status",  fmt="s",  unit="",  opt={}),
-    DP(key="sensor_6",   sec="input",  id=6,  name="Sensor 6",   pf="bin", flag="e,none",  rpath="input[idx=5]",   spath="input[id=6].status",  fmt="s",  unit="",  opt={}),
-    DP(key="sensor_7",   sec="input",  id=7,  name="Sensor 7",   pf="bin", flag="e,none",  rpath="input[idx=6]",   spath="input[id=7].status",  fmt="s",  unit="",  opt={}),
-    DP(key="sensor_8",   sec="input",  id=8,  name="Sensor 8",   pf="bin", flag="e,none",  rpath="input[idx=7]",   spath="input[id=8].status",  fmt="s",  unit="",  opt={}),
-    DP(key="sensor_9",   sec="input",  id=9,  name="Sensor 9",   pf="bin", flag="e,none",  rpath="input[idx=8]",   spath="input[id=9].status",  fmt="s",  unit="",  opt={}),
-    DP(key="sensor_10",  sec="input",  id=10, name="Sensor 10",  pf="bin", flag="e,none",  rpath="input[idx=9]",   spath="input[id=10].status", fmt="s",  unit="",  opt={}),
-    DP(key="sensor_11",  sec="input",  id=11, name="Sensor 11",  pf="bin", flag="e,none",  rpath="input[idx=10]",  spath="input[id=11].status", fmt="s",  unit="",  opt={}),
-    DP(key="sensor_12",  sec="input",  id=12, name="Sensor 12",  pf="bin", flag="e,none",  rpath="input[idx=11]",  spath="input[id=12].status", fmt="s",  unit="",  opt={}),
-    DP(key="sensor_13",  sec="input",  id=13, name="Sensor 13",  pf="bin", flag="e,none",  rpath="input[idx=12]",  spath="input[id=13].status", fmt="s",  unit="",  opt={}),
-    DP(key="sensor_14",  sec="input",  id=14, name="Sensor 14",  pf="bin", flag="e,none",  rpath="input[idx=13]",  spath="input[id=14].status", fmt="s",  unit="",  opt={}),
-    DP(key="sensor_15",  sec="input",  id=15, name="Sensor 15",  pf="bin", flag="e,none",  rpath="input[idx=14]",  spath="input[id=15].status", fmt="s",  unit="",  opt={}),
-    DP(key="sensor_16",  sec="input",  id=16, name="Sensor 16",  pf="bin", flag="e,none",  rpath="input[idx=15]",  spath="input[id=16].status", fmt="s",  unit="",  opt={}),
-
-    DP(key="snooze_1",   sec="input",  id=1,  name="Snooze Sensor 1",   pf="sw", flag="e,conf,dnm",  rpath="input[idx=0]",   spath="input[id=1].status",  fmt="s",  unit="",  opt={}),
-    DP(key="snooze_2",   sec="input",  id=2,  name="Snooze Sensor 2",   pf="sw", flag="e,conf,dnm",  rpath="input[idx=1]",   spath="input[id=2].status",  fmt="s",  unit="",  opt={}),
-    DP(key="snooze_3",   sec="input",  id=3,  name="Snooze Sensor 3",   pf="sw", flag="e,conf,dnm",  rpath="input[idx=2]",   spath="input[id=3].status",  fmt="s",  unit="",  opt={}),
-    DP(key="snooze_4",   sec="input",  id=4,  name="Snooze Sensor 4",   pf="sw", flag="e,conf,dnm",  rpath="input[idx=3]",   spath="input[id=4].status",  fmt="s",  unit="",  opt={}),
-    DP(key="snooze_5",   sec="input",  id=5,  name="Snooze Sensor 5",   pf="sw", flag="e,conf,dnm",  rpath="input[idx=4]",   spath="input[id=5].status",  fmt="s",  unit="",  opt={}),
-    DP(key="snooze_6",   sec="input",  id=6,  name="Snooze Sensor 6",   pf="sw", flag="e,conf,dnm",  rpath="input[idx=5]",   spath="input[id=6].status",  fmt="s",  unit="",  opt={}),
-    DP(key="snooze_7",   sec="input",  id=7,  name="Snooze Sensor 7",   pf="sw", flag="e,conf,dnm",  rpath="input[idx=6]",   spath="input[id=7].status",  fmt="s",  unit="",  opt={}),
-    DP(key="snooze_8",   sec="input",  id=8,  name="Snooze Sensor 8",   pf="sw", flag="e,conf,dnm",  rpath="input[idx=7]",   spath="input[id=8].status",  fmt="s",  unit="",  opt={}),
-    DP(key="snooze_9",   sec="input",  id=9,  name="Snooze Sensor 9",   pf="sw", flag="e,conf,dnm",  rpath="input[idx=8]",   spath="input[id=9].status",  fmt="s",  unit="",  opt={}),
-    DP(key="snooze_10",  sec="input",  id=10, name="Snooze Sensor 10",  pf="sw", flag="e,conf,dnm",  rpath="input[idx=9]",   spath="input[id=10].status", fmt="s",  unit="",  opt={}),
-    DP(key="snooze_11",  sec="input",  id=11, name="Snooze Sensor 11",  pf="sw", flag="e,conf,dnm",  rpath="input[idx=10]",  spath="input[id=11].status", fmt="s",  unit="",  opt={}),
-    DP(key="snooze_12",  sec="input",  id=12, name="Snooze Sensor 12",  pf="sw", flag="e,conf,dnm",  rpath="input[idx=11]",  spath="input[id=12].status", fmt="s",  unit="",  opt={}),
-    DP(key="snooze_13",  sec="input",  id=13, name="Snooze Sensor 13",  pf="sw", flag="e,conf,dnm",  rpath="input[idx=12]",  spath="input[id=13].status", fmt="s",  unit="",  opt={}),
-    DP(key="snooze_14",  sec="input",  id=14, name="Snooze Sensor 14",  pf="sw", flag="e,conf,dnm",  rpath="input[idx=13]",  spath="input[id=14].status", fmt="s",  unit="",  opt={}),
-    DP(key="snooze_15",  sec="input",  id=15, name="Snooze Sensor 15",  pf="sw", flag="e,conf,dnm",  rpath="input[idx=14]",  spath="input[id=15].status", fmt="s",  unit="",  opt={}),
-    DP(key="snooze_16",  sec="input",  id=16, name="Snooze Sensor 16",  pf="sw", flag="e,conf,dnm",  rpath="input[idx=15]",  spath="input[id=16].status", fmt="s",  unit="",  opt={}),
-
-    DP(key="control_1",  sec="output", id=1,  name="Control 1",  pf="sw",  flag="e,none",  rpath="output[idx=0]",  spath="output[id=1].status",  fmt="s",  unit="",  opt={}),
-    DP(key="control_2",  sec="output", id=2,  name="Control 2",  pf="sw",  flag="e,none",  rpath="output[idx=1]",  spath="output[id=2].status",  fmt="s",  unit="",  opt={}),
-    DP(key="control_3",  sec="output", id=3,  name="Control 3",  pf="sw",  flag="e,none",  rpath="output[idx=2]",  spath="output[id=3].status",  fmt="s",  unit="",  opt={}),
-    DP(key="control_4",  sec="output", id=4,  name="Control 4",  pf="sw",  flag="e,none",  rpath="output[idx=3]",  spath="output[id=4].status",  fmt="s",  unit="",  opt={}),
-    DP(key="control_5",  sec="output", id=5,  name="Control 5",  pf="sw",  flag="e,none",  rpath="output[idx=4]",  spath="output[id=5].status",  fmt="s",  unit="",  opt={}),
-    DP(key="control_6",  sec="output", id=6,  name="Control 6",  pf="sw",  flag="e,none",  rpath="output[idx=5]",  spath="output[id=6].status",  fmt="s",  unit="",  opt={}),
-    DP(key="control_7",  sec="output", id=7,  name="Control 7",  pf="sw",  flag="e,none",  rpath="output[idx=6]",  spath="output[id=7].status",  fmt="s",  unit="",  opt={}),
-    DP(key="control_8",  sec="output", id=8,  name="Control 8",  pf="sw",  flag="e,none",  rpath="output[idx=7]",  spath="output[id=8].status",  fmt="s",  unit="",  opt={}),
-    DP(key="control_9",  sec="output", id=9,  name="Control 9",  pf="sw",  flag="e,none",  rpath="output[idx=8]",  spath="output[id=9].status",  fmt="s",  unit="",  opt={}),
-    DP(key="control_10", sec="output", id=10, name="Control 10", pf="sw",  flag="e,none",  rpath="output[idx=9]",  spath="output[id=10].status", fmt="s",  unit="",  opt={}),
-    DP(key="control_11", sec="output", id=11, name="Control 11", pf="sw",  flag="e,none",  rpath="output[idx=10]", spath="output[id=11].status", fmt="s",  unit="",  opt={}),
-    DP(key="control_12", sec="output", id=12, name="Control 12", pf="sw",  flag="e,none",  rpath="output[idx=11]", spath="output[id=12].status", fmt="s",  unit="",  opt={}),
-    DP(key="control_13", sec="output", id=13, name="Control 13", pf="sw",  flag="e,none",  rpath="output[idx=12]", spath="output[id=13].status", fmt="s",  unit="",  opt={}),
-    DP(key="control_14", sec="output", id=14, name="Control 14", pf="sw",  flag="e,none",  rpath="output[idx=13]", spath="output[id=14].status", fmt="s",  unit="",  opt={}),
-    DP(key="control_15", sec="output", id=15, name="Control 15", pf="sw",  flag="e,none",  rpath="output[idx=14]", spath="output[id=15].status", fmt="s",  unit="",  opt={}),
-    DP(key="control_16", sec="output", id=16, name="Control 16", pf="sw",  flag="e,none",  rpath="output[idx=15]", spath="output[id=16].status", fmt="s",  unit="",  opt={}),
+# Datapoint templates per section, generated for each area, input or output that a panel actually has.
+# In the templates, {id} is replaced by the 1-based id, {idx} by the 0-based index and {ch} or {CH} by the area letter.
+DATAPOINT_TEMPLATES: dict[str, list[DP]] = {
+    "area": [
+        DP(key="area_{ch}",     sec="area",   id=0,  name="area {CH}",         pf="alm", flag="e,none",      rpath="area[idx={idx}]",   spath="area[id={id}].status",   fmt="s",  unit="",  opt={}),
+    ],
+    "input": [
+        DP(key="sensor_{id}",   sec="input",  id=0,  name="Sensor {id}",       pf="bin", flag="e,none",      rpath="input[idx={idx}]",  spath="input[id={id}].status",  fmt="s",  unit="",  opt={}),
+        DP(key="snooze_{id}",   sec="input",  id=0,  name="Snooze Sensor {id}", pf="sw", flag="e,conf,dnm", rpath="input[idx={idx}]",  spath="input[id={id}].status",  fmt="s",  unit="",  opt={}),
+    ],
+    "output": [
+        DP(key="control_{id}",  sec="output", id=0,  name="Control {id}",      pf="sw",  flag="e,none",      rpath="output[idx={idx}]", spath="output[id={id}].status", fmt="s",  unit="",  opt={}),
+    ],
+}
 
+# Datapoints that every panel has
+DATAPOINTS_FIXED = [
     # All definitions below use BinarySensorDeviceClass.PROBLEM. I.e.False -> OK and True -> Fault
     DP(key="keypad",     sec="keypad", id=0,  name="Keypad",         pf="bin", flag="e,diag",  rpath="=keypad", spath="#keypad",                        fmt="b",  unit="",  opt={}),
-    DP(key="system",     sec="system", id=0,  name="System",         pf="bin", flag="e,diag",  rpath="=system", spath="#system",                        fmt="s",  unit="",  opt={}),
+    DP(key="system",     sec="system", id=0,  name="System",         pf="bin", flag="e,diag",  rpath="=system", spath="#system",                        fmt="b",  unit="",  opt={}),
 
-    DP(key="mains",      sec="tamper", id=0,  name="Mains Power",    pf="bin", flag="e,diag",  rpath="=tamper", spath="'mains fail' in tamper.status",  fmt="s",  unit="",  opt={}),
-    DP(key="battery",    sec="tamper", id=0,  name="Backup Battery", pf="bin", flag="e,diag",  rpath="=tamper", spath="'battery low' in tamper.status", fmt="s",  unit="",  opt={}),
+    DP(key="mains",      sec="tamper", id=0,  name="Mains Power",    pf="bin", flag="e,diag",  rpath="=tamper", spath="'mains fail' in tamper.status",  fmt="b",  unit="",  opt={}),
+    DP(key="battery",    sec="tamper", id=0,  name="Backup Battery", pf="bin", flag="e,diag",  rpath="=tamper", spath="'battery low' in tamper.status", fmt="b",  unit="",  opt={}),
 
     # For detecting not yet known tamper and system statuses
     DP(key="dev_tamper", sec="dev",    id=0,  name="Dev Tamper",     pf="",    flag="",        rpath="=dev",    spath="tamper.status",                  fmt="s",  unit="",  opt={}),
@@ -144,7 +179,7 @@ class EliteCloudDatapoint(DP):
 
 
     @staticmethod
-    def for_platform(target_platform: str) -> list['EliteCloudDatapoint']:
+    def for_platform(target_platform: str, device: 'EliteCloudDeviceConfig' = None, sections: frozenset[str] = None) -> list['EliteCloudDatapoint']:
         """
         Get all datapoints matching the target platform
         """
@@ -153,15 +188,171 @@ class EliteCloudDatapoint(DP):
             _LOGGER.warning(f"Trying to get abbreviated platform for '{target_platform}. Please contact the developer of this integration.")
             return []
 
-        # Collect all datapoints associated with this device family and for this platform 
-        return [ EliteCloudDatapoint(dp) for dp in DATAPOINTS if dp.pf==pf  ]
+        # Collect all datapoints associated with this device and for this platform 
+        return [ dp for dp in EliteCloudDatapoint.for_all(device, sections) if dp.pf==pf  ]
+
+
+    @staticmethod
+    def for_all(device: 'EliteCloudDeviceConfig' = None, sections: frozenset[str] = None) -> list['EliteCloudDatapoint']:
+        """
+        Get all datapoints for the areas, inputs and outputs of a device.
+        Without device, the datapoints for a panel of the default size are returned.
+        Without sections, the datapoints of all sections are returned.
+        """
+        if device is None:
+            return list(EliteCloudDatapoint._resolve_all(DEVICE_DEFAULT_AREAS, DEVICE_DEFAULT_INPUTS, DEVICE_DEFAULT_OUTPUTS, sections))
+        else:
+            return list(EliteCloudDatapoint._resolve_all(device.areas, device.inputs, device.outputs, sections))
+    
+
+    @staticmethod
+    @lru_cache(maxsize=32)
+    def _resolve_all(areas: int, inputs: int, outputs: int, sections: frozenset[str] = None) -> tuple['EliteCloudDatapoint', ...]:
+        """
+        Generate and resolve the datapoints for a panel size and selected sections once; 
+        the resolved datapoints are shared by all sites with the same size and sections
+        """
+        if sections is not None:
+            return tuple( dp for dp in EliteCloudDatapoint._resolve_all(areas, inputs, outputs) if EliteCloudDatapoint._in_sections(dp.sec, sections) )
+        
+        dps: list[DP] = []
+        for sec,count in (("area", areas), ("input", inputs), ("output", outputs)):
+            for template in DATAPOINT_TEMPLATES[sec]:
+                for id in range(1, count+1):
+                    dps.append( EliteCloudDatapoint._expand(template, id) )
+
+        dps.extend(DATAPOINTS_FIXED)
+
+        return tuple( EliteCloudDatapoint(dp) for dp in dps )
+    
+
+    @staticmethod
+    def status_extractors(device: 'EliteCloudDeviceConfig' = None, sections: frozenset[str] = None) -> tuple[tuple['EliteCloudDatapoint', Callable], ...]:
+        """
+        Get the datapoints of a device together with the precompiled extractors for their status paths
+        """
+        if device is None:
+            return EliteCloudDatapoint._compile_status(DEVICE_DEFAULT_AREAS, DEVICE_DEFAULT_INPUTS, DEVICE_DEFAULT_OUTPUTS, sections)
+        else:
+            return EliteCloudDatapoint._compile_status(device.areas, device.inputs, device.outputs, sections)
+
+
+    @staticmethod
+    @lru_cache(maxsize=32)
+    def _compile_status(areas: int, inputs: int, outputs: int, sections: frozenset[str] = None) -> tuple[tuple['EliteCloudDatapoint', Callable], ...]:
+        """
+        Compile the status extractors for a panel size and selected sections once
+        """
+        return tuple( (dp, _extractor(dp.spath)) for dp in EliteCloudDatapoint._resolve_all(areas, inputs, outputs, sections) )
+    
+
+    @staticmethod
+    def _in_sections(sec: str, sections: frozenset[str]) -> bool:
+        """
+        Whether a datapoint section is selected. 
+        The dev datapoints detect unknown tamper and system statuses, so follow those sections.
+        """
+        if sec == "dev":
+            return "tamper" in sections or "system" in sections
+        return sec in sections
+    
 
+    @staticmethod
+    def sections_read(sections: frozenset[str]) -> frozenset[str]:
+        """
+        Sections of the site status that the datapoints of the selected sections read from
+        """
+        return frozenset( read for sec in sections for read in SECTIONS_READ.get(sec, [sec]) )
+    
 
     @staticmethod
-    def for_all() -> list['EliteCloudDatapoint']:
-        return [ EliteCloudDatapoint(dp) for dp in DATAPOINTS ]
+    def _expand(template: DP, id: int) -> DP:
+        """
+        Fill in the id of an area, input or output into a datapoint template
+        """
+        ch = chr(ord('a') + id - 1) if id <= 26 else str(id)
+        fields = { "id": id, "idx": id-1, "ch": ch, "CH": ch.upper() }
+
+        return replace(template,
+            key   = template.key.format(**fields),
+            id    = id,
+            name  = template.name.format(**fields),
+            rpath = template.rpath.format(**fields),
+            spath = template.spath.format(**fields),
+        )
     
 
+class EliteCloudValueMap():
+    """
+    Compiled lookup of Elite Cloud status values to Home Assistant states,
+    as declared in VALUE_MAPS
+    """
+    def __init__(self, entries: list[tuple[Any, list[Any]]], convert: Callable[[Any], Any] | None = None):
+        """
+        Compile the declared entries into a frozen lookup
+        """
+        self._entries: tuple[tuple[Any, frozenset[Any]], ...] = tuple( 
+            (convert(state) if convert else state, frozenset(values)) for state,values in entries 
+        )
+
+        lookup: dict[Any, Any] = {}
+        for state,values in self._entries:
+            for value in values:
+                lookup.setdefault(value, state)
+
+        self._lookup = MappingProxyType(lookup)
+        self._joined: dict[str|tuple, Any] = {}
+
+
+    def get(self, value: Any) -> Any:
+        """
+        Return the state for a status value, or None if the value is unknown.
+        The value can be a decoded value (i.e. bool or tuple of statuses) or its string view.
+        """
+        try:
+            return self._lookup[value]
+        except (KeyError, TypeError):
+            pass
+
+        if isinstance(value, tuple):
+            if len(value) == 0:
+                # An empty status list was decoded to '' before
+                return self._lookup.get('')
+            if len(value) == 1:
+                return self._lookup.get(value[0])
+        elif not isinstance(value, str) or ',' not in value:
+            return None
+        
+        # Multi-status value; resolve once and remember the result
+        try:
+            return self._joined[value]
+        except KeyError:
+            pass
+
+        if isinstance(value, tuple):
+            parts = set(value)
+        else:
+            parts = { part.strip() for part in value.split(',') }
+        state = next( (state for state,values in self._entries if not values.isdisjoint(parts)), None )
+
+        if len(self._joined) < VALUE_MAPS_JOINED_MAX:
+            self._joined[value] = state
+        return state
+
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def for_datapoint(pf: str, sec: str, convert: Callable[[Any], Any] | None = None) -> 'EliteCloudValueMap':
+        """
+        Get the compiled value map for a platform abbreviation and section
+        """
+        entries = VALUE_MAPS.get( (pf, sec) )
+        if entries is None:
+            entries = VALUE_MAPS.get( (pf, None), [] )
+
+        return EliteCloudValueMap(entries, convert)
+
+
 @dataclass
 class EliteCloudDeviceConfig():
 
@@ -173,13 +364,17 @@ class EliteCloudDeviceConfig():
     pnl_version: str
     mod_version: str
     resources: 'list[EliteCloudDeviceResource]'
+    areas: int = DEVICE_DEFAULT_AREAS
+    inputs: int = DEVICE_DEFAULT_INPUTS
+    outputs: int = DEVICE_DEFAULT_OUTPUTS
 
 
     @staticmethod
     def from_data(d: dict[str,Any]):
         """
         """
-        return EliteCloudDeviceConfig(
+        resources = d.get("resources", {})
+        device = EliteCloudDeviceConfig(
             uuid        = d.get("uuid", None),
             name        = d.get("name", None),
             serial      = d.get("panel", {}).get("serial_no", None),
@@ -187,14 +382,43 @@ class EliteCloudDeviceConfig():
             type        = d.get("panel", {}).get("specification", {}).get("module_type", None),
             pnl_version = d.get("panel", {}).get("specification", {}).get("panel_version", None),
             mod_version = d.get("panel", {}).get("specification", {}).get("module_version", None),
-            resources   = EliteCloudDeviceResource.from_data(d.get("resources", {}))
+            resources   = [],
+            areas       = EliteCloudDeviceConfig._count(resources, "area", DEVICE_DEFAULT_AREAS),
+            inputs      = EliteCloudDeviceConfig._count(resources, "input", DEVICE_DEFAULT_INPUTS),
+            outputs     = EliteCloudDeviceConfig._count(resources, "output", DEVICE_DEFAULT_OUTPUTS),
         )
+        device.resources = EliteCloudDeviceResource.from_data(resources, EliteCloudDatapoint.for_all(device))
+        return device
+
+
+    @staticmethod
+    def _count(resources: dict[str,Any], section: str, default: int) -> int:
+        """
+        Number of areas, inputs or outputs in the resources of a panel
+        """
+        items = resources.get(section) if isinstance(resources, dict) else None
+        if not isinstance(items, list):
+            return default
+        
+        idxs = [ r.get("idx") for r in items if isinstance(r, dict) and isinstance(r.get("idx"), int) ]
+        return max(idxs)+1 if idxs else len(items)
     
 
+    def to_dict(self) -> dict[str,Any]:
+        """
+        Compact dict of this device config, as kept in the device store.
+        The resources are stored as lists of their values.
+        """
+        d = { f.name: getattr(self, f.name) for f in fields(self) if f.name != "resources" }
+        d["resources"] = [ [r.key, r.name, r.icon, r.is_hidden, r.is_active] for r in self.resources ]
+        return d
+
+
     @staticmethod
     def from_dict(d: dict[str,Any]) -> 'EliteCloudDeviceConfig':        
         """
-        Construct a new EliteCloudDeviceConfig object from a dict
+        Construct a new EliteCloudDeviceConfig object from a dict,
+        either a compact dict from the device store or an older dict from the config entry options
         """
         return EliteCloudDeviceConfig(
             uuid        = d.get("uuid", None),
@@ -205,6 +429,9 @@ class EliteCloudDeviceConfig():
             pnl_version = d.get("pnl_version"),
             mod_version = d.get("mod_version"),
             resources   = EliteCloudDeviceResource.from_list(d.get("resources", {})),
+            areas       = d.get("areas", DEVICE_DEFAULT_AREAS),
+            inputs      = d.get("inputs", DEVICE_DEFAULT_INPUTS),
+            outputs     = d.get("outputs", DEVICE_DEFAULT_OUTPUTS),
         )
 
 
@@ -219,20 +446,17 @@ class EliteCloudDeviceResource():
 
         
     @staticmethod
-    def from_data(d: dict[str,Any]) -> 'list[EliteCloudDeviceResource]':
+    def from_data(d: dict[str,Any], datapoints: list[EliteCloudDatapoint]) -> 'list[EliteCloudDeviceResource]':
         """
         get struct that defines properties for this datapoint
         """
         result: list[EliteCloudDeviceResource] = []
+        index = _index(d)
         
-        for datapoint in EliteCloudDatapoint.for_all():
+        for datapoint in datapoints:
             try:
-                if datapoint.rpath.startswith('='):
-                    # Predefined constant result
-                    r = DATAPATHS_CONST.get(datapoint.rpath)
-                else:
-                    # Lookup the resource struct for this datapoint
-                    r = Jsonata(datapoint.rpath).evaluate(d)
+                # Lookup the resource struct for this datapoint
+                r = _extractor(datapoint.rpath)(d, index)
                 
                 if not isinstance(r, dict):
                     continue
@@ -258,6 +482,11 @@ class EliteCloudDeviceResource():
         """
         result: list[EliteCloudDeviceResource] = []
         for r in l:
+            if isinstance(r, (list, tuple)):
+                # Compact form as kept in the device store
+                result.append( EliteCloudDeviceResource(*r) )
+                continue
+
             res = EliteCloudDeviceResource(
                 key = r.get('key'),
                 name = r.get("name"),
@@ -274,41 +503,126 @@ class EliteCloudDeviceResource():
 class EliteCloudDeviceStatus():
 
     uuid: str
-    _statuses: dict[str,str]
+    _statuses: dict[str,str]                                    # String view of the values
+    _values: dict[str,Any] = field(default_factory=dict)      # Values decoded according to the datapoint fmt
 
     def get(self, key: str, default=None) -> str:
         return self._statuses.get(key, default)
 
 
+    def get_value(self, key: str, default=None) -> Any:
+        return self._values.get(key, default)
+
+
     @staticmethod
-    def from_data(uuid:str, d: dict[str,Any]) -> 'EliteCloudDeviceStatus':
+    def decode_value(fmt: str, val: Any) -> Any:
+        """
+        Convert a value as returned from the remote server according to the datapoint fmt
+        """
+        if val is None:
+            return None
+        
+        # Some EliteCloud values are returned as array; i.e. input[idx=1].status == ['open']
+        if isinstance(val, list):
+            return tuple( sys.intern(str(i)) for i in val if i is not None )
+        
+        match fmt[:1]:
+            case 'b': 
+                return val if isinstance(val, bool) else str(val).lower() in ('true', '1', 'on')
+            case 'i': 
+                return int(val)
+            case 'f': 
+                return round(float(val), int(fmt[1:])) if fmt[1:] else float(val)
+            case 't':
+                if isinstance(val, (int, float)):
+                    return datetime.fromtimestamp(val, timezone.utc)
+                return datetime.fromisoformat(str(val))
+            case _:   
+                return sys.intern(str(val))
+
+
+    @staticmethod
+    def to_str(val: Any) -> str:
+        """
+        String view of a decoded value, as used before values were decoded
+        """
+        if isinstance(val, tuple):
+            return sys.intern(str.join(',', val))
+        if isinstance(val, datetime):
+            return val.isoformat()
+        return str(val)
+
+
+    @staticmethod
+    def from_data(uuid:str, d: dict[str,Any], device: EliteCloudDeviceConfig = None, sections: frozenset[str] = None) -> 'EliteCloudDeviceStatus':
         """
         get struct that defines properties for this datapoint
         """
+        return EliteCloudDeviceStatus._decode(uuid, d, EliteCloudDatapoint.status_extractors(device, sections))
+
+
+    @staticmethod
+    def _decode(uuid:str, d: dict[str,Any], extractors: tuple[tuple[EliteCloudDatapoint, Callable], ...]) -> 'EliteCloudDeviceStatus':
+        """
+        Decode a site status payload with precompiled extractors
+        """
         statuses: dict[str,str] = {}
+        values: dict[str,Any] = {}
+        index = _index(d)
         
-        for datapoint in EliteCloudDatapoint.for_all():
+        for datapoint,extract in extractors:
             try:
-                if datapoint.spath.startswith('='):
-                    # Predefined constant result
-                    val = DATAPATHS_CONST.get(datapoint.spath)
-                else:
-                    # Lookup the resource struct for this datapoint
-                    val = Jsonata(datapoint.spath).evaluate(d)
-                
-                # Some EliteCloud values are returned as array; i.e. input[idx=1].status == ['open']
-                if isinstance(val, list):
-                    val = str.join(',', [str(i) for i in val if i is not None])
-                else:
-                    val = str(val)
+                val = extract(d, index)
+                val = EliteCloudDeviceStatus.decode_value(datapoint.fmt, val)
 
-                statuses[datapoint.key] = val
+                values[datapoint.key] = val
+                statuses[datapoint.key] = EliteCloudDeviceStatus.to_str(val)
             
             except Exception as ex:
                 _LOGGER.debug(f"Could not resolve path {datapoint.spath} for {datapoint.key}: {str(ex)}")
 
         return EliteCloudDeviceStatus(
             uuid = uuid,
-            _statuses = statuses
+            _statuses = statuses,
+            _values = values,
         )
 
+
+class EliteCloudBatchDecoder():
+    """
+    Decode the payloads of many sites in one pass.
+    The extractors are compiled once per panel size and selected sections and shared by all sites,
+    as are the index per payload and the interned status strings.
+    Decoding does not touch the event loop, so a batch can be run in an executor.
+    """
+
+    @staticmethod
+    def decode_devices(sites: list[dict[str,Any]]) -> list[EliteCloudDeviceConfig]:
+        """
+        Decode the device configs of sites that were fetched together with their resources
+        """
+        return [ EliteCloudDeviceConfig.from_data(site) for site in sites ]
+
+
+    @staticmethod
+    def decode_statuses(payloads: list[tuple[str, dict[str,Any], EliteCloudDeviceConfig]], sections: frozenset[str] = None) -> list[EliteCloudDeviceStatus]:
+        """
+        Decode the statuses of sites, given as tuples of site uuid, status payload and device config
+        """
+        return [ 
+            EliteCloudDeviceStatus._decode(uuid, d, EliteCloudDatapoint.status_extractors(device, sections))
+            for uuid,d,device in payloads
+        ]
+
+
+def cache_info() -> dict[str, Any]:
+    """
+    Statistics of the decode caches in this module, shared by all accounts
+    """
+    return {
+        "jsonata": _jsonata.cache_info(),
+        "extractor": _extractor.cache_info(),
+        "datapoints": EliteCloudDatapoint._resolve_all.cache_info(),
+        "status_extractors": EliteCloudDatapoint._compile_status.cache_info(),
+        "value_maps": EliteCloudValueMap.for_datapoint.cache_info(),
+    }
@@ -40,6 +40,7 @@ async def async_get_config_entry_diagnostics(hass: HomeAssistant, config_entry:
             "data": config_entry.data,
             "options": config_entry.options,
         },
+        "devices": coordinator.devices,
         "coordinator": await coordinator.async_get_diagnostics(),
         "api": await coordinator._api.async_get_diagnostics(), 
     }
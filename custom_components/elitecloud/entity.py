@@ -1,38 +1,26 @@
 import logging
 import re
+import time
 
 from dataclasses import dataclass
-from datetime import datetime
+from functools import lru_cache
 from typing import Any, Self
 
 from homeassistant.components.binary_sensor import BinarySensorDeviceClass
-from homeassistant.components.number import NumberDeviceClass
-from homeassistant.components.sensor import SensorDeviceClass
-from homeassistant.components.sensor import SensorStateClass
 from homeassistant.const import EntityCategory
-from homeassistant.const import PERCENTAGE
-from homeassistant.const import SIGNAL_STRENGTH_DECIBELS
-from homeassistant.const import SIGNAL_STRENGTH_DECIBELS_MILLIWATT
-from homeassistant.const import UnitOfInformation
-from homeassistant.const import UnitOfElectricCurrent
-from homeassistant.const import UnitOfElectricPotential
-from homeassistant.const import UnitOfEnergy
-from homeassistant.const import UnitOfLength
-from homeassistant.const import UnitOfPower
-from homeassistant.const import UnitOfPressure
-from homeassistant.const import UnitOfVolume
-from homeassistant.const import UnitOfVolumeFlowRate
-from homeassistant.const import UnitOfTemperature
-from homeassistant.const import UnitOfTime
+from homeassistant.core import callback
 from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.restore_state import ExtraStoredData, RestoreEntity
 
 from .const import (
     DOMAIN,
     ATTR_DATA_VALUE,
     ATTR_STORED_DATA_VALUE,
+    COMMAND_CONFIRM_TIMEOUT,
+    CONF_RAW_VALUE,
+    DEFAULT_RAW_VALUE,
     PREFIX_ID,
-    utcnow,
 )
 from .coordinator import (
     EliteCloudCoordinator,
@@ -46,6 +34,10 @@ from .data import (
 # Define logger
 _LOGGER = logging.getLogger(__name__)
 
+# Precompiled patterns for create_id
+_RE_ID_SEPARATORS = re.compile('[ -]')
+_RE_ID_INVALID = re.compile('[^a-z0-9_]+')
+
 
 @dataclass
 class EliteCloudEntityExtraData(ExtraStoredData):
@@ -66,11 +58,111 @@ class EliteCloudEntityExtraData(ExtraStoredData):
         )
 
 
+@dataclass(frozen=True)
+class EliteCloudEntityDescription:
+    """
+    Static entity properties derived from a datapoint and its resource icon.
+    These are the same for every site, so they are built once and shared.
+    """
+    unit: str | None
+    entity_category: EntityCategory | None
+    entity_enabled_default: bool
+    binary_sensor_device_class: BinarySensorDeviceClass | None
+
+    @staticmethod
+    def build(datapoint: EliteCloudDatapoint, icon: str) -> 'EliteCloudEntityDescription':
+        return EliteCloudEntityDescription(
+            unit = EliteCloudEntityDescription._build_unit(datapoint),
+            entity_category = EliteCloudEntityDescription._build_entity_category(datapoint),
+            entity_enabled_default = EliteCloudEntityDescription._build_entity_enabled_default(datapoint),
+            binary_sensor_device_class = EliteCloudEntityDescription._build_binary_sensor_device_class(datapoint, icon),
+        )
+
+
+    @staticmethod
+    def _build_unit(datapoint: EliteCloudDatapoint):
+        """Convert from Datapoint unit abbreviation to Home Assistant units"""
+        match datapoint.unit:
+            case '' | None: return None
+            
+            case _:
+                _LOGGER.warning(f"Encountered a unit or measurement '{datapoint.unit}' for '{datapoint.key}' that may not be supported by Home Assistant. Please contact the integration developer to have this resolved.")
+                return datapoint.unit
+    
+
+    @staticmethod
+    def _build_binary_sensor_device_class(datapoint: EliteCloudDatapoint, icon: str):
+        """Return one of the BinarySensorDeviceClass.xyz or None"""
+        match datapoint.sec:
+            case 'area':     return None                            # On/Off
+            case 'output':   return None                            # On/Off
+            case 'tamper':   return BinarySensorDeviceClass.PROBLEM # or TAMPER: Tamper/clear
+            case 'system':   return BinarySensorDeviceClass.PROBLEM # problem/ok
+            case 'keypad':   return BinarySensorDeviceClass.PROBLEM # problem/ok
+
+        match icon:
+            case 'ic_s_running':     return BinarySensorDeviceClass.MOTION
+            case 'ic_s_detect_body': return BinarySensorDeviceClass.MOTION
+            case 'ic_s_detect_bottom': return BinarySensorDeviceClass.MOTION
+            case 'ic_s_detect_top': return BinarySensorDeviceClass.MOTION
+            case 'ic_s_detect_co2': return BinarySensorDeviceClass.CO
+            case 'ic_s_detect_fire': return BinarySensorDeviceClass.SMOKE
+            case 'ic_s_detect_odor': return BinarySensorDeviceClass.GAS
+            case 'ic_s_window_closes': return BinarySensorDeviceClass.WINDOW
+            case 'ic_s_window_open': return BinarySensorDeviceClass.WINDOW
+            case 'ic_s_door_closed': return BinarySensorDeviceClass.DOOR
+            case 'ic_s_front_door_open': return BinarySensorDeviceClass.DOOR
+            case 'ic_s_front_door_closed': return BinarySensorDeviceClass.DOOR
+            case 'ic_s_room_door_open': return BinarySensorDeviceClass.DOOR
+            case 'ic_s_room_door_closed': return BinarySensorDeviceClass.DOOR
+            case 'ic_s_double_swing_gate_open': return BinarySensorDeviceClass.DOOR
+            case 'ic_s_double_swing_gate_closed': return BinarySensorDeviceClass.DOOR
+            case 'ic_s_double_sliding_gate_open': return BinarySensorDeviceClass.DOOR
+            case 'ic_s_single_sliding_gate_open': return BinarySensorDeviceClass.DOOR
+            case 'ic_s_pedestrian_gate': return BinarySensorDeviceClass.DOOR
+            case 'ic_s_garage_open': return BinarySensorDeviceClass.GARAGE_DOOR
+            case 'ic_s_garage_closing': return BinarySensorDeviceClass.GARAGE_DOOR
+            case 'ic_s_garage_half_open': return BinarySensorDeviceClass.GARAGE_DOOR
+            case 'ic_s_garage_closed': return BinarySensorDeviceClass.GARAGE_DOOR
+            case 'ic_s_storage': return BinarySensorDeviceClass.GARAGE_DOOR
+            case 'ic_s_door_lock': return BinarySensorDeviceClass.LOCK
+            case 'ic_s_card_door_lock': return BinarySensorDeviceClass.LOCK
+            case 'ic_s_padlock': return BinarySensorDeviceClass.LOCK
+            case 'ic_s_thermometer': return BinarySensorDeviceClass.HEAT
+
+        return None
+
+    
+    @staticmethod
+    def _build_entity_category(datapoint: EliteCloudDatapoint):
+        # Return EntityCategory as configured in DATASET
+        match datapoint.flag_category:
+            case "conf":    return EntityCategory.CONFIG
+            case "diag":    return EntityCategory.DIAGNOSTIC
+            case "none":    return None
+            case _:         return None
+
+
+    @staticmethod
+    def _build_entity_enabled_default(datapoint: EliteCloudDatapoint):
+        # Return EntityEnabled as configured in DATASET
+        match datapoint.flag_enabled:
+            case 'd': return False
+            case 'e': return True
+            case _:   return True
+
+
 class EliteCloudEntity(RestoreEntity):
     """
     Common funcionality for all Entities:
     (EliteCloudSensor, EliteCloudBinarySensor, ...)
     """
+
+    # The raw value changes with every state change; no need to write it to the recorder database
+    _unrecorded_attributes = frozenset({ATTR_DATA_VALUE})
+
+    # Static entity properties per (datapoint key, resource icon), shared by all sites
+    _descriptions: dict[tuple[str,str], EliteCloudEntityDescription] = {}
     
     def __init__(self, coordinator: EliteCloudCoordinator, device: EliteCloudDeviceConfig, resource: EliteCloudDeviceResource, datapoint: EliteCloudDatapoint):
 
@@ -79,6 +171,7 @@ class EliteCloudEntity(RestoreEntity):
         self._device = device
         self._resource = resource
         self._datapoint = datapoint
+        self._description = EliteCloudEntity.get_description(datapoint, resource)
 
         # The unique identifiers for this sensor within Home Assistant
         self.object_id       = EliteCloudEntity.create_id(PREFIX_ID, device.uuid, datapoint.key) # elitecontrol_<device_uuid>_<key>
@@ -97,6 +190,19 @@ class EliteCloudEntity(RestoreEntity):
 
         # Attributes to be restored in the next HA run
         self._data_value: Any = None     # Original data value as returned from Api
+        self._data_decoded: Any = None   # Same value, decoded according to the datapoint fmt
+
+        # Entity attributes, only rebuilt when the data value changes
+        self._raw_value: bool = coordinator.options.get(CONF_RAW_VALUE, DEFAULT_RAW_VALUE)
+        self._state_attr: dict[str, Any] = {}
+
+        # Optimistic state after sending a command, until a push confirms it
+        self._optimistic_state: Any = None
+        self._optimistic_confirm: set[Any] = set()
+        self._optimistic_command: str = None
+        self._optimistic_start: float = 0
+        self._optimistic_unsub = None
+        self._optimistic_seq: int = 0
 
         # Derived properties
         self._unit = self.get_unit()        # don't apply directly to _attr_unit, some entities don't have it
@@ -122,12 +228,7 @@ class EliteCloudEntity(RestoreEntity):
         """
         Return the state attributes to display in entity attributes.
         """
-        state_attr = {}
-
-        if self._data_value is not None:
-            state_attr[ATTR_DATA_VALUE] = self._data_value
-
-        return state_attr        
+        return self._state_attr
 
 
     @property
@@ -141,10 +242,25 @@ class EliteCloudEntity(RestoreEntity):
     
 
     @staticmethod
+    def get_description(datapoint: EliteCloudDatapoint, resource: EliteCloudDeviceResource) -> EliteCloudEntityDescription:
+        """
+        Get the shared static properties for a datapoint and resource icon
+        """
+        key = (datapoint.key, resource.icon)
+        description = EliteCloudEntity._descriptions.get(key)
+        if description is None:
+            description = EliteCloudEntityDescription.build(datapoint, resource.icon)
+            EliteCloudEntity._descriptions[key] = description
+
+        return description
+    
+
+    @staticmethod
+    @lru_cache(maxsize=1024)
     def create_id(*args):
         s = '_'.join(str(item) for item in args if item is not None).strip('_')
-        s = re.sub('[ -]', '_', s)
-        s = re.sub('[^a-z0-9_]+', '', s.lower())
+        s = _RE_ID_SEPARATORS.sub('_', s)
+        s = _RE_ID_INVALID.sub('', s.lower())
         return s            
     
     
@@ -164,37 +280,162 @@ class EliteCloudEntity(RestoreEntity):
             data_value = dict_extra.get(ATTR_STORED_DATA_VALUE)
 
             self._update_value(data_value, force=True)
+
+        # Push data may already have arrived while the platforms were being setup.
+        # It is more recent than the restored data, so apply it now.
+        value, decoded = self._get_status_value()
+
+        if value is not None:
+            self._update_value(value, decoded=decoded)
+
+
+    def _get_status_value(self) -> tuple[str | None, Any]:
+        """
+        Get the string view and the decoded value for this entity from the coordinator data
+        """
+        data = self._coordinator.data
+        status = data.get(self._device.uuid) if data is not None else None
+        if status is None:
+            return None, None
+        
+        return status.get(self._datapoint.key), status.get_value(self._datapoint.key)
     
 
-    def _update_value(self, data_value: Any, force:bool=False) -> bool:
+    def _get_state_attr(self) -> dict[str, Any]:
+        """
+        Build the state attributes for the current data value
+        """
+        state_attr = {}
+
+        if self._raw_value and self._data_value is not None:
+            state_attr[ATTR_DATA_VALUE] = self._data_value
+
+        return state_attr
+
+
+    def _update_value(self, data_value: Any, force:bool=False, decoded: Any=None) -> bool:
         """
-        Process any changes in value
+        Process any changes in value.
+        The string view in data_value is restored and shown as attribute;
+        the decoded value, if known, is used to determine the entity state.
         
         To be extended by derived entities
         """
+        self._data_decoded = decoded if decoded is not None else data_value
         changed = False
 
         if force or self._data_value != data_value:
 
             self._data_value = data_value
             self._attr_icon = self.get_icon()
+            self._state_attr = self._get_state_attr()
             changed = True
 
 
         return changed
 
 
+    async def async_will_remove_from_hass(self) -> None:
+        """
+        Handle when the entity is about to be removed
+        """
+        self._optimistic_cancel_timeout()
+        await super().async_will_remove_from_hass()
+
+
+    async def _async_command_optimistic(self, command: str, state: Any, confirm: set[Any], async_send) -> None:
+        """
+        Show the expected state immediately, then send the command.
+        The state is rolled back if the command fails or no push confirms it within a timeout.
+        """
+        self._optimistic_cancel_timeout()
+
+        self._optimistic_seq += 1
+        seq = self._optimistic_seq
+
+        self._optimistic_state = state
+        self._optimistic_confirm = confirm
+        self._optimistic_command = command
+        self._optimistic_start = time.monotonic()
+        self._update_value(self._data_value, force=True)
+        self.async_write_ha_state()
+
+        # Returns True when sent, None when nothing needed to be sent, False on failure
+        result = await async_send()
+
+        if seq != self._optimistic_seq:
+            return  # superseded by a newer command
+        
+        if result is False:
+            self._optimistic_end(confirmed=False, reason="command failed")
+
+        elif result is None:
+            # No change to expect, so no confirmation either
+            self._optimistic_end(confirmed=False)
+
+        elif self._optimistic_command is not None:
+            # Wait for a push that confirms the command
+            self._optimistic_unsub = async_call_later(self.hass, COMMAND_CONFIRM_TIMEOUT, self._optimistic_timeout)
+
+
+    def _optimistic_apply(self, state: Any) -> Any:
+        """
+        Called with the state derived from the data value.
+        Returns the state to show, which is the optimistic state while waiting for confirmation.
+        """
+        if self._optimistic_command is None:
+            return state
+        
+        if state in self._optimistic_confirm:
+            self._optimistic_end(confirmed=True)
+            return state
+        
+        return self._optimistic_state
+
+
+    @callback
+    def _optimistic_timeout(self, _now) -> None:
+        self._optimistic_unsub = None
+        self._optimistic_end(confirmed=False, reason=f"no confirmation within {COMMAND_CONFIRM_TIMEOUT} seconds")
+
+
+    def _optimistic_end(self, confirmed: bool, reason: str = None):
+        """
+        Stop showing the optimistic state and record the round trip.
+        Without confirmation, the state is rolled back; with a reason this is reported as a mismatch.
+        """
+        command = self._optimistic_command
+        if command is None:
+            return
+        
+        latency = time.monotonic() - self._optimistic_start
+        self._optimistic_command = None
+        self._optimistic_cancel_timeout()
+
+        if confirmed or reason:
+            self._coordinator.record_command_roundtrip(command, latency, confirmed)
+
+        if not confirmed and reason:
+            # Whatever was pending did not happen as expected; start again from the actual state
+            self._coordinator.clear_target(self._device, self._datapoint)
+
+        if not confirmed:
+            # Roll back to the state derived from the actual data value
+            if reason:
+                _LOGGER.warning(f"Command '{command}' for '{self.entity_id}' was not confirmed ({reason}); state reverted to '{self._data_value}'")
+            if self._update_value(self._data_value, force=True) and self.hass is not None:
+                self.async_write_ha_state()
+
+
+    def _optimistic_cancel_timeout(self):
+        if self._optimistic_unsub is not None:
+            self._optimistic_unsub()
+            self._optimistic_unsub = None
+
+
     def get_unit(self):
         """Convert from Datapoint unit abbreviation to Home Assistant units"""
-        if self._datapoint is None:
-            return None
-        
-        match self._datapoint.unit:
-            case '' | None: return None
-            
-            case _:
-                _LOGGER.warning(f"Encountered a unit or measurement '{self._datapoint.unit}' for '{self._datapoint.key}' that may not be supported by Home Assistant. Please contact the integration developer to have this resolved.")
-                return self._datapoint.unit
+        return self._description.unit
     
         
     def get_icon(self):
@@ -212,59 +453,15 @@ class EliteCloudEntity(RestoreEntity):
     
     def get_binary_sensor_device_class(self):
         """Return one of the BinarySensorDeviceClass.xyz or None"""
-        match self._datapoint.sec:
-            case 'area':     return None                            # On/Off
-            case 'output':   return None                            # On/Off
-            case 'tamper':   return BinarySensorDeviceClass.PROBLEM # or TAMPER: Tamper/clear
-            case 'system':   return BinarySensorDeviceClass.PROBLEM # problem/ok
-            case 'keypad':   return BinarySensorDeviceClass.PROBLEM # problem/ok
-
-        match self._resource.icon:
-            case 'ic_s_running':     return BinarySensorDeviceClass.MOTION
-            case 'ic_s_detect_body': return BinarySensorDeviceClass.MOTION
-            case 'ic_s_detect_bottom': return BinarySensorDeviceClass.MOTION
-            case 'ic_s_detect_top': return BinarySensorDeviceClass.MOTION
-            case 'ic_s_detect_co2': return BinarySensorDeviceClass.CO
-            case 'ic_s_detect_fire': return BinarySensorDeviceClass.SMOKE
-            case 'ic_s_detect_odor': return BinarySensorDeviceClass.GAS
-            case 'ic_s_window_closes': return BinarySensorDeviceClass.WINDOW
-            case 'ic_s_window_open': return BinarySensorDeviceClass.WINDOW
-            case 'ic_s_door_closed': return BinarySensorDeviceClass.DOOR
-            case 'ic_s_front_door_open': return BinarySensorDeviceClass.DOOR
-            case 'ic_s_front_door_closed': return BinarySensorDeviceClass.DOOR
-            case 'ic_s_room_door_open': return BinarySensorDeviceClass.DOOR
-            case 'ic_s_room_door_closed': return BinarySensorDeviceClass.DOOR
-            case 'ic_s_double_swing_gate_open': return BinarySensorDeviceClass.DOOR
-            case 'ic_s_double_swing_gate_closed': return BinarySensorDeviceClass.DOOR
-            case 'ic_s_double_sliding_gate_open': return BinarySensorDeviceClass.DOOR
-            case 'ic_s_single_sliding_gate_open': return BinarySensorDeviceClass.DOOR
-            case 'ic_s_pedestrian_gate': return BinarySensorDeviceClass.DOOR
-            case 'ic_s_garage_open': return BinarySensorDeviceClass.GARAGE_DOOR
-            case 'ic_s_garage_closing': return BinarySensorDeviceClass.GARAGE_DOOR
-            case 'ic_s_garage_half_open': return BinarySensorDeviceClass.GARAGE_DOOR
-            case 'ic_s_garage_closed': return BinarySensorDeviceClass.GARAGE_DOOR
-            case 'ic_s_storage': return BinarySensorDeviceClass.GARAGE_DOOR
-            case 'ic_s_door_lock': return BinarySensorDeviceClass.LOCK
-            case 'ic_s_card_door_lock': return BinarySensorDeviceClass.LOCK
-            case 'ic_s_padlock': return BinarySensorDeviceClass.LOCK
-            case 'ic_s_thermometer': return BinarySensorDeviceClass.HEAT
-
-        return None
+        return self._description.binary_sensor_device_class
 
     
     def get_entity_category(self):
         # Return EntityCategory as configured in DATASET
-        match self._datapoint.flag_category:
-            case "conf":    return EntityCategory.CONFIG
-            case "diag":    return EntityCategory.DIAGNOSTIC
-            case "none":    return None
-            case _:         return None
+        return self._description.entity_category
 
 
     def get_entity_enabled_default(self):
         # Return EntityEnabled as configured in DATASET
-        match self._datapoint.flag_enabled:
-            case 'd': return False
-            case 'e': return True
-            case _:   return True
+        return self._description.entity_enabled_default
 
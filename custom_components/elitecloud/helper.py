@@ -7,18 +7,16 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 import homeassistant.helpers.entity_registry as entity_registry
 
-from .const import (
-    PLATFORMS,
-    BINARY_SENSOR_VALUES_ALL,
-)
 from .coordinator import (
     EliteCloudCoordinatorFactory,
-    EliteCloudCoordinator
 )
 from .data import (
     EliteCloudDatapoint,
     EliteCloudDeviceResource,
 )
+from .profiler import (
+    PROFILER,
+)
 
 
 _LOGGER = logging.getLogger(__name__)
@@ -45,22 +43,26 @@ class EliteCloudEntityHelper:
         entities = []
         valid_unique_ids: list[str] = []
 
-        for device in self._coordinator.devices.values():
-            for datapoint in EliteCloudDatapoint.for_platform(target_platform):
+        # Creating the entities is part of the setup path that can be profiled
+        with PROFILER.section():
+            for device in self._coordinator.devices.values():
+                resources: dict[str, EliteCloudDeviceResource] = { r.key: r for r in device.resources }
+
+                for datapoint in EliteCloudDatapoint.for_platform(target_platform, device, self._coordinator.sections):
 
-                resource: EliteCloudDeviceResource = next( (r for r in device.resources if r.key==datapoint.key), None )
-                if resource is None or not resource.is_active:
-                    continue
+                    resource: EliteCloudDeviceResource = resources.get(datapoint.key)
+                    if resource is None or not resource.is_active:
+                        continue
 
-                # Create a Sensor, Binary_Sensor, Number, Select, Switch or other entity for this datapoint
-                try:
-                    entity = target_class(self._coordinator, device, resource, datapoint)
-                    entities.append(entity)
+                    # Create a Sensor, Binary_Sensor, Number, Select, Switch or other entity for this datapoint
+                    try:
+                        entity = target_class(self._coordinator, device, resource, datapoint)
+                        entities.append(entity)
 
-                    valid_unique_ids.append(entity.unique_id)
+                        valid_unique_ids.append(entity.unique_id)
 
-                except Exception as  ex:
-                    _LOGGER.warning(f"Could not instantiate {target_platform} entity class for {device.uuid}:{datapoint.key}. Details: {ex}")
+                    except Exception as  ex:
+                        _LOGGER.warning(f"Could not instantiate {target_platform} entity class for {device.uuid}:{datapoint.key}. Details: {ex}")
 
         # Remember valid unique_ids per platform so we can do an entity cleanup later
         self._coordinator.set_valid_unique_ids(target_platform, valid_unique_ids)
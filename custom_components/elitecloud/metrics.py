@@ -0,0 +1,263 @@
+"""metrics.py: Accounting of the calls to the Elite Cloud servers and export of metrics."""
+
+import logging
+import time
+
+from aiohttp import web
+from collections import defaultdict, deque
+from typing import Any
+
+from homeassistant.components.http import HomeAssistantView
+from homeassistant.core import HomeAssistant
+
+from .const import (
+    DOMAIN,
+    COORDINATOR,
+    CONF_METRICS_VIEW,
+    DEFAULT_METRICS_VIEW,
+    METRICS_ENDPOINTS,
+    METRICS_LATENCY_SAMPLES,
+    METRICS_PERCENTILES,
+    METRICS_VIEW_URL,
+    METRICS_WINDOW,
+)
+from .data import (
+    cache_info,
+)
+
+
+# Define logger
+_LOGGER = logging.getLogger(__name__)
+
+# Endpoint for the context of the http requests made by the pyelitecloud library, by context prefix
+_CONTEXT_ENDPOINTS = (
+    ("login", "login"),
+    ("fetch sites", "sites"),
+    ("accept site-invite", "sites"),
+    ("fetch site-", "resources"),
+    ("command", "command"),
+    ("subscribe", "subscribe"),
+)
+
+
+class EliteCloudEndpointMetrics:
+    """Counters and timing of the calls to one endpoint"""
+
+    def __init__(self):
+        self.calls: int = 0
+        self.errors: int = 0
+        self.bytes: int = 0
+
+        # Most recent latencies, for the percentiles
+        self._latencies: deque[float] = deque(maxlen=METRICS_LATENCY_SAMPLES)
+
+        # Moment of the calls within the window, for the calls per hour
+        self._recent: deque[float] = deque()
+
+
+    def record(self, now: float, latency: float | None, error: bool, nbytes: int):
+        self.calls += 1
+        self.errors += 1 if error else 0
+        self.bytes += nbytes
+        self._recent.append(now)
+
+        if latency is not None:
+            self._latencies.append(latency)
+
+
+    def record_latency(self, latency: float):
+        self._latencies.append(latency)
+
+
+    def calls_in_window(self, now: float | None = None) -> int:
+        """
+        Number of calls within the last window (one hour)
+        """
+        now = now if now is not None else time.monotonic()
+        while self._recent and self._recent[0] < now - METRICS_WINDOW:
+            self._recent.popleft()
+        return len(self._recent)
+
+
+    def percentile(self, pct: int) -> float | None:
+        """
+        Latency percentile in seconds over the most recent calls; None if there were no calls yet
+        """
+        if not self._latencies:
+            return None
+
+        ordered = sorted(self._latencies)
+        idx = min(len(ordered)-1, round(pct/100 * (len(ordered)-1)))
+        return ordered[idx]
+
+
+    def get_diagnostics(self, now: float) -> dict[str, Any]:
+        latencies = { f"p{pct}": self.percentile(pct) for pct in METRICS_PERCENTILES }
+        return {
+            "calls": self.calls,
+            "calls_per_hour": self.calls_in_window(now),
+            "errors": self.errors,
+            "bytes": self.bytes,
+            "latency": { k: round(v, 3) if v is not None else None for k,v in latencies.items() },
+        }
+
+
+class EliteCloudRequestMetrics:
+    """
+    Per account accounting of the calls to the Elite Cloud servers.
+
+    Counts calls, errors and bytes received and keeps latencies for each endpoint
+    (login, sites, resources, status, command and subscribe), plus the calls per site.
+    """
+
+    def __init__(self):
+        self._endpoints: dict[str, EliteCloudEndpointMetrics] = { endpoint: EliteCloudEndpointMetrics() for endpoint in METRICS_ENDPOINTS }
+        self._sites: dict[str, int] = defaultdict(int)
+
+
+    @staticmethod
+    def endpoint_for(context: str) -> str | None:
+        """
+        Endpoint for the context of a http request as made by the pyelitecloud library
+        """
+        context = context.lower() if context else ""
+        return next( (endpoint for prefix,endpoint in _CONTEXT_ENDPOINTS if context.startswith(prefix)), None )
+
+
+    def record(self, endpoint: str, site_uuid: str, latency: float | None, error: bool = False, nbytes: int = 0):
+        """
+        Account for a call to an endpoint. Without latency, it can be added later via record_latency.
+        """
+        metrics = self._endpoints.get(endpoint)
+        if metrics is None:
+            return
+
+        metrics.record(time.monotonic(), latency, error, nbytes)
+        if site_uuid:
+            self._sites[site_uuid] += 1
+
+
+    def record_latency(self, endpoint: str, latency: float):
+        """
+        Add the latency of a call that was accounted for before
+        """
+        metrics = self._endpoints.get(endpoint)
+        if metrics is not None:
+            metrics.record_latency(latency)
+
+
+    def get(self, endpoint: str) -> EliteCloudEndpointMetrics | None:
+        return self._endpoints.get(endpoint)
+
+
+    @property
+    def bytes_received(self) -> int:
+        return sum( m.bytes for m in self._endpoints.values() )
+
+
+    def calls_per_hour(self) -> int:
+        now = time.monotonic()
+        return sum( m.calls_in_window(now) for m in self._endpoints.values() )
+
+
+    def calls_per_hour_per_site(self, sites: int) -> float | None:
+        return round(self.calls_per_hour() / sites, 1) if sites else None
+
+
+    def get_diagnostics(self, sites: int) -> dict[str, Any]:
+        now = time.monotonic()
+        return {
+            "calls_per_hour": self.calls_per_hour(),
+            "calls_per_hour_per_site": self.calls_per_hour_per_site(sites),
+            "bytes_received": self.bytes_received,
+            "endpoints": { endpoint: m.get_diagnostics(now) for endpoint,m in self._endpoints.items() },
+            "sites": dict(self._sites),
+        }
+
+
+class EliteCloudPrometheusWriter:
+    """
+    Collects metric samples and renders them in the Prometheus text exposition format
+    """
+
+    def __init__(self):
+        # Metric name -> (type, help, sample lines)
+        self._families: dict[str, tuple[str, str, list[str]]] = {}
+
+
+    def add(self, name: str, kind: str, help: str, value: Any, labels: dict[str, str], suffix: str = ""):
+        """
+        Add a sample. Use the suffix for the _sum and _count samples of a summary.
+        """
+        if value is None:
+            return
+        
+        _,_,samples = self._families.setdefault(name, (kind, help, []))
+
+        label_str = ",".join( f'{k}="{EliteCloudPrometheusWriter._escape(v)}"' for k,v in labels.items() )
+        label_str = f"{{{label_str}}}" if label_str else ""
+        samples.append( f"{name}{suffix}{label_str} {EliteCloudPrometheusWriter._format(value)}" )
+
+
+    def render(self) -> str:
+        lines: list[str] = []
+        for name,(kind,help,samples) in self._families.items():
+            lines.append(f"# HELP {name} {help}")
+            lines.append(f"# TYPE {name} {kind}")
+            lines.extend(samples)
+
+        return "\n".join(lines) + "\n"
+
+
+    @staticmethod
+    def _escape(value: Any) -> str:
+        return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+    @staticmethod
+    def _format(value: Any) -> str:
+        if isinstance(value, bool):
+            return "1" if value else "0"
+        if isinstance(value, float):
+            return repr(round(value, 6))
+        return str(value)
+
+
+class EliteCloudMetricsView(HomeAssistantView):
+    """
+    Metrics of the accounts that have the metrics endpoint enabled, in Prometheus text format.
+    Requires a Home Assistant access token, like the rest of the api.
+    """
+
+    url = METRICS_VIEW_URL
+    name = f"api:{DOMAIN}:metrics"
+    requires_auth = True
+
+    def __init__(self, hass: HomeAssistant):
+        self._hass = hass
+
+
+    async def get(self, request: web.Request) -> web.Response:
+        """
+        Export the metrics of all enabled accounts
+        """
+        coordinators = [
+            coordinator for coordinator in self._hass.data.get(DOMAIN, {}).get(COORDINATOR, {}).values()
+            if coordinator.options.get(CONF_METRICS_VIEW, DEFAULT_METRICS_VIEW)
+        ]
+        if not coordinators:
+            return web.Response(status=404)
+        
+        writer = EliteCloudPrometheusWriter()
+        for coordinator in coordinators:
+            coordinator.add_metrics(writer)
+
+        # Caches shared by all accounts
+        for cache,info in cache_info().items():
+            writer.add(f"{DOMAIN}_cache_hits_total", "counter", "Hits of the decode caches", info.hits, {"cache": cache})
+            writer.add(f"{DOMAIN}_cache_misses_total", "counter", "Misses of the decode caches", info.misses, {"cache": cache})
+
+        return web.Response(
+            body = writer.render().encode(),
+            headers = {"Content-Type": "text/plain; version=0.0.4; charset=utf-8"},
+        )
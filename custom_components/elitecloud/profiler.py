@@ -0,0 +1,150 @@
+"""profiler.py: On demand profiling of the push and setup paths of the Elite Cloud integration."""
+
+import asyncio
+import cProfile
+import io
+import logging
+import pstats
+
+from contextlib import contextmanager, nullcontext
+from datetime import datetime
+
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
+
+from .const import (
+    DOMAIN,
+    PROFILE_SORT,
+)
+
+
+# Define logger
+_LOGGER = logging.getLogger(__name__)
+
+# Returned when not profiling; a nullcontext can be re-entered
+_NOT_PROFILING = nullcontext()
+
+
+class EliteCloudProfiler:
+    """
+    On demand cProfile of only the sections of this integration that are marked via section();
+    handling of pushes, decoding, dispatch to the coordinator and entity updates, and entity setup.
+
+    cProfile can only profile one thing at a time in a process, so there is one shared instance.
+    The sections must not await; while enabled, anything else the event loop runs would be profiled too.
+    """
+
+    def __init__(self):
+        self._profile: cProfile.Profile | None = None
+        self._running: bool = False
+        self._conflict: str | None = None
+        self._depth: int = 0
+        self._sections: int = 0
+
+
+    @property
+    def active(self) -> bool:
+        return self._running
+
+
+    def start(self):
+        """
+        Start collecting profile data in the marked sections
+        """
+        if self._running:
+            raise HomeAssistantError("Profiling of Elite Cloud is already running")
+
+        self._profile = cProfile.Profile()
+        self._running = True
+        self._conflict = None
+        self._depth = 0
+        self._sections = 0
+
+
+    def stop(self) -> tuple[cProfile.Profile | None, int]:
+        """
+        Stop collecting profile data. Returns the profile and the number of sections profiled.
+        Raises HomeAssistantError if profiling had to stop early because of another profiler.
+        """
+        profile, self._profile = self._profile, None
+        self._running = False
+
+        if self._conflict is not None:
+            raise HomeAssistantError(f"Profiling of Elite Cloud stopped early; {self._conflict}")
+        
+        return profile, self._sections
+
+
+    def section(self):
+        """
+        Context manager that marks a section to profile. Next to nothing when not profiling.
+        """
+        return self._section() if self._profile is not None else _NOT_PROFILING
+
+
+    @contextmanager
+    def _section(self):
+        profile = self._profile
+
+        # Nested sections are part of the outer section
+        if self._depth > 0:
+            yield
+            return
+
+        try:
+            profile.enable()
+        except ValueError as ex:
+            # Another profiler, like the Home Assistant profiler integration, is active
+            _LOGGER.warning(f"Stop profiling of Elite Cloud: {ex}")
+            self._conflict = f"another profiler is active: {ex}"
+            self._profile = None
+            yield
+            return
+
+        self._depth += 1
+        self._sections += 1
+        try:
+            yield
+        finally:
+            self._depth -= 1
+            profile.disable()
+
+
+    async def async_profile(self, hass: HomeAssistant, seconds: float, top: int) -> str:
+        """
+        Profile for the given number of seconds, then write the profile data to a .prof file
+        in the config dir and log a summary of the top functions. Returns the path of the file.
+        """
+        self.start()
+        _LOGGER.warning(f"Start profiling of Elite Cloud for {seconds} seconds")
+        try:
+            await asyncio.sleep(seconds)
+        finally:
+            profile, sections = self.stop()
+
+        path = hass.config.path(f"{DOMAIN}_profile_{datetime.now().strftime('%Y%m%d_%H%M%S')}.prof")
+        summary = await hass.async_add_executor_job(EliteCloudProfiler._write, profile, path, top)
+
+        _LOGGER.warning(f"Profile of Elite Cloud over {sections} sections written to {path}. Top {top} functions:\n{summary}")
+        return path
+
+
+    @staticmethod
+    def _write(profile: cProfile.Profile, path: str, top: int) -> str:
+        """
+        Write the profile data and return the top-N summary. Runs in the executor.
+        """
+        profile.dump_stats(path)
+
+        stream = io.StringIO()
+        try:
+            pstats.Stats(profile, stream=stream).sort_stats(PROFILE_SORT).print_stats(top)
+        except TypeError:
+            # Nothing was profiled
+            return "no data"
+
+        return stream.getvalue()
+
+
+# The shared profiler
+PROFILER = EliteCloudProfiler()
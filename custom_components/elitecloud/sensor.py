@@ -0,0 +1,155 @@
+import logging
+
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Any
+
+from homeassistant.components.sensor import SensorDeviceClass, SensorEntity, SensorStateClass
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import EntityCategory, Platform, UnitOfInformation, UnitOfTime
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+from .const import (
+    DOMAIN,
+    METRICS_ENDPOINTS,
+    METRICS_PERCENTILES,
+    METRICS_SCAN_INTERVAL,
+    PREFIX_ID,
+)
+from .coordinator import (
+    EliteCloudCoordinator,
+    EliteCloudCoordinatorFactory,
+)
+from .entity import (
+    EliteCloudEntity,
+)
+from .metrics import (
+    EliteCloudRequestMetrics,
+)
+
+
+_LOGGER = logging.getLogger(__name__)
+
+# The accounting sensors are not pushed to, so are polled
+SCAN_INTERVAL = timedelta(seconds=METRICS_SCAN_INTERVAL)
+
+
+@dataclass(frozen=True)
+class EliteCloudMetricDescription:
+    """
+    Static properties of a sensor for the accounting of the calls to the remote servers
+    """
+    key: str
+    name: str
+    endpoint: str | None        # None for all endpoints together
+    stat: str                   # calls, errors, latency, calls_per_site or bytes
+    unit: str | None
+    device_class: SensorDeviceClass | None
+    state_class: SensorStateClass
+    enabled: bool
+
+
+METRIC_DESCRIPTIONS: list[EliteCloudMetricDescription] = [
+    EliteCloudMetricDescription(key="cloud_calls_per_site", name="Cloud calls per site", endpoint=None, stat="calls_per_site", unit="calls/h", device_class=None, state_class=SensorStateClass.MEASUREMENT, enabled=True),
+    EliteCloudMetricDescription(key="cloud_bytes",          name="Cloud data received",  endpoint=None, stat="bytes",          unit=UnitOfInformation.BYTES, device_class=SensorDeviceClass.DATA_SIZE, state_class=SensorStateClass.TOTAL_INCREASING, enabled=True),
+] + [
+    # Per endpoint sensors are disabled by default; they would add to the recorder and long-term statistics on every install
+    description
+    for endpoint in METRICS_ENDPOINTS
+    for description in (
+        EliteCloudMetricDescription(key=f"cloud_{endpoint}_calls",   name=f"Cloud {endpoint} calls",   endpoint=endpoint, stat="calls",   unit="calls/h", device_class=None, state_class=SensorStateClass.MEASUREMENT, enabled=False),
+        EliteCloudMetricDescription(key=f"cloud_{endpoint}_latency", name=f"Cloud {endpoint} latency", endpoint=endpoint, stat="latency", unit=UnitOfTime.MILLISECONDS, device_class=SensorDeviceClass.DURATION, state_class=SensorStateClass.MEASUREMENT, enabled=False),
+        EliteCloudMetricDescription(key=f"cloud_{endpoint}_errors",  name=f"Cloud {endpoint} errors",  endpoint=endpoint, stat="errors",  unit=None, device_class=None, state_class=SensorStateClass.TOTAL_INCREASING, enabled=False),
+    )
+]
+
+
+async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry, async_add_entities: AddEntitiesCallback):
+    """
+    Setting up the adding and updating of sensor entities.
+    There are no sensor datapoints; the sensors hold the accounting of the calls of the account.
+    """
+    coordinator: EliteCloudCoordinator = EliteCloudCoordinatorFactory.create(hass, config_entry)
+
+    entities = [ EliteCloudMetricSensor(coordinator, description) for description in METRIC_DESCRIPTIONS ]
+
+    # Remember valid unique_ids so we can do an entity cleanup later
+    coordinator.set_valid_unique_ids(Platform.SENSOR, [ e.unique_id for e in entities ])
+
+    _LOGGER.info(f"Add {len(entities)} {Platform.SENSOR} entities for account '{coordinator.username}'")
+    async_add_entities(entities)
+
+
+class EliteCloudMetricSensor(SensorEntity):
+    """
+    Representation of the accounting of calls to the remote servers, part of the account device.
+    """
+
+    _attr_should_poll = True
+    _attr_has_entity_name = True
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+
+    # Totals and other percentiles change with every update; no need to write them to the recorder database
+    _unrecorded_attributes = frozenset({"calls_total", "errors_total"} | {f"p{pct}" for pct in METRICS_PERCENTILES})
+
+    def __init__(self, coordinator: EliteCloudCoordinator, description: EliteCloudMetricDescription) -> None:
+        """
+        Initialize the sensor.
+        """
+        self._coordinator = coordinator
+        self._metrics: EliteCloudRequestMetrics = coordinator.metrics
+        self._description = description
+
+        # The unique identifiers for this sensor within Home Assistant
+        self._attr_unique_id = EliteCloudEntity.create_id(PREFIX_ID, coordinator.username, description.key) # elitecontrol_<username>_<key>
+
+        self._attr_name = description.name
+        self._attr_native_unit_of_measurement = description.unit
+        self._attr_device_class = description.device_class
+        self._attr_state_class = description.state_class
+        self._attr_entity_registry_enabled_default = description.enabled
+
+        self._attr_device_info = DeviceInfo(
+            identifiers = {(DOMAIN, coordinator.account_id)},
+        )
+
+        self._update_value()
+
+
+    async def async_update(self) -> None:
+        """
+        Fetch the current accounting values
+        """
+        self._update_value()
+
+
+    def _update_value(self):
+        """
+        Set the sensor value and attributes from the accounting of the account
+        """
+        description = self._description
+        value: Any = None
+        attr: dict[str, Any] = {}
+
+        match description.stat:
+            case "calls_per_site":
+                value = self._metrics.calls_per_hour_per_site(len(self._coordinator.devices))
+            case "bytes":
+                value = self._metrics.bytes_received
+            case _:
+                metrics = self._metrics.get(description.endpoint)
+                match description.stat:
+                    case "calls":
+                        value = metrics.calls_in_window()
+                        attr = { "calls_total": metrics.calls, "errors_total": metrics.errors }
+                    case "errors":
+                        value = metrics.errors
+                    case "latency":
+                        latencies = { f"p{pct}": metrics.percentile(pct) for pct in METRICS_PERCENTILES }
+                        value = round(latencies["p90"] * 1000) if latencies.get("p90") is not None else None
+                        attr = { k: round(v * 1000) if v is not None else None for k,v in latencies.items() }
+
+        self._attr_native_value = value
+        self._attr_extra_state_attributes = attr
@@ -0,0 +1,182 @@
+"""store.py: Persistent storage for Elite Cloud integration."""
+
+import base64
+import hashlib
+import json
+import logging
+
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+from .const import (
+    DOMAIN,
+    STORE_KEY_DEVICES,
+    STORE_KEY_TOKENS,
+    STORE_VERSION_DEVICES,
+    STORE_WRITE_PERIOD_DEVICES,
+    STORE_VERSION_TOKENS,
+    STORE_WRITE_PERIOD_TOKENS,
+    STORE_TOKENS_KDF_ITERATIONS,
+)
+
+
+# Define logger
+_LOGGER = logging.getLogger(__name__)
+
+
+def _account_id(username: str) -> str:
+    """
+    Id for the store files of an account, without revealing the username in the filename
+    """
+    return hashlib.sha256(username.encode()).hexdigest()[:16]
+
+
+class EliteCloudTokenStore:
+    """
+    Keeps the login tokens of an account across Home Assistant restarts.
+
+    The tokens are encrypted with a key derived from the account credentials, 
+    so they can only be read back when the same username and password are used.
+    """
+
+    def __init__(self, hass: HomeAssistant, username: str, password: str):
+        self._hass = hass
+        self._username = username.lower()
+        self._password = password
+
+        # One store file per account
+        self._store = Store[dict[str,Any]](hass, STORE_VERSION_TOKENS, f"{DOMAIN}.{STORE_KEY_TOKENS}.{_account_id(self._username)}")
+
+        self._fernet = None
+
+
+    async def _async_get_fernet(self):
+        """
+        Lazy create the cipher; the key derivation is deliberately slow so runs in the executor
+        """
+        if self._fernet is None:
+            from cryptography.fernet import Fernet
+
+            key = await self._hass.async_add_executor_job(
+                hashlib.pbkdf2_hmac, "sha256", self._password.encode(), self._username.encode(), STORE_TOKENS_KDF_ITERATIONS
+            )
+            self._fernet = Fernet(base64.urlsafe_b64encode(key))
+
+        return self._fernet
+
+
+    async def async_load(self) -> dict[str, Any] | None:
+        """
+        Load and decrypt the stored tokens. Returns None if nothing usable was stored.
+        """
+        from cryptography.fernet import InvalidToken
+
+        try:
+            data = await self._store.async_load()
+            if not data or not data.get("tokens"):
+                return None
+
+            fernet = await self._async_get_fernet()
+            return json.loads(fernet.decrypt(data["tokens"].encode()))
+
+        except InvalidToken:
+            # Stored with other credentials
+            _LOGGER.debug(f"Ignore stored tokens for account '{self._username}'; credentials have changed")
+            return None
+        
+        except Exception as ex:
+            _LOGGER.debug(f"Could not load stored tokens for account '{self._username}': {ex}")
+            return None
+
+
+    async def async_save(self, tokens: dict[str, Any]):
+        """
+        Encrypt the tokens and schedule a write to the store
+        """
+        fernet = await self._async_get_fernet()
+        data = {
+            "tokens": fernet.encrypt(json.dumps(tokens).encode()).decode(),
+        }
+        self._store.async_delay_save(lambda: data, STORE_WRITE_PERIOD_TOKENS)
+
+
+    async def async_remove(self):
+        """
+        Remove the stored tokens
+        """
+        await self._store.async_remove()
+
+
+class EliteCloudDeviceStore:
+    """
+    Keeps the catalogue of devices and their resources of an account, keyed by site uuid.
+
+    The config entry only holds references to the sites. A change in the resources of one site 
+    then only updates that site in this store, instead of rewriting all config entries.
+    """
+
+    def __init__(self, hass: HomeAssistant, username: str):
+        self._username = username.lower()
+
+        # One store file per account
+        self._store = Store[dict[str,Any]](hass, STORE_VERSION_DEVICES, f"{DOMAIN}.{STORE_KEY_DEVICES}.{_account_id(self._username)}")
+
+        self._devices: dict[str, dict[str,Any]] | None = None
+
+
+    async def async_load(self) -> dict[str, dict[str,Any]]:
+        """
+        Load the stored devices, keyed by site uuid. Loaded only once.
+        """
+        if self._devices is None:
+            try:
+                data = await self._store.async_load()
+            except Exception as ex:
+                _LOGGER.debug(f"Could not load stored devices for account '{self._username}': {ex}")
+                data = None
+
+            self._devices = dict( (data or {}).get("devices", {}) )
+
+        return self._devices
+
+
+    async def async_save(self, devices: dict[str, dict[str,Any]], delay: bool = True) -> int:
+        """
+        Store the given devices, keyed by site uuid. Stored sites that are not given are removed.
+        Only the sites that changed are updated and only then a write is scheduled.
+        Returns the number of sites that were updated or removed.
+        """
+        stored = await self.async_load()
+
+        updated = [ uuid for uuid,device in devices.items() if stored.get(uuid) != device ]
+        removed = [ uuid for uuid in stored.keys() if uuid not in devices ]
+
+        for uuid in updated:
+            stored[uuid] = devices[uuid]
+        for uuid in removed:
+            stored.pop(uuid, None)
+
+        if updated or removed:
+            _LOGGER.debug(f"Store devices for account '{self._username}': {len(updated)} updated, {len(removed)} removed")
+            if delay:
+                self._store.async_delay_save(self._data_to_save, STORE_WRITE_PERIOD_DEVICES)
+            else:
+                await self._store.async_save(self._data_to_save())
+
+        return len(updated) + len(removed)
+
+
+    def _data_to_save(self) -> dict[str,Any]:
+        return {
+            "devices": self._devices,
+        }
+
+
+    async def async_remove(self):
+        """
+        Remove the stored devices
+        """
+        self._devices = None
+        await self._store.async_remove()
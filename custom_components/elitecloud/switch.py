@@ -1,43 +1,23 @@
-import asyncio
 import logging
-import math
 from typing import Any
 import voluptuous as vol
 
-from homeassistant import config_entries
-from homeassistant import exceptions
 from homeassistant.components.switch import SwitchDeviceClass
 from homeassistant.components.switch import SwitchEntity
 from homeassistant.components.switch import ENTITY_ID_FORMAT
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_NAME
-from homeassistant.const import CONF_UNIQUE_ID
-from homeassistant.const import EntityCategory
 from homeassistant.const import Platform
-from homeassistant.const import STATE_ON
-from homeassistant.const import STATE_OFF
 from homeassistant.core import HomeAssistant
 from homeassistant.core import callback
-from homeassistant.exceptions import HomeAssistantError
-from homeassistant.exceptions import IntegrationError
+from homeassistant.exceptions import ServiceValidationError
 from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers import entity_platform
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.entity_registry import async_get
-from homeassistant.helpers.event import async_track_time_interval
-from homeassistant.helpers.restore_state import RestoreEntity
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from datetime import datetime
-from datetime import timezone
-from datetime import timedelta
-
-from collections import defaultdict
-from collections import namedtuple
-
 from .const import (
-    SWITCH_VALUES_ON,
-    SWITCH_VALUES_OFF,
-    utcnow,
+    ATTR_BYPASS,
+    SERVICE_BYPASS_INPUTS,
 )
 from .coordinator import (
     EliteCloudCoordinator,
@@ -46,7 +26,7 @@ from .data import (
     EliteCloudDatapoint,
     EliteCloudDeviceConfig,
     EliteCloudDeviceResource,
-    EliteCloudDeviceStatus,
+    EliteCloudValueMap,
 )
 from .entity import (
     EliteCloudEntity,
@@ -65,6 +45,14 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry, asyn
     """
     await EliteCloudEntityHelper(hass, config_entry).async_setup_entry(Platform.SWITCH, EliteCloudSwitch, async_add_entities)
 
+    # Bypass many inputs at once; the entities share a command pipeline per site
+    platform = entity_platform.async_get_current_platform()
+    platform.async_register_entity_service(
+        SERVICE_BYPASS_INPUTS,
+        { vol.Optional(ATTR_BYPASS, default=True): cv.boolean },
+        "async_bypass",
+    )
+
 
 class EliteCloudSwitch(CoordinatorEntity, SwitchEntity, EliteCloudEntity):
     """
@@ -85,6 +73,9 @@ class EliteCloudSwitch(CoordinatorEntity, SwitchEntity, EliteCloudEntity):
         self._attr_entity_category = self.get_entity_category()
         self._attr_device_class = SwitchDeviceClass.SWITCH
 
+        # Compiled lookup of data values to Home Assistant states
+        self._value_map = EliteCloudValueMap.for_datapoint(datapoint.pf, datapoint.sec)
+
         # Create all value related attributes (but with unknown value).
         # After this constructor ends, base class EliteCloudEntity.async_added_to_hass() will 
         # set the value using the restored value from the last HA run. Or otherwise it will
@@ -99,28 +90,27 @@ class EliteCloudSwitch(CoordinatorEntity, SwitchEntity, EliteCloudEntity):
         """
 
         # find the correct device corresponding to this sensor
-        data:dict[str, EliteCloudDeviceStatus] = self._coordinator.data
-        status = data.get(self._device.uuid) if data is not None else None
-        value = status.get(self._datapoint.key) if status is not None else None
+        value, decoded = self._get_status_value()
 
         # Update value related attributes
-        if self._update_value(value):
+        if self._update_value(value, decoded=decoded):
             self.async_write_ha_state()
     
     
-    def _update_value(self, data_value: Any, force:bool=False) -> bool:
+    def _update_value(self, data_value: Any, force:bool=False, decoded: Any=None) -> bool:
         """
         Set entity value, unit and icon
         """
-        changed = super()._update_value(data_value, force)
+        changed = super()._update_value(data_value, force, decoded)
 
         # Convert from EliteCloud data value to Home Assistant attributes
-        if data_value in SWITCH_VALUES_ON:
-            is_on = True
-        elif data_value in SWITCH_VALUES_OFF:
-            is_on = False
-        else:
-            is_on = None
+        is_on = self._get_is_on(self._data_decoded)
+
+        # A pending toggle is done once its target state is reported
+        self._coordinator.confirm_target(self._device, self._datapoint, is_on)
+
+        # Keep showing the expected state while a command awaits confirmation
+        is_on = self._optimistic_apply(is_on)
 
         # Update Home Assistant attributes
         if force or self._attr_is_on != is_on:
@@ -130,27 +120,56 @@ class EliteCloudSwitch(CoordinatorEntity, SwitchEntity, EliteCloudEntity):
         return changed
     
 
+    def _get_is_on(self, data_value: Any) -> bool | None:
+        return self._value_map.get(data_value)
+
+
     async def async_turn_on(self, **kwargs) -> None:
         """
         Turn the entity on.
         """
-        if not self.is_on:
-            # Toggle from Off to On
-            await self.async_toggle()
+        await self._async_switch_to(True)
     
     
     async def async_turn_off(self, **kwargs) -> None:
         """
         Turn the entity off.
         """
-        if self.is_on:
-            # Toggle from On to Off
-            await self.async_toggle()
+        await self._async_switch_to(False)
 
 
     async def async_toggle(self, **kwargs) -> None:
         """
         Toggle the switch from On to Off or from Off to On
         """
-        await self._coordinator.async_toggle_datapoint(self._device, self._datapoint)
-    
\ No newline at end of file
+        await self._async_switch_to(not self.is_on)
+
+
+    async def _async_switch_to(self, target: bool) -> None:
+        """
+        The Elite Cloud servers only know toggle commands. 
+        Only send one when the switch is not already on its way to the target state.
+        """
+        actual = self._get_is_on(self._data_decoded)
+        if self._coordinator.get_target(self._device, self._datapoint, actual) == target:
+            return
+
+        await self._async_command_optimistic(
+            command = f"toggle_{self._datapoint.sec}",
+            state = target,
+            confirm = {target},
+            async_send = lambda: self._coordinator.async_toggle_to_target(self._device, self._datapoint, target, actual),
+        )
+
+
+    async def async_bypass(self, bypass: bool = True) -> None:
+        """
+        Bypass (snooze) or unbypass the input of this switch.
+        """
+        if self._datapoint.sec != "input":
+            raise ServiceValidationError(f"{self.entity_id} does not bypass an input")
+
+        if bypass:
+            await self.async_turn_on()
+        else:
+            await self.async_turn_off()